@@ -1,5 +1,8 @@
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
+
 from pretalx.celery_app import app
 from pretalx.event.models import Event
 
@@ -22,3 +25,83 @@ def export_schedule_html(*, event_id: int, make_zip=True):
     if make_zip:
         cmd.append('--zip')
     call_command(*cmd)
+
+
+@app.task()
+def prerender_schedule_exports(*, schedule_id: int):
+    """Fill the export cache for a freshly released schedule, so that the
+    first wave of requests after a release doesn't all render the same
+    documents."""
+    from django.utils.translation import override
+
+    from pretalx.common.exporter import render_export
+    from pretalx.common.signals import register_data_exporters
+    from pretalx.schedule.models import Schedule
+
+    schedule = Schedule.objects.filter(pk=schedule_id).select_related('event').first()
+    if not schedule:
+        LOGGER.error(f'In prerender_schedule_exports: Could not find Schedule ID {schedule_id}')
+        return
+    if not schedule.version:
+        LOGGER.error(f'In prerender_schedule_exports: Schedule ID {schedule_id} is not released.')
+        return
+
+    event = schedule.event
+    for _, exporter_class in register_data_exporters.send(event):
+        exporter = exporter_class(event)
+        if not exporter.public or not exporter.cacheable:
+            continue
+        exporter.schedule = schedule
+        exporter.is_orga = False
+        for locale in event.locales:
+            with override(locale):
+                try:
+                    render_export(exporter)
+                except Exception:
+                    LOGGER.exception(
+                        f'In prerender_schedule_exports: Could not render {exporter.identifier} for {event.slug}.'
+                    )
+
+
+def _notification_progress_key(event_id: int) -> str:
+    return f'pretalx_schedule_notifications_{event_id}'
+
+
+def get_notification_progress(event):
+    """Returns a dict with the ``version``, and the ``done`` and ``total``
+    number of notifications while speaker notifications for the event are
+    being generated, and None otherwise. The progress is only known if the
+    cache is shared with the worker that generates the notifications."""
+    if not settings.REAL_CACHE_USED:
+        return None
+    return cache.get(_notification_progress_key(event.pk))
+
+
+@app.task()
+def notify_schedule_speakers(*, schedule_id: int):
+    from pretalx.schedule.models import Schedule
+
+    schedule = Schedule.objects.filter(pk=schedule_id).select_related('event').first()
+    if not schedule:
+        LOGGER.error(f'In notify_schedule_speakers: Could not find Schedule ID {schedule_id}')
+        return
+    if not schedule.version:
+        LOGGER.error(f'In notify_schedule_speakers: Schedule ID {schedule_id} is not released.')
+        return
+
+    key = _notification_progress_key(schedule.event_id)
+    total = len(schedule.speakers_concerned)
+
+    def progress(done):
+        cache.set(
+            key, {'version': schedule.version, 'done': done, 'total': total}, 3600
+        )
+
+    if not settings.REAL_CACHE_USED:
+        schedule.notify_speakers()
+        return
+    progress(0)
+    try:
+        schedule.notify_speakers(progress=progress)
+    finally:
+        cache.delete(key)
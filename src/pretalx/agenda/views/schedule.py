@@ -1,17 +1,20 @@
-import hashlib
 from datetime import timedelta
 from urllib.parse import unquote
 
 import pytz
 from django.http import (
-    Http404, HttpResponse, HttpResponseNotModified, HttpResponsePermanentRedirect,
+    Http404, HttpResponse, HttpResponseNotModified,
+    HttpResponsePermanentRedirect, StreamingHttpResponse,
 )
 from django.urls import resolve, reverse
 from django.utils.functional import cached_property
 from django.utils.timezone import now
 from django.views.generic import TemplateView
 
-from pretalx.common.mixins.views import EventPermissionRequired
+from pretalx.common.exporter import (
+    get_cached_export_etag, is_export_cached, render_export, stream_export,
+)
+from pretalx.common.mixins.views import AnonymousCacheMixin, EventPermissionRequired
 from pretalx.common.signals import register_data_exporters
 
 
@@ -92,13 +95,21 @@ class ExporterView(ScheduleDataView):
         try:
             exporter.schedule = self.get_object()
             exporter.is_orga = getattr(self.request, 'is_orga', False)
-            file_name, file_type, data = exporter.render()
-            etag = hashlib.sha1(str(data).encode()).hexdigest()
-            if 'HTTP_IF_NONE_MATCH' in request.META:
-                if request.META['HTTP_IF_NONE_MATCH'] == etag:
+            if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+            if if_none_match and if_none_match == get_cached_export_etag(exporter):
+                return HttpResponseNotModified()
+            if not is_export_cached(exporter) and getattr(
+                exporter, 'should_stream', False
+            ):
+                file_name, file_type, data, etag = stream_export(exporter)
+                resp = StreamingHttpResponse(data, content_type=file_type)
+            else:
+                file_name, file_type, data, etag = render_export(exporter)
+                if if_none_match and if_none_match == etag:
                     return HttpResponseNotModified()
-            resp = HttpResponse(data, content_type=file_type)
-            resp['ETag'] = etag
+                resp = HttpResponse(data, content_type=file_type)
+            if etag:
+                resp['ETag'] = etag
             if file_type not in ['application/json', 'text/xml']:
                 resp['Content-Disposition'] = f'attachment; filename="{file_name}"'
             return resp
@@ -107,7 +118,7 @@ class ExporterView(ScheduleDataView):
             raise Http404()
 
 
-class ScheduleView(ScheduleDataView):
+class ScheduleView(AnonymousCacheMixin, ScheduleDataView):
     template_name = 'agenda/schedule.html'
     permission_required = 'agenda.view_schedule'
 
@@ -1,11 +1,11 @@
 from django.http import HttpResponseRedirect
 from django.views.generic import TemplateView
 
-from pretalx.common.mixins.views import EventPermissionRequired
+from pretalx.common.mixins.views import AnonymousCacheMixin, EventPermissionRequired
 from pretalx.submission.models import SubmissionStates
 
 
-class SneakpeekView(EventPermissionRequired, TemplateView):
+class SneakpeekView(AnonymousCacheMixin, EventPermissionRequired, TemplateView):
     template_name = 'agenda/sneakpeek.html'
     permission_required = 'agenda.view_sneak_peek'
 
@@ -14,7 +14,7 @@ from django.views.generic import DetailView, FormView, ListView
 from pretalx.agenda.signals import register_recording_provider
 from pretalx.cfp.views.event import EventPageMixin
 from pretalx.common.mixins.views import (
-    EventPermissionRequired, Filterable, PermissionRequired,
+    AnonymousCacheMixin, EventPermissionRequired, Filterable, PermissionRequired,
 )
 from pretalx.common.phrases import phrases
 from pretalx.person.models.profile import SpeakerProfile
@@ -23,7 +23,9 @@ from pretalx.submission.forms import FeedbackForm
 from pretalx.submission.models import Feedback, Submission
 
 
-class TalkList(EventPermissionRequired, Filterable, ListView):
+class TalkList(
+    AnonymousCacheMixin, EventPermissionRequired, Filterable, ListView
+):
     context_object_name = 'talks'
     model = Submission
     template_name = 'agenda/talks.html'
@@ -39,7 +41,9 @@ class TalkList(EventPermissionRequired, Filterable, ListView):
         return context
 
 
-class SpeakerList(EventPermissionRequired, Filterable, ListView):
+class SpeakerList(
+    AnonymousCacheMixin, EventPermissionRequired, Filterable, ListView
+):
     context_object_name = 'speakers'
     template_name = 'agenda/speakers.html'
     permission_required = 'agenda.view_schedule'
@@ -57,7 +61,7 @@ class SpeakerList(EventPermissionRequired, Filterable, ListView):
         return context
 
 
-class TalkView(PermissionRequired, DetailView):
+class TalkView(AnonymousCacheMixin, PermissionRequired, DetailView):
     context_object_name = 'talk'
     model = Submission
     slug_field = 'code'
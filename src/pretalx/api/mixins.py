@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+import pytz
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import is_naive, make_aware
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import ListSerializer
+
+
+def get_requested_fields(request):
+    """Returns the set of field names requested with ``?fields=code,title``,
+    or None if the request did not limit the fields."""
+    if request is None or not request.query_params.get('fields'):
+        return None
+    return {
+        field.strip()
+        for field in request.query_params['fields'].split(',')
+        if field.strip()
+    }
+
+
+class FieldSelectionMixin:
+    """Serializes only the fields requested with the ``fields`` parameter.
+    Nested serializers always return all of their fields."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        root = self.root
+        if self is root or (isinstance(root, ListSerializer) and self.parent is root):
+            requested = get_requested_fields(self.context.get('request'))
+            if requested is not None:
+                fields = OrderedDict(
+                    (name, field) for name, field in fields.items() if name in requested
+                )
+        return fields
+
+
+class ChangedSinceMixin:
+    """Lets API clients synchronise incrementally: with
+    ``?changed_since=<ISO 8601 timestamp>``, list views only return objects
+    that changed since then, and add a ``deleted`` list with the lookup
+    values of the objects the client should remove.
+
+    Views implement ``filter_changed_since`` and may implement
+    ``get_deleted_since``."""
+
+    changed_since_param = 'changed_since'
+
+    def get_changed_since(self):
+        value = self.request.query_params.get(self.changed_since_param)
+        if not value:
+            return None
+        # An unencoded + in the time zone offset arrives as a space
+        changed_since = parse_datetime(value.strip().replace(' ', '+'))
+        if changed_since is None:
+            raise ValidationError(
+                {self.changed_since_param: ['Please submit a valid ISO 8601 timestamp.']}
+            )
+        if is_naive(changed_since):
+            changed_since = make_aware(changed_since, pytz.utc)
+        return changed_since
+
+    def filter_changed_since(self, queryset, changed_since):
+        raise NotImplementedError()
+
+    def get_deleted_since(self, changed_since):
+        return []
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        changed_since = self.get_changed_since()
+        if changed_since is not None:
+            queryset = self.filter_changed_since(queryset, changed_since)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        changed_since = self.get_changed_since()
+        if changed_since is not None:
+            response.data['deleted'] = sorted(self.get_deleted_since(changed_since))
+        return response
@@ -0,0 +1,33 @@
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+
+
+class ApiCursorPagination(CursorPagination):
+    ordering = 'pk'
+    page_size_query_param = 'limit'
+
+
+class ApiPagination(LimitOffsetPagination):
+    """Paginates with ``limit`` and ``offset`` by default. As soon as the
+    ``cursor`` parameter is given (even without a value, for the first
+    page), it switches to keyset pagination ordered by primary key. Deep
+    pages are then as fast as the first one, and the response omits the
+    ``count``, which would need another query."""
+
+    cursor_query_param = ApiCursorPagination.cursor_query_param
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            self.cursor_pagination = ApiCursorPagination()
+            return self.cursor_pagination.paginate_queryset(queryset, request, view)
+        self.cursor_pagination = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_pagination:
+            return self.cursor_pagination.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_pagination:
+            return self.cursor_pagination.to_html()
+        return super().to_html()
@@ -28,3 +28,10 @@ class AnswerSerializer(ModelSerializer):
     class Meta:
         model = Answer
         fields = ('id', 'question', 'answer', 'answer_file', 'submission', 'person', 'options')
+
+
+def get_answer_queryset():
+    """Answers with everything the AnswerSerializer needs."""
+    return Answer.objects.select_related('question', 'person').prefetch_related(
+        'question__options', 'options'
+    )
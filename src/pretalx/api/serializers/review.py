@@ -2,17 +2,19 @@ from rest_framework.serializers import (
     ModelSerializer, SerializerMethodField, SlugRelatedField,
 )
 
+from pretalx.api.mixins import FieldSelectionMixin
 from pretalx.api.serializers.question import AnswerSerializer
-from pretalx.submission.models import Answer, Review
+from pretalx.submission.models import Review
 
 
-class ReviewSerializer(ModelSerializer):
+class ReviewSerializer(FieldSelectionMixin, ModelSerializer):
     submission = SlugRelatedField(slug_field='code', read_only=True)
     user = SlugRelatedField(slug_field='name', read_only=True)
     answers = SerializerMethodField()
 
-    def get_answers(self, obj):
-        return AnswerSerializer(Answer.objects.filter(review=obj), many=True).data
+    @staticmethod
+    def get_answers(obj):
+        return AnswerSerializer(obj.answers.all(), many=True).data
 
     class Meta:
         model = Review
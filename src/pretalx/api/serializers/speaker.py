@@ -1,10 +1,22 @@
+from django.db.models import Prefetch
 from rest_framework.serializers import (
     CharField, ImageField, ModelSerializer, SerializerMethodField,
 )
 
+from pretalx.api.mixins import FieldSelectionMixin
 from pretalx.api.serializers.question import AnswerSerializer
 from pretalx.person.models import SpeakerProfile, User
-from pretalx.submission.models import Answer
+
+
+def get_submitter_queryset(event):
+    """Users with everything the SubmitterSerializer needs."""
+    return User.objects.prefetch_related(
+        Prefetch(
+            'profiles',
+            queryset=SpeakerProfile.objects.filter(event=event),
+            to_attr='event_profiles',
+        )
+    )
 
 
 class SubmitterSerializer(ModelSerializer):
@@ -12,11 +24,13 @@ class SubmitterSerializer(ModelSerializer):
 
     def get_biography(self, obj):
         if self.context.get('request') and self.context['request'].event:
-            return getattr(
-                obj.profiles.filter(event=self.context['request'].event).first(),
-                'biography',
-                '',
-            )
+            if hasattr(obj, 'event_profiles'):
+                profile = obj.event_profiles[0] if obj.event_profiles else None
+            else:
+                profile = obj.profiles.filter(
+                    event=self.context['request'].event
+                ).first()
+            return getattr(profile, 'biography', '')
         return ''
 
     class Meta:
@@ -24,7 +38,7 @@ class SubmitterSerializer(ModelSerializer):
         fields = ('code', 'name', 'biography', 'avatar')
 
 
-class SpeakerSerializer(ModelSerializer):
+class SpeakerSerializer(FieldSelectionMixin, ModelSerializer):
     code = CharField(source='user.code')
     name = CharField(source='user.name')
     avatar = ImageField(source='user.avatar')
@@ -32,8 +46,12 @@ class SpeakerSerializer(ModelSerializer):
 
     @staticmethod
     def get_submissions(obj):
+        if hasattr(obj.user, 'event_submissions'):
+            return [submission.code for submission in obj.user.event_submissions]
         talks = (
-            obj.event.current_schedule.talks.all() if obj.event.current_schedule else []
+            obj.event.current_schedule.talks.filter(is_visible=True)
+            if obj.event.current_schedule
+            else []
         )
         return obj.user.submissions.filter(
             event=obj.event, slots__in=talks
@@ -46,12 +64,27 @@ class SpeakerSerializer(ModelSerializer):
 
 class SpeakerOrgaSerializer(SpeakerSerializer):
     email = CharField(source='user.email')
-    answers = AnswerSerializer(Answer.objects.all(), many=True, read_only=True)
+    answers = SerializerMethodField()
 
     def get_submissions(self, obj):
+        if hasattr(obj.user, 'event_submissions'):
+            return [submission.code for submission in obj.user.event_submissions]
         return obj.user.submissions.filter(event=obj.event).values_list(
             'code', flat=True
         )
 
+    @staticmethod
+    def get_answers(obj):
+        if hasattr(obj.user, 'event_answers'):
+            answers = {answer.pk: answer for answer in obj.user.event_answers}
+            for submission in obj.user.event_submissions:
+                answers.update(
+                    {answer.pk: answer for answer in submission.answers.all()}
+                )
+            answers = [answers[pk] for pk in sorted(answers)]
+        else:
+            answers = obj.answers
+        return AnswerSerializer(answers, many=True).data
+
     class Meta(SpeakerSerializer.Meta):
         fields = SpeakerSerializer.Meta.fields + ('answers', 'email')
@@ -1,12 +1,15 @@
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
 from i18nfield.rest_framework import I18nAwareModelSerializer
 from rest_framework.serializers import (
     ModelSerializer, SerializerMethodField, SlugRelatedField,
 )
 
-from pretalx.api.serializers.question import AnswerSerializer
-from pretalx.api.serializers.speaker import SubmitterSerializer
+from pretalx.api.mixins import FieldSelectionMixin
+from pretalx.api.serializers.question import AnswerSerializer, get_answer_queryset
+from pretalx.api.serializers.speaker import SubmitterSerializer, get_submitter_queryset
 from pretalx.schedule.models import Schedule, TalkSlot
-from pretalx.submission.models import Answer, Submission, SubmissionStates
+from pretalx.submission.models import Submission, SubmissionStates
 
 
 class SlotSerializer(I18nAwareModelSerializer):
@@ -17,15 +20,15 @@ class SlotSerializer(I18nAwareModelSerializer):
         fields = ('room', 'start', 'end')
 
 
-class SubmissionSerializer(I18nAwareModelSerializer):
+class SubmissionSerializer(FieldSelectionMixin, I18nAwareModelSerializer):
     speakers = SubmitterSerializer(many=True)
     submission_type = SlugRelatedField(slug_field='name', read_only=True)
     track = SlugRelatedField(slug_field='name', read_only=True)
-    slot = SlotSerializer(TalkSlot.objects.filter(is_visible=True), read_only=True)
+    slot = SerializerMethodField()
     duration = SerializerMethodField()
     answers = SerializerMethodField()
 
-    @property
+    @cached_property
     def is_orga(self):
         request = self.context.get('request')
         if request:
@@ -36,11 +39,17 @@ class SubmissionSerializer(I18nAwareModelSerializer):
     def get_duration(obj):
         return obj.export_duration
 
+    @staticmethod
+    def get_slot(obj):
+        if hasattr(obj, 'current_slots'):
+            slot = obj.current_slots[0] if obj.current_slots else None
+        else:
+            slot = obj.slot
+        return SlotSerializer(slot).data if slot else None
+
     def get_answers(self, obj):
         if self.is_orga:
-            return AnswerSerializer(
-                Answer.objects.filter(submission=obj), many=True
-            ).data
+            return AnswerSerializer(obj.answers.all(), many=True).data
         return []
 
     class Meta:
@@ -77,9 +86,37 @@ class ScheduleListSerializer(ModelSerializer):
 
 
 class ScheduleSerializer(ModelSerializer):
-    slots = SubmissionSerializer(
-        Submission.objects.filter(state=SubmissionStates.CONFIRMED), many=True
-    )
+    slots = SerializerMethodField()
+
+    def get_slots(self, obj):
+        """Serializes the scheduled submissions of this schedule version, with
+        their slot in this version, from one joined query over the talk slots
+        (plus the prefetches of speakers and answers)."""
+        serializer = SubmissionSerializer(many=True)
+        serializer.bind('slots', self)
+        prefetches = [
+            Prefetch('submission__speakers', queryset=get_submitter_queryset(obj.event))
+        ]
+        if serializer.child.is_orga:
+            prefetches.append(
+                Prefetch('submission__answers', queryset=get_answer_queryset())
+            )
+        talks = (
+            obj.scheduled_talks.exclude(submission__state=SubmissionStates.DELETED)
+            .select_related(
+                'room',
+                'submission__event',
+                'submission__submission_type',
+                'submission__track',
+            )
+            .prefetch_related(*prefetches)
+            .order_by('start', 'room__position', 'room_id')
+        )
+        submissions = []
+        for talk in talks:
+            talk.submission.current_slots = [talk]
+            submissions.append(talk.submission)
+        return serializer.to_representation(submissions)
 
     class Meta:
         model = Schedule
@@ -1,3 +1,4 @@
+from django.db.models import Q
 from rest_framework import viewsets
 
 from pretalx.api.serializers.event import EventSerializer
@@ -12,7 +13,17 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = None
 
     def get_queryset(self):
-        return [
-            e for e in Event.objects.all()
-            if self.request.user.has_perm('cfp.view_event', e)
+        """Public events, and all events the user can see as an organiser or
+        reviewer (which is what the cfp.view_event permission checks)."""
+        if self.request.user.is_anonymous:
+            return Event.objects.filter(is_public=True)
+        if self.request.user.is_administrator:
+            return Event.objects.all()
+        visible_events = [
+            event_id
+            for event_id, permissions in self.request.user.get_permission_map()[
+                'events'
+            ].items()
+            if permissions & {'can_change_submissions', 'is_reviewer'}
         ]
+        return Event.objects.filter(Q(is_public=True) | Q(pk__in=visible_events))
@@ -1,10 +1,13 @@
+from django.db.models import Prefetch
 from rest_framework import viewsets
 
+from pretalx.api.mixins import ChangedSinceMixin, get_requested_fields
+from pretalx.api.serializers.question import get_answer_queryset
 from pretalx.api.serializers.review import ReviewSerializer
 from pretalx.submission.models import Review
 
 
-class ReviewViewSet(viewsets.ReadOnlyModelViewSet):
+class ReviewViewSet(ChangedSinceMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = ReviewSerializer
     queryset = Review.objects.none()
     filterset_fields = ('submission__code',)
@@ -14,6 +17,17 @@ class ReviewViewSet(viewsets.ReadOnlyModelViewSet):
             'submission.view_reviews', self.request.event
         ):
             return Review.objects.none()
-        return Review.objects.filter(submission__event=self.request.event).exclude(
-            submission__speakers__in=[self.request.user]
+        queryset = (
+            Review.objects.filter(submission__event=self.request.event)
+            .exclude(submission__speakers__in=[self.request.user])
+            .select_related('submission', 'user')
         )
+        fields = get_requested_fields(self.request)
+        if fields is None or 'answers' in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch('answers', queryset=get_answer_queryset())
+            )
+        return queryset
+
+    def filter_changed_since(self, queryset, changed_since):
+        return queryset.filter(updated__gte=changed_since)
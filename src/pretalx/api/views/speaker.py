@@ -1,10 +1,15 @@
+from django.db.models import Prefetch, Q
 from rest_framework import viewsets
 
+from pretalx.api.mixins import ChangedSinceMixin, get_requested_fields
+from pretalx.api.serializers.question import get_answer_queryset
 from pretalx.api.serializers.speaker import SpeakerOrgaSerializer, SpeakerSerializer
-from pretalx.person.models import SpeakerProfile
+from pretalx.api.views.submission import get_schedule_at
+from pretalx.person.models import SpeakerProfile, User
+from pretalx.submission.models import Submission
 
 
-class SpeakerViewSet(viewsets.ReadOnlyModelViewSet):
+class SpeakerViewSet(ChangedSinceMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = SpeakerSerializer
     queryset = SpeakerProfile.objects.none()
     lookup_field = 'user__code__iexact'
@@ -24,9 +29,75 @@ class SpeakerViewSet(viewsets.ReadOnlyModelViewSet):
             and self.request.event.settings.show_schedule
         ):
             return SpeakerProfile.objects.filter(
-                user__submissions__slots__in=self.request.event.current_schedule.talks.all()
+                user__submissions__slots__in=self.request.event.current_schedule.talks.filter(
+                    is_visible=True
+                )
             ).distinct()
         return SpeakerProfile.objects.none()
 
     def get_queryset(self):
-        return self.get_base_queryset() or self.queryset
+        return self.prefetch_queryset(self.get_base_queryset())
+
+    def prefetch_queryset(self, queryset):
+        """Loads the submissions (and answers, for organisers) the speaker
+        serializers need in a constant number of queries. Skips the related
+        objects of fields that were not requested."""
+        event = self.request.event
+        fields = get_requested_fields(self.request)
+        if fields is not None and not {'submissions', 'answers'} & fields:
+            return queryset.select_related('user', 'event')
+        if self.get_serializer_class() is SpeakerOrgaSerializer:
+            submissions = event.submissions.prefetch_related(
+                Prefetch('answers', queryset=get_answer_queryset())
+            )
+            prefetches = [
+                Prefetch(
+                    'user__answers',
+                    queryset=get_answer_queryset().filter(question__event=event),
+                    to_attr='event_answers',
+                )
+            ]
+        else:
+            submissions = (
+                event.submissions.filter(
+                    slots__schedule=event.current_schedule, slots__is_visible=True
+                )
+                if event.current_schedule
+                else Submission.objects.none()
+            )
+            prefetches = []
+        prefetches.append(
+            Prefetch('user__submissions', queryset=submissions, to_attr='event_submissions')
+        )
+        return queryset.select_related('user', 'event').prefetch_related(*prefetches)
+
+    def filter_changed_since(self, queryset, changed_since):
+        changed_submissions = Submission.all_objects.filter(
+            event=self.request.event
+        ).filter(
+            Q(updated__gte=changed_since)
+            | Q(slots__schedule__published__gte=changed_since)
+        )
+        return queryset.filter(
+            Q(updated__gte=changed_since)
+            | Q(user__in=changed_submissions.values('speakers'))
+        )
+
+    def get_deleted_since(self, changed_since):
+        """Organisers see all speaker profiles, which are never removed.
+        Everybody else gets the codes of all speakers who were public at
+        changed_since, but are not part of the results anymore."""
+        if self.request.user.has_perm('orga.view_submissions', self.request.event):
+            return []
+        schedule = get_schedule_at(self.request.event, changed_since)
+        if not schedule:
+            return []
+        return (
+            User.objects.filter(
+                submissions__slots__schedule=schedule,
+                submissions__slots__is_visible=True,
+            )
+            .exclude(pk__in=self.get_base_queryset().values('user'))
+            .values_list('code', flat=True)
+            .distinct()
+        )
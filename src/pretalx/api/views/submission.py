@@ -1,13 +1,31 @@
+from django.core.cache import cache
+from django.db.models import Prefetch, Q
 from rest_framework import viewsets
+from rest_framework.response import Response
 
+from pretalx.api.mixins import ChangedSinceMixin, get_requested_fields
+from pretalx.api.serializers.question import get_answer_queryset
+from pretalx.api.serializers.speaker import get_submitter_queryset
 from pretalx.api.serializers.submission import (
     ScheduleListSerializer, ScheduleSerializer, SubmissionSerializer,
 )
-from pretalx.schedule.models import Schedule
+from pretalx.common.cache import get_event_cache_version
+from pretalx.person.models import SpeakerProfile
+from pretalx.schedule.models import Schedule, TalkSlot
 from pretalx.submission.models import Submission
 
+SCHEDULE_CACHE_TIMEOUT = 24 * 60 * 60
 
-class SubmissionViewSet(viewsets.ReadOnlyModelViewSet):
+
+def get_schedule_at(event, moment):
+    """Returns the schedule version that was the current one at the given
+    moment, or None."""
+    return (
+        event.schedules.filter(published__lte=moment).order_by('-published').first()
+    )
+
+
+class SubmissionViewSet(ChangedSinceMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = SubmissionSerializer
     queryset = Submission.objects.none()
     lookup_field = 'code__iexact'
@@ -27,11 +45,74 @@ class SubmissionViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
     def get_queryset(self):
-        return self.get_base_queryset() or self.queryset
+        return self.prefetch_queryset(self.get_base_queryset())
+
+    def prefetch_queryset(self, queryset):
+        """Loads all related objects the SubmissionSerializer needs in a
+        constant number of queries, which it then reads from the prefetch
+        caches. Skips the related objects of fields that were not
+        requested."""
+        event = self.request.event
+        fields = get_requested_fields(self.request)
+        prefetches = []
+        if fields is None or 'speakers' in fields:
+            prefetches.append(
+                Prefetch('speakers', queryset=get_submitter_queryset(event))
+            )
+        if fields is None or 'slot' in fields:
+            prefetches.append(
+                Prefetch(
+                    'slots',
+                    queryset=TalkSlot.objects.filter(
+                        schedule=event.current_schedule
+                    ).select_related('room'),
+                    to_attr='current_slots',
+                )
+            )
+        if (fields is None or 'answers' in fields) and self.request.user.has_perm(
+            'orga.view_submissions', event
+        ):
+            prefetches.append(Prefetch('answers', queryset=get_answer_queryset()))
+        return queryset.select_related(
+            'event', 'submission_type', 'track'
+        ).prefetch_related(*prefetches)
+
+    def filter_changed_since(self, queryset, changed_since):
+        changed_profiles = SpeakerProfile.objects.filter(
+            event=self.request.event, updated__gte=changed_since
+        )
+        return queryset.filter(
+            Q(updated__gte=changed_since)
+            | Q(slots__schedule__published__gte=changed_since)
+            | Q(speakers__in=changed_profiles.values('user'))
+        ).distinct()
+
+    def get_deleted_since(self, changed_since):
+        event = self.request.event
+        if self.request.user.has_perm('orga.view_submissions', event):
+            return Submission.deleted_objects.filter(
+                event=event, updated__gte=changed_since
+            ).values_list('code', flat=True)
+        return self.get_unpublished_since(changed_since)
+
+    def get_unpublished_since(self, changed_since):
+        """Returns the codes of all talks that were public at changed_since,
+        but are not part of the results anymore."""
+        schedule = get_schedule_at(self.request.event, changed_since)
+        if not schedule:
+            return []
+        return (
+            Submission.all_objects.filter(
+                slots__schedule=schedule, slots__is_visible=True
+            )
+            .exclude(pk__in=self.get_base_queryset().values('pk'))
+            .values_list('code', flat=True)
+            .distinct()
+        )
 
 
 class TalkViewSet(SubmissionViewSet):
-    def get_queryset(self):
+    def get_base_queryset(self):
         if (
             not self.request.user.has_perm('agenda.view_schedule', self.request.event)
             or not self.request.event.current_schedule
@@ -41,6 +122,9 @@ class TalkViewSet(SubmissionViewSet):
             slots__in=self.request.event.current_schedule.talks.filter(is_visible=True)
         )
 
+    def get_deleted_since(self, changed_since):
+        return self.get_unpublished_since(changed_since)
+
 
 class ScheduleViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ScheduleSerializer
@@ -54,6 +138,24 @@ class ScheduleViewSet(viewsets.ReadOnlyModelViewSet):
             return ScheduleSerializer
         raise Exception('Methods other than GET are not supported on this ressource.')
 
+    def retrieve(self, request, *args, **kwargs):
+        """Released schedule versions don't change, so their serialized form
+        is cached until the event's content changes."""
+        schedule = self.get_object()
+        if not schedule.version:
+            return Response(self.get_serializer(schedule).data)
+        key = 'pretalx_api_schedule_{event}_{generation}_{schedule}_{orga}'.format(
+            event=request.event.pk,
+            generation=get_event_cache_version(request.event.pk),
+            schedule=schedule.pk,
+            orga=int(request.user.has_perm('orga.view_submissions', request.event)),
+        )
+        data = cache.get(key)
+        if data is None:
+            data = self.get_serializer(schedule).data
+            cache.set(key, data, SCHEDULE_CACHE_TIMEOUT)
+        return Response(data)
+
     def get_object(self):
         try:
             return super().get_object()
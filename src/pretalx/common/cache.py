@@ -0,0 +1,211 @@
+import time
+from urllib.parse import urlparse
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.http.request import split_domain_port
+
+from pretalx.event.models import Event, Team
+from pretalx.event.models.event import Event_SettingsStore
+from pretalx.person.models import SpeakerProfile, User
+from pretalx.schedule.models import Room, Schedule
+from pretalx.submission.models import Answer, Question, Submission
+
+
+def _event_cache_version_key(event_id: int) -> str:
+    return f'pretalx_event_cache_version_{event_id}'
+
+
+def get_event_cache_version(event_id: int) -> str:
+    """Returns the current cache generation of an event.
+
+    Include this value in the keys of all cached data that is derived from
+    an event – it changes whenever the event, its settings or its content
+    changes, which renders all previously cached entries unreachable."""
+    key = _event_cache_version_key(event_id)
+    version = cache.get(key)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(key, version, None):
+            version = cache.get(key) or version
+    return version
+
+
+def invalidate_event_cache(event_id: int):
+    cache.set(_event_cache_version_key(event_id), uuid4().hex, None)
+
+
+EVENT_LOOKUP_TIMEOUT = 60
+_events_by_slug = {}
+
+
+def get_event_by_slug(slug: str):
+    """Returns the event with this slug (in any capitalisation), or None.
+
+    The event's fields are kept in this process for up to
+    EVENT_LOOKUP_TIMEOUT seconds, and only as long as the event's cache
+    generation stays the same, so repeated lookups usually need no queries.
+    Every call returns a new instance, as requests change their event."""
+    key = slug.lower()
+    entry = _events_by_slug.get(key)
+    if entry:
+        expires, version, field_names, values = entry
+        if expires > time.monotonic() and version == get_event_cache_version(
+            values[field_names.index('id')]
+        ):
+            return Event.from_db('default', field_names, values)
+    event = Event.objects.filter(slug__iexact=slug).first()
+    if not event:
+        return None
+    field_names = [field.attname for field in Event._meta.concrete_fields]
+    _events_by_slug[key] = (
+        time.monotonic() + EVENT_LOOKUP_TIMEOUT,
+        get_event_cache_version(event.pk),
+        field_names,
+        tuple(getattr(event, name) for name in field_names),
+    )
+    return event
+
+
+CUSTOM_DOMAIN_INDEX_KEY = 'pretalx_custom_domain_index'
+_custom_domain_index = None
+
+
+def get_host_key(domain: str, port: str) -> str:
+    return f'{domain}:{port}' if port else domain
+
+
+def _build_custom_domain_index() -> dict:
+    domains = {}
+    events = {}
+    custom_domains = (
+        Event_SettingsStore.objects.filter(key='custom_domain')
+        .exclude(value='')
+        .values_list('object__slug', 'value')
+    )
+    for slug, custom_domain in custom_domains:
+        domains[get_host_key(*split_domain_port(urlparse(custom_domain).netloc))] = slug
+        events[slug.lower()] = custom_domain
+    return {'domains': domains, 'events': events}
+
+
+def get_custom_domain_index() -> dict:
+    """Returns the custom domains of all events as a dict with the keys
+    ``domains``, mapping hosts (see ``get_host_key``) to event slugs, and
+    ``events``, mapping lower case event slugs to their custom domain.
+
+    The index is built with one query, and kept in the cache until a custom
+    domain changes. Each process keeps its copy for up to
+    EVENT_LOOKUP_TIMEOUT seconds."""
+    global _custom_domain_index
+    if _custom_domain_index and _custom_domain_index[0] > time.monotonic():
+        return _custom_domain_index[1]
+    index = cache.get(CUSTOM_DOMAIN_INDEX_KEY)
+    if index is None:
+        index = _build_custom_domain_index()
+        cache.set(CUSTOM_DOMAIN_INDEX_KEY, index, None)
+    _custom_domain_index = (time.monotonic() + EVENT_LOOKUP_TIMEOUT, index)
+    return index
+
+
+def invalidate_custom_domain_index():
+    global _custom_domain_index
+    _custom_domain_index = None
+    cache.delete(CUSTOM_DOMAIN_INDEX_KEY)
+
+
+PERMISSION_CACHE_VERSION_KEY = 'pretalx_permission_cache_version'
+_local_permission_generation = 0
+
+
+def get_permission_cache_version() -> str:
+    """Returns the current cache generation of all team permissions.
+
+    Team changes are rare, and a change can affect many users, so there is
+    only one generation for all of them."""
+    version = cache.get(PERMISSION_CACHE_VERSION_KEY)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(PERMISSION_CACHE_VERSION_KEY, version, None):
+            version = cache.get(PERMISSION_CACHE_VERSION_KEY) or version
+    return version
+
+
+def get_local_permission_generation() -> int:
+    """Returns a counter of the team changes in this process, which lets
+    objects that live for one request tell if their copy of a permission map
+    is still valid without asking the cache."""
+    return _local_permission_generation
+
+
+def invalidate_permission_cache():
+    global _local_permission_generation
+    _local_permission_generation += 1
+    cache.set(PERMISSION_CACHE_VERSION_KEY, uuid4().hex, None)
+
+
+@receiver(post_save, sender=Event, dispatch_uid='cache_invalidate_event')
+@receiver(post_delete, sender=Event, dispatch_uid='cache_invalidate_event_delete')
+def invalidate_on_event_change(sender, instance, **kwargs):
+    invalidate_event_cache(instance.pk)
+    if kwargs.get('created', True):  # Only new and deleted events
+        invalidate_permission_cache()
+        invalidate_custom_domain_index()
+
+
+@receiver(post_save, sender=Team, dispatch_uid='cache_invalidate_team')
+@receiver(post_delete, sender=Team, dispatch_uid='cache_invalidate_team_delete')
+@receiver(m2m_changed, sender=Team.members.through, dispatch_uid='cache_invalidate_team_members')
+@receiver(
+    m2m_changed, sender=Team.limit_events.through, dispatch_uid='cache_invalidate_team_events'
+)
+def invalidate_on_team_change(sender, **kwargs):
+    if kwargs.get('action', 'post_').startswith('post_'):
+        invalidate_permission_cache()
+
+
+@receiver(post_save, sender=Event_SettingsStore, dispatch_uid='cache_invalidate_settings')
+@receiver(
+    post_delete, sender=Event_SettingsStore, dispatch_uid='cache_invalidate_settings_delete'
+)
+def invalidate_on_settings_change(sender, instance, **kwargs):
+    invalidate_event_cache(instance.object_id)
+    if instance.key == 'custom_domain':
+        invalidate_custom_domain_index()
+
+
+@receiver(post_save, sender=Room, dispatch_uid='cache_invalidate_room')
+@receiver(post_delete, sender=Room, dispatch_uid='cache_invalidate_room_delete')
+@receiver(post_save, sender=SpeakerProfile, dispatch_uid='cache_invalidate_profile')
+@receiver(post_save, sender=Submission, dispatch_uid='cache_invalidate_submission')
+@receiver(post_delete, sender=Submission, dispatch_uid='cache_invalidate_submission_delete')
+@receiver(post_save, sender=Question, dispatch_uid='cache_invalidate_question')
+@receiver(post_delete, sender=Question, dispatch_uid='cache_invalidate_question_delete')
+def invalidate_on_content_change(sender, instance, **kwargs):
+    if instance.event_id:
+        invalidate_event_cache(instance.event_id)
+
+
+@receiver(post_save, sender=Schedule, dispatch_uid='cache_invalidate_schedule')
+def invalidate_on_schedule_change(sender, instance, **kwargs):
+    invalidate_event_cache(instance.event_id)
+
+
+@receiver(post_save, sender=User, dispatch_uid='cache_invalidate_user')
+def invalidate_on_user_change(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields and set(update_fields) <= {'last_login'}):
+        return
+    for event_id in (
+        Submission.all_objects.filter(speakers=instance)
+        .values_list('event_id', flat=True)
+        .distinct()
+    ):
+        invalidate_event_cache(event_id)
+
+
+@receiver(post_save, sender=Answer, dispatch_uid='cache_invalidate_answer')
+@receiver(post_delete, sender=Answer, dispatch_uid='cache_invalidate_answer_delete')
+def invalidate_on_answer_change(sender, instance, **kwargs):
+    invalidate_event_cache(instance.question.event_id)
@@ -0,0 +1,97 @@
+import time
+from threading import Lock
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.module_loading import import_string
+
+# Like the entries of LocMemCache, sizes and statistics are kept per cache name
+_sizes = {}
+_stats = {}
+_stats_locks = {}
+_MISSING = object()
+
+
+class LocalCache(LocMemCache):
+    """An in-process cache, used when neither memcached nor redis are
+    configured.
+
+    Like Django's LocMemCache, it drops the least recently used entries once
+    it holds ``MAX_ENTRIES`` entries. In addition, it supports these
+    ``OPTIONS``:
+
+    - ``MAX_SIZE``: The maximum size of all pickled values in bytes. Least
+      recently used entries are dropped to stay below it, and larger values
+      are not cached at all.
+    - ``MAX_TIMEOUT``: The maximum time in seconds to keep any entry,
+      including entries that are set without a timeout. Every worker process
+      has its own cache, so invalidations only reach the other processes once
+      their entries expire. This is the longest time they serve outdated data.
+    - ``STATS_HOOK``: A callable, or the dotted path to one, that is called
+      with the key and ``True`` or ``False`` for every cache hit or miss.
+      Hits and misses are also counted in ``stats``.
+    """
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        options = params.get('OPTIONS', {})
+        self._max_size = int(options.get('MAX_SIZE') or 0)
+        self._max_timeout = options.get('MAX_TIMEOUT')
+        self._stats_hook = options.get('STATS_HOOK')
+        if isinstance(self._stats_hook, str):
+            self._stats_hook = import_string(self._stats_hook)
+        self._sizes = _sizes.setdefault(name, {'total': 0, 'entries': {}})
+        self.stats = _stats.setdefault(name, {'hits': 0, 'misses': 0})
+        self._stats_lock = _stats_locks.setdefault(name, Lock())
+
+    def get_backend_timeout(self, timeout=DEFAULT_TIMEOUT):
+        expires = super().get_backend_timeout(timeout)
+        if self._max_timeout is not None:
+            latest = time.time() + self._max_timeout
+            if expires is None or expires > latest:
+                return latest
+        return expires
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        hit = value is not _MISSING
+        with self._stats_lock:
+            self.stats['hits' if hit else 'misses'] += 1
+        if self._stats_hook:
+            self._stats_hook(key, hit)
+        return value if hit else default
+
+    def _set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        if self._max_size and len(value) > self._max_size:
+            self._delete(key)
+            return
+        self._forget_size(key)
+        super()._set(key, value, timeout)
+        self._sizes['entries'][key] = len(value)
+        self._sizes['total'] += len(value)
+        while self._max_size and self._sizes['total'] > self._max_size:
+            self._delete(next(reversed(self._cache)))
+
+    def _cull(self):
+        if self._cull_frequency == 0:
+            self._clear()
+        else:
+            for _ in range(len(self._cache) // self._cull_frequency):
+                self._delete(next(reversed(self._cache)))
+
+    def _forget_size(self, key):
+        self._sizes['total'] -= self._sizes['entries'].pop(key, 0)
+
+    def _delete(self, key):
+        super()._delete(key)
+        self._forget_size(key)
+
+    def _clear(self):
+        self._cache.clear()
+        self._expire_info.clear()
+        self._sizes['entries'].clear()
+        self._sizes['total'] = 0
+
+    def clear(self):
+        with self._lock:
+            self._clear()
@@ -1,4 +1,10 @@
-from typing import Tuple
+import hashlib
+from typing import Iterator, Optional, Tuple
+
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+EXPORT_CACHE_TIMEOUT = 24 * 60 * 60
 
 
 class BaseExporter:
@@ -40,6 +46,85 @@ class BaseExporter:
         """Return either a fa- string or some other symbol to accompany the exporter in displays."""
         raise NotImplementedError()  # NOQA
 
+    cacheable = False
+    """Set to True if the output only depends on the event and a released
+    schedule version, and can be cached until the event changes."""
+
     def render(self, **kwargs) -> Tuple[str, str, str]:
         """Render the exported file and return a tuple consisting of a file name, a file type and file content."""
         raise NotImplementedError()  # NOQA
+
+
+def get_export_cache_key(exporter: BaseExporter) -> Optional[str]:
+    """Returns the cache key for the rendered output of an exporter, or
+    ``None`` if the output must not be cached.
+
+    Only released schedule versions are cached, as the WIP schedule changes
+    all the time."""
+    from pretalx.common.cache import get_event_cache_version
+
+    schedule = getattr(exporter, 'schedule', None)
+    if not exporter.cacheable or not schedule or not schedule.version:
+        return None
+    return 'pretalx_export_{event}_{generation}_{schedule}_{identifier}_{orga}_{locale}'.format(
+        event=exporter.event.pk,
+        generation=get_event_cache_version(exporter.event.pk),
+        schedule=schedule.pk,
+        identifier=exporter.identifier,
+        orga=int(bool(getattr(exporter, 'is_orga', False))),
+        locale=get_language(),
+    )
+
+
+def get_cached_export_etag(exporter: BaseExporter) -> Optional[str]:
+    """Returns the ETag of the cached output of an exporter without loading
+    the (potentially large) content itself."""
+    key = get_export_cache_key(exporter)
+    if key:
+        return cache.get(f'{key}_etag')
+    return None
+
+
+def is_export_cached(exporter: BaseExporter) -> bool:
+    key = get_export_cache_key(exporter)
+    return bool(key) and key in cache
+
+
+def render_export(exporter: BaseExporter) -> Tuple[str, str, str, str]:
+    """Renders an exporter, or returns its cached output if available.
+
+    Returns a tuple of file name, file type, content and ETag."""
+    key = get_export_cache_key(exporter)
+    if key:
+        result = cache.get(key)
+        if result:
+            return result
+    file_name, file_type, data = exporter.render()
+    etag = hashlib.sha1(str(data).encode()).hexdigest()
+    result = (file_name, file_type, data, etag)
+    if key:
+        cache.set(key, result, EXPORT_CACHE_TIMEOUT)
+        cache.set(f'{key}_etag', etag, EXPORT_CACHE_TIMEOUT)
+    return result
+
+
+def stream_export(exporter: BaseExporter) -> Tuple[str, str, Iterator[str], Optional[str]]:
+    """Returns the output of an exporter with a ``stream`` method as an
+    iterator of chunks, without holding the full document in memory.
+
+    Returns a tuple of file name, file type, chunk iterator and the ETag, if
+    it is already known. The ETag is computed while the chunks are consumed,
+    and cached once the iterator is exhausted."""
+    key = get_export_cache_key(exporter)
+    file_name, file_type, chunks = exporter.stream()
+
+    def digesting_chunks():
+        digest = hashlib.sha1()
+        for chunk in chunks:
+            digest.update(chunk.encode())
+            yield chunk
+        if key:
+            cache.set(f'{key}_etag', digest.hexdigest(), EXPORT_CACHE_TIMEOUT)
+
+    etag = cache.get(f'{key}_etag') if key else None
+    return file_name, file_type, digesting_chunks(), etag
@@ -1,16 +1,23 @@
 import logging
+from collections import defaultdict
+from datetime import timedelta
 from email.utils import formataddr
 from smtplib import SMTPSenderRefused
 from typing import Any, Dict, Union
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.core.mail.backends.smtp import EmailBackend
+from django.db.models import Min, Q
+from django.dispatch import receiver
+from django.utils.timezone import now
 from django.utils.translation import override
 from i18nfield.strings import LazyI18nString
-from inlinestyler.utils import inline_css
 
 from pretalx.celery_app import app
+from pretalx.common.signals import periodic_task
 from pretalx.event.models import Event
 from pretalx.person.models import User
 
@@ -77,8 +84,52 @@ def mail(
         ).send()
 
 
-@app.task
+def get_sender(event: Event = None) -> str:
+    if event:
+        sender = event.settings.get('mail_from')
+        if sender == 'noreply@example.org' or not sender:
+            sender = settings.MAIL_FROM
+        return formataddr((str(event.name), sender))
+    return formataddr(('pretalx', settings.MAIL_FROM))
+
+
+def make_email(
+    to: list,
+    subject: str,
+    body: str,
+    html: str,
+    reply_to: str = None,
+    event: Event = None,
+    cc: list = None,
+    bcc: list = None,
+    headers: dict = None,
+) -> EmailMultiAlternatives:
+    headers = headers or dict()
+    if event and reply_to:
+        headers['reply-to'] = reply_to
+    email = EmailMultiAlternatives(
+        subject, body, get_sender(event), to=to, cc=cc, bcc=bcc, headers=headers
+    )
+    if html is not None:
+        email.attach_alternative(html, 'text/html')
+    return email
+
+
+MAIL_BATCH_SIZE = 100
+MAIL_MAX_ATTEMPTS = 5
+MAIL_RETRY_DELAY = 60
+MAIL_LEASE = timedelta(minutes=10)
+
+
+def get_retry_delay(attempts: int) -> int:
+    """Returns the seconds to wait before the next attempt to send a mail,
+    doubling with every failed attempt."""
+    return MAIL_RETRY_DELAY * 2 ** (attempts - 1)
+
+
+@app.task(bind=True)
 def mail_send_task(
+    self,
     to: str,
     subject: str,
     body: str,
@@ -89,30 +140,205 @@ def mail_send_task(
     bcc: list = None,
     headers: dict = None,
 ):
-    headers = headers or dict()
     if event:
         event = Event.objects.filter(id=event).first()
-    if event:
-        sender = event.settings.get('mail_from')
-        if sender == 'noreply@example.org' or not sender:
-            sender = settings.MAIL_FROM
-        if reply_to:
-            headers['reply-to'] = reply_to
-        backend = event.get_mail_backend()
-        sender = formataddr((str(event.name), sender))
-    else:
-        sender = formataddr(('pretalx', settings.MAIL_FROM))
-        backend = get_connection(fail_silently=False)
-
-    email = EmailMultiAlternatives(
-        subject, body, sender, to=to, cc=cc, bcc=bcc, headers=headers
+    backend = event.get_mail_backend() if event else get_connection(fail_silently=False)
+    email = make_email(
+        to, subject, body, html, reply_to=reply_to, event=event, cc=cc, bcc=bcc,
+        headers=headers,
     )
 
-    if html is not None:
-        email.attach_alternative(inline_css(html), 'text/html')
-
     try:
         backend.send_messages([email])
     except Exception:
         logger.exception('Error sending email')
+        attempt = self.request.retries + 1
+        if settings.HAS_CELERY and attempt < MAIL_MAX_ATTEMPTS:
+            raise self.retry(countdown=get_retry_delay(attempt))
         raise SendMailException('Failed to send an email to {}.'.format(to))
+
+
+def _record_failure(mail, exception):
+    mail.attempts += 1
+    if mail.attempts < MAIL_MAX_ATTEMPTS:
+        mail.next_attempt = now() + timedelta(seconds=get_retry_delay(mail.attempts))
+    else:
+        mail.next_attempt = None
+    mail.save(update_fields=['attempts', 'next_attempt'])
+    mail.log_action(
+        'pretalx.mail.failed', data={'error': str(exception), 'attempt': mail.attempts}
+    )
+
+
+def _send_queued_mail(backend, mail, event) -> bool:
+    """Sends a queued mail over an open connection. The mail is marked as
+    sent as soon as the backend accepted it, so that it is not sent again
+    if the rest of the batch is interrupted. Failures are recorded on the
+    mail, and ``False`` is returned."""
+    from pretalx.mail.models import QueuedMail
+
+    mail.event = event
+    try:
+        backend.send_messages([make_email(**mail.get_mail_kwargs())])
+    except Exception as exception:
+        logger.exception('Error sending email')
+        _record_failure(mail, exception)
+        return False
+    QueuedMail.objects.filter(pk=mail.pk).update(sent=now(), next_attempt=None)
+    return True
+
+
+def _send_queued_mail_batch(backend, mails, event) -> list:
+    """Sends the given queued mails over one connection and returns the
+    mails that were sent."""
+    try:
+        backend.open()
+    except Exception as exception:
+        logger.exception('Error opening the mail connection')
+        for mail in mails:
+            _record_failure(mail, exception)
+        return []
+    try:
+        return [mail for mail in mails if _send_queued_mail(backend, mail, event)]
+    finally:
+        backend.close()
+
+
+@app.task
+def mail_send_batch_task(
+    *, mail_ids: list, user: int = None, batch_size: int = MAIL_BATCH_SIZE
+):
+    """Sends the given queued mails, using one connection for each batch of
+    mails of an event. Mails are marked as sent one by one and logged in
+    bulk, mails that failed are logged one by one and stay in the outbox
+    to be retried later. Returns the IDs of the sent and the failed mails."""
+    from pretalx.common.models import ActivityLog
+    from pretalx.mail.models import QueuedMail
+
+    mails = QueuedMail.objects.filter(pk__in=mail_ids, sent__isnull=True).order_by(
+        'event_id', 'pk'
+    )
+    mails_by_event = defaultdict(list)
+    for mail in mails:
+        mails_by_event[mail.event_id].append(mail)
+    events = Event.objects.in_bulk(list(mails_by_event))
+    content_type = ContentType.objects.get_for_model(QueuedMail)
+    result = {'sent': [], 'failed': []}
+
+    for event_id, event_mails in mails_by_event.items():
+        event = events.get(event_id)
+        if event:
+            backend = event.get_mail_backend()
+        else:
+            backend = get_connection(fail_silently=False)
+        for start in range(0, len(event_mails), batch_size):
+            batch = event_mails[start:start + batch_size]
+            sent = _send_queued_mail_batch(backend, batch, event)
+            ActivityLog.objects.bulk_create(
+                ActivityLog(
+                    event=event,
+                    person_id=user,
+                    content_type=content_type,
+                    object_id=mail.pk,
+                    action_type='pretalx.mail.sent',
+                    is_orga_action=True,
+                )
+                for mail in sent
+            )
+            sent_ids = {mail.pk for mail in sent}
+            result['sent'] += [mail.pk for mail in sent]
+            result['failed'] += [mail.pk for mail in batch if mail.pk not in sent_ids]
+    return result
+
+
+def _delivery_lock_key(event_id: int) -> str:
+    return f'pretalx_mail_delivery_{event_id}'
+
+
+def start_mail_delivery(event_id: int, user: int = None):
+    """Starts the delivery of the event's due mails, unless a delivery of the
+    event is already running or scheduled."""
+    if cache.add(_delivery_lock_key(event_id), True, MAIL_LEASE.total_seconds()):
+        deliver_queued_mails.apply_async(kwargs={'event_id': event_id, 'user': user})
+
+
+@app.task
+def deliver_queued_mails(*, event_id: int, user: int = None):
+    """Sends the event's mails that are due, at most ``mail_rate_limit`` per
+    minute. Due mails are leased for ``MAIL_LEASE`` before they are sent, so
+    that concurrent deliveries skip them, and mails of a delivery that was
+    interrupted become due again when the lease runs out. Leased mails and
+    mails waiting for a retry count against the rate limit, like mails sent
+    in the last minute. While mails are waiting, the task schedules itself
+    again if celery is available, and the periodic task resumes it
+    otherwise. Only one delivery per event is scheduled at a time."""
+    event = Event.objects.filter(pk=event_id).first()
+    if not event:
+        cache.delete(_delivery_lock_key(event_id))
+        return
+    _now = now()
+    due = event.queued_mails.filter(sent__isnull=True, next_attempt__lte=_now)
+    limit = event.settings.mail_rate_limit
+    mail_ids = list(due.order_by('next_attempt', 'pk').values_list('pk', flat=True))
+    if limit:
+        recently_sent = event.queued_mails.filter(
+            Q(sent__gt=_now - timedelta(minutes=1))
+            | Q(sent__isnull=True, next_attempt__gt=_now)
+        ).count()
+        mail_ids = mail_ids[:max(limit - recently_sent, 0)]
+    lease = _now + MAIL_LEASE
+    due.filter(pk__in=mail_ids).update(next_attempt=lease)
+    mail_ids = list(
+        event.queued_mails.filter(
+            sent__isnull=True, next_attempt=lease
+        ).values_list('pk', flat=True)
+    )
+    if mail_ids:
+        mail_send_batch_task(mail_ids=mail_ids, user=user)
+
+    countdown = _get_next_delivery(event) if settings.HAS_CELERY else None
+    if countdown is None:
+        cache.delete(_delivery_lock_key(event_id))
+        return
+    cache.set(
+        _delivery_lock_key(event_id), True, countdown + MAIL_LEASE.total_seconds()
+    )
+    deliver_queued_mails.apply_async(
+        kwargs={'event_id': event_id, 'user': user}, countdown=countdown
+    )
+
+
+def _get_next_delivery(event):
+    """Returns the seconds until the event's mails should be delivered again,
+    at most a minute so that newly queued mails are picked up, or None if no
+    mails are waiting."""
+    waiting = event.queued_mails.filter(sent__isnull=True, next_attempt__isnull=False)
+    next_attempt = waiting.aggregate(Min('next_attempt'))['next_attempt__min']
+    if not next_attempt:
+        return None
+    if next_attempt <= now():  # Held back by the rate limit
+        return 60
+    return min((next_attempt - now()).total_seconds(), 60)
+
+
+def queue_mails(queryset, user=None):
+    """Queues the unsent mails in the queryset for delivery, and starts the
+    delivery."""
+    queryset = queryset.filter(sent__isnull=True)
+    event_ids = set(queryset.values_list('event_id', flat=True))
+    queryset.update(next_attempt=now(), attempts=0)
+    for event_id in event_ids:
+        start_mail_delivery(event_id, user=getattr(user, 'pk', None))
+
+
+@receiver(periodic_task)
+def resume_mail_delivery(sender, **kwargs):
+    from pretalx.mail.models import QueuedMail
+
+    event_ids = set(
+        QueuedMail.objects.filter(
+            sent__isnull=True, next_attempt__lte=now()
+        ).values_list('event_id', flat=True)
+    )
+    for event_id in event_ids:
+        start_mail_delivery(event_id)
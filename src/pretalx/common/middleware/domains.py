@@ -1,5 +1,5 @@
 import time
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 from django.conf import settings
 from django.contrib.sessions.middleware import (
@@ -8,12 +8,14 @@ from django.contrib.sessions.middleware import (
 from django.core.exceptions import DisallowedHost
 from django.http.request import split_domain_port
 from django.middleware.csrf import CsrfViewMiddleware as BaseCsrfMiddleware
-from django.shortcuts import get_object_or_404, redirect
-from django.urls import resolve
+from django.shortcuts import redirect
+from django.urls import reverse
 from django.utils.cache import patch_vary_headers
 from django.utils.http import http_date
 
-from pretalx.event.models import Event
+from pretalx.common.cache import get_custom_domain_index, get_host_key
+
+from .event import get_request_event, get_resolved_url
 
 LOCAL_HOST_NAMES = ('testserver', 'localhost')
 ANY_DOMAIN_ALLOWED = ('robots.txt', 'root.main')
@@ -45,24 +47,28 @@ class MultiDomainMiddleware:
         request.port = int(port) if port else None
         request.uses_custom_domain = False
 
-        resolved = resolve(request.path)
-        if resolved.url_name in ANY_DOMAIN_ALLOWED or request.path.startswith('/api/'):
-            return
-        event_slug = resolved.kwargs.get('event')
-        if event_slug:
-            event = get_object_or_404(Event, slug__iexact=event_slug)
-            request.event = event
-            if event.settings.custom_domain:
-                custom_domain = urlparse(event.settings.custom_domain)
-                event_domain, event_port = split_domain_port(custom_domain.netloc)
-                if event_domain == domain and event_port == port:
-                    request.uses_custom_domain = True
-                    return
-
         default_domain, default_port = split_domain_port(settings.SITE_NETLOC)
         if domain == default_domain:
             return
 
+        resolved = get_resolved_url(request)
+        event_slug = resolved.kwargs.get('event')
+        custom_domain_event = get_custom_domain_index()['domains'].get(
+            get_host_key(domain, port)
+        )
+        if custom_domain_event:
+            if event_slug and event_slug.lower() == custom_domain_event.lower():
+                request.uses_custom_domain = True
+                return
+            if resolved.url_name == 'root.main':
+                return redirect(
+                    reverse('cfp:event.landing', kwargs={'event': custom_domain_event})
+                )
+        if resolved.url_name in ANY_DOMAIN_ALLOWED or request.path.startswith('/api/'):
+            return
+        if event_slug:
+            get_request_event(request, event_slug)
+
         if settings.DEBUG or domain in LOCAL_HOST_NAMES:
             return
 
@@ -3,6 +3,7 @@ from urllib.parse import quote, urljoin
 
 import pytz
 from django.conf import settings
+from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, reverse
 from django.urls import resolve
 from django.utils import timezone, translation
@@ -10,7 +11,27 @@ from django.utils.translation.trans_real import (
     get_supported_language_variant, language_code_re, parse_accept_lang_header,
 )
 
-from pretalx.event.models import Event, Organiser, Team
+from pretalx.common.cache import get_custom_domain_index, get_event_by_slug
+from pretalx.event.models import Event, Organiser
+
+
+def get_resolved_url(request):
+    """Resolves the request path once per request, for all middlewares."""
+    if not hasattr(request, '_resolved_url'):
+        request._resolved_url = resolve(request.path_info)
+    return request._resolved_url
+
+
+def get_request_event(request, slug):
+    """Sets request.event to the event with the given slug, unless a previous
+    middleware already did, and raises Http404 for unknown slugs."""
+    event = getattr(request, 'event', None)
+    if not event or event.slug.lower() != slug.lower():
+        event = get_event_by_slug(slug)
+        if not event:
+            raise Http404()
+        request.event = event
+    return event
 
 
 class EventPermissionMiddleware:
@@ -40,11 +61,11 @@ class EventPermissionMiddleware:
                     'date_from'
                 )
                 if hasattr(request, 'event'):
-                    request.is_orga = request.event in request.orga_events
-                    request.is_reviewer = (
-                        request.event
-                        in request.user.get_events_for_permission(is_reviewer=True)
+                    permissions = request.user.get_permission_map()['events'].get(
+                        request.event.pk
                     )
+                    request.is_orga = permissions is not None
+                    request.is_reviewer = 'is_reviewer' in (permissions or set())
 
     def _handle_orga_url(self, request, url):
         if request.uses_custom_domain:
@@ -58,7 +79,7 @@ class EventPermissionMiddleware:
         return None
 
     def __call__(self, request):
-        url = resolve(request.path_info)
+        url = get_resolved_url(request)
 
         organiser_slug = url.kwargs.get('organiser')
         if organiser_slug:
@@ -68,16 +89,16 @@ class EventPermissionMiddleware:
             if hasattr(request, 'organiser') and request.organiser:
                 request.is_orga = False
                 if not request.user.is_anonymous:
-                    has_perms = Team.objects.filter(
-                        organiser=request.organiser,
-                        members__in=[request.user],
-                        can_change_organiser_settings=True,
-                    ).exists()
-                    request.is_orga = request.user.is_administrator or has_perms
+                    request.is_orga = (
+                        'can_change_organiser_settings'
+                        in request.user.get_permissions_for_organiser(
+                            request.organiser
+                        )
+                    )
 
         event_slug = url.kwargs.get('event')
         if event_slug:
-            request.event = get_object_or_404(Event, slug__iexact=event_slug)
+            get_request_event(request, event_slug)
 
         self._set_orga_events(request)
         self._select_locale(request)
@@ -93,13 +114,14 @@ class EventPermissionMiddleware:
                 return redirect(url)
         elif (
             getattr(request, 'event', None)
-            and request.event.settings.custom_domain
             and not request.uses_custom_domain
             and not is_exempt
         ):
-            return redirect(
-                urljoin(request.event.settings.custom_domain, request.get_full_path())
+            custom_domain = get_custom_domain_index()['events'].get(
+                request.event.slug.lower()
             )
+            if custom_domain:
+                return redirect(urljoin(custom_domain, request.get_full_path()))
         return self.get_response(request)
 
     def _select_locale(self, request):
@@ -1,15 +1,19 @@
+import hashlib
 import urllib
 from contextlib import suppress
 from importlib import import_module
 from urllib.parse import quote
 
 from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models import CharField, Q
 from django.db.models.functions import Lower
 from django.http import Http404
 from django.shortcuts import redirect
 from django.utils.functional import cached_property
+from django.utils.translation import get_language
 from i18nfield.forms import I18nModelForm
 from rules.contrib.views import PermissionRequiredMixin
 
@@ -193,3 +197,53 @@ class EventPermissionRequired(PermissionRequired):
 
     def get_permission_object(self):
         return self.request.event
+
+
+class AnonymousCacheMixin:
+    """Caches the responses to anonymous GET requests of public event pages,
+    as they are the same for all visitors until the event changes.
+
+    The cache key contains the event's cache generation, which changes on
+    schedule releases and any change to the event's talks or speakers, and
+    the locale and full URL. Pages show whether a talk is running or open
+    for feedback, so they are only cached for a short time."""
+
+    anonymous_cache_timeout = 60
+
+    def get_anonymous_cache_key(self):
+        from pretalx.common.cache import get_event_cache_version
+
+        request = self.request
+        event = getattr(request, 'event', None)
+        if (
+            request.method != 'GET'
+            or not event
+            or not request.user.is_anonymous
+            or len(get_messages(request))
+        ):
+            return None
+        url = hashlib.sha1(request.build_absolute_uri().encode()).hexdigest()
+        return 'pretalx_page_{event}_{generation}_{locale}_{url}'.format(
+            event=event.pk,
+            generation=get_event_cache_version(event.pk),
+            locale=get_language(),
+            url=url,
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        key = self.get_anonymous_cache_key()
+        if key:
+            response = cache.get(key)
+            if response is not None:
+                return response
+        response = super().dispatch(request, *args, **kwargs)
+        if key and response.status_code == 200 and not response.streaming:
+            if hasattr(response, 'add_post_render_callback'):
+                response.add_post_render_callback(
+                    lambda rendered: cache.set(
+                        key, rendered, self.anonymous_cache_timeout
+                    )
+                )
+            else:
+                cache.set(key, response, self.anonymous_cache_timeout)
+        return response
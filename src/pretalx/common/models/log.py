@@ -39,6 +39,7 @@ LOG_NAMES = {
     'pretalx.mail.create': _('An email was modified.'),
     'pretalx.mail.delete': _('A pending email was deleted.'),
     'pretalx.mail.delete_all': _('All pending emails were deleted.'),
+    'pretalx.mail.failed': _('An email could not be sent.'),
     'pretalx.mail.sent': _('An email was sent.'),
     'pretalx.mail.update': _('An email was modified.'),
     'pretalx.mail_template.create': _('A mail template was added.'),
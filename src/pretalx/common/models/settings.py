@@ -2,11 +2,75 @@ import json
 import uuid
 from datetime import datetime
 
+from django.core.cache import cache
 from django.utils.translation import ugettext_noop
 from hierarkey.models import GlobalSettingsBase, Hierarkey
+from hierarkey.proxy import HierarkeyProxy
 from i18nfield.strings import LazyI18nString
 
-hierarkey = Hierarkey(attribute_name='settings')
+SETTINGS_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+class SettingsProxy(HierarkeyProxy):
+    """Loads all settings of an object with one query, and keeps them on the
+    proxy (and thereby on the object) and in the cache.
+
+    Instead of deleting the cached settings on every change like hierarkey
+    does, we change the version key that is part of their cache key, so that
+    a concurrent request cannot put outdated settings back into the cache."""
+
+    @property
+    def _version_key(self):
+        return f'hierarkey_{self._cache_namespace}_{self._obj.pk}_version'
+
+    def _get_version(self):
+        version = cache.get(self._version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not cache.add(self._version_key, version, None):
+                version = cache.get(self._version_key) or version
+        return version
+
+    def _cache(self):
+        if self._cached_obj is None:
+            key = f'hierarkey_{self._cache_namespace}_{self._obj.pk}_{self._get_version()}'
+            self._cached_obj = cache.get(key)
+            if self._cached_obj is None:
+                self._cached_obj = {s.key: s.value for s in self._objects.all()}
+                cache.set(key, self._cached_obj, SETTINGS_CACHE_TIMEOUT)
+        return self._cached_obj
+
+    def _flush_external_cache(self):
+        cache.set(self._version_key, uuid.uuid4().hex, None)
+
+
+class CachedHierarkey(Hierarkey):
+    """Hierarkey, with SettingsProxy instead of HierarkeyProxy."""
+
+    def add(self, *args, **kwargs):
+        return self._use_settings_proxy(super().add(*args, **kwargs))
+
+    def set_global(self, *args, **kwargs):
+        return self._use_settings_proxy(super().set_global(*args, **kwargs))
+
+    def _use_settings_proxy(self, decorator):
+        def wrapper(cls):
+            cls = decorator(cls)
+            hierarkey_property = getattr(cls, self.attribute_name)
+
+            def prop(instance):
+                proxy = hierarkey_property.fget(instance)
+                # hierarkey does not allow to configure its proxy class
+                proxy.__class__ = SettingsProxy
+                return proxy
+
+            setattr(cls, self.attribute_name, property(prop))
+            return cls
+
+        return wrapper
+
+
+hierarkey = CachedHierarkey(attribute_name='settings')
 
 
 @hierarkey.set_global()
@@ -87,6 +151,7 @@ hierarkey.add_default(
 hierarkey.add_default('mail_from', '', str)
 hierarkey.add_default('mail_subject_prefix', '', str)
 hierarkey.add_default('mail_signature', '', str)
+hierarkey.add_default('mail_rate_limit', None, int)
 hierarkey.add_default('smtp_use_custom', 'False', bool)
 hierarkey.add_default('smtp_host', '', str)
 hierarkey.add_default('smtp_port', '587', int)
@@ -104,6 +104,24 @@ CONFIG = {
             'env': os.getenv('PRETALX_REDIS_SESSIONS'),
         },
     },
+    'local_cache': {
+        'enabled': {
+            'default': 'True',
+            'env': os.getenv('PRETALX_LOCAL_CACHE'),
+        },
+        'max_entries': {
+            'default': '10000',
+            'env': os.getenv('PRETALX_LOCAL_CACHE_MAX_ENTRIES'),
+        },
+        'max_size': {
+            'default': '64',
+            'env': os.getenv('PRETALX_LOCAL_CACHE_MAX_SIZE'),
+        },
+        'max_timeout': {
+            'default': '60',
+            'env': os.getenv('PRETALX_LOCAL_CACHE_MAX_TIMEOUT'),
+        },
+    },
     'celery': {
         'broker': {
             'default': '',
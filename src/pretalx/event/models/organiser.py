@@ -94,6 +94,15 @@ class Team(LogMixin, models.Model):
         ),
     )
 
+    PERMISSIONS = (
+        'can_create_events',
+        'can_change_teams',
+        'can_change_organiser_settings',
+        'can_change_event_settings',
+        'can_change_submissions',
+        'is_reviewer',
+    )
+
     def __str__(self) -> str:
         """Help with debugging."""
         return _('{name} on {orga}').format(
@@ -0,0 +1,23 @@
+# Generated by Django 2.1.15 on 2026-10-17 00:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mail', '0003_auto_20171001_1358'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='queuedmail',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='queuedmail',
+            name='next_attempt',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
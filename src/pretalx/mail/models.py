@@ -1,17 +1,67 @@
+import hashlib
 from copy import deepcopy
+from html import escape
 
 import bleach
+import lxml.html
 import markdown
+from django.core.cache import cache
 from django.db import models
 from django.template.loader import get_template
 from django.utils.timezone import now
-from django.utils.translation import override, ugettext_lazy as _
+from django.utils.translation import get_language, override, ugettext_lazy as _
 from i18nfield.fields import I18nCharField, I18nTextField
+from inlinestyler.utils import inline_css
 
 from pretalx.common.mail import SendMailException
 from pretalx.common.mixins import LogMixin
 from pretalx.common.urls import EventUrls
 
+MAIL_BODY_TAGS = bleach.ALLOWED_TAGS + ['p', 'pre']
+MAIL_BODY_PLACEHOLDER = 'PRETALX_MAIL_BODY_PLACEHOLDER'
+MAIL_WRAPPER_TIMEOUT = 24 * 3600
+
+
+def _render_mail_wrapper(body, event=None):
+    html_context = {
+        'body': body,
+        'event': event,
+        'color': (event.primary_color if event else '') or '#1c4a3b',
+    }
+    return inline_css(get_template('mail/mailwrapper.html').render(html_context))
+
+
+def get_mail_wrapper(event=None) -> dict:
+    """Returns the mail wrapper of the event in the current language with
+    its CSS already inlined, as the HTML before (``start``) and after
+    (``end``) the mail body, and the inline ``styles`` of the tags a mail
+    body can contain.
+
+    Inlining CSS is slow, so the wrapper is cached, and mail bodies are
+    styled by tag name instead of running them through ``inline_css``."""
+    name = str(event.name) if event else ''
+    color = (event.primary_color if event else '') or ''
+    key = 'pretalx_mail_wrapper_' + hashlib.sha1(
+        f'{name}|{color}|{get_language()}'.encode()
+    ).hexdigest()
+    wrapper = cache.get(key)
+    if wrapper:
+        return wrapper
+
+    start, end = _render_mail_wrapper(MAIL_BODY_PLACEHOLDER, event).split(
+        MAIL_BODY_PLACEHOLDER
+    )
+    probe = ''.join(f'<{tag} class="probe"></{tag}>' for tag in MAIL_BODY_TAGS)
+    document = lxml.html.document_fromstring(_render_mail_wrapper(probe, event))
+    styles = {
+        element.tag: element.get('style')
+        for element in document.find_class('probe')
+        if element.get('style')
+    }
+    wrapper = {'start': start, 'end': end, 'styles': styles}
+    cache.set(key, wrapper, MAIL_WRAPPER_TIMEOUT)
+    return wrapper
+
 
 class MailTemplate(LogMixin, models.Model):
     event = models.ForeignKey(
@@ -47,7 +97,12 @@ class MailTemplate(LogMixin, models.Model):
         """Help with debugging."""
         return f'MailTemplate(event={self.event.slug}, subject={self.subject})'
 
-    def to_mail(self, user, event, locale=None, context=None, skip_queue=False):
+    def to_mail(
+        self, user, event, locale=None, context=None, skip_queue=False, commit=True
+    ):
+        """Returns a QueuedMail from this template to the user. It is sent
+        right away with ``skip_queue``, saved to the outbox by default, and
+        left unsaved with ``commit=False``."""
         address = user.email if hasattr(user, 'email') else user
         with override(locale):
             context = context or dict()
@@ -67,7 +122,7 @@ class MailTemplate(LogMixin, models.Model):
             )
             if skip_queue:
                 mail.send()
-            else:
+            elif commit:
                 mail.save()
         return mail
 
@@ -107,6 +162,8 @@ class QueuedMail(LogMixin, models.Model):
     )
     text = models.TextField(verbose_name=_('Text'))
     sent = models.DateTimeField(null=True, blank=True, verbose_name=_('Sent at'))
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt = models.DateTimeField(null=True, blank=True)
 
     class urls(EventUrls):
         base = edit = '{self.event.orga_urls.mail}{self.pk}/'
@@ -121,15 +178,21 @@ class QueuedMail(LogMixin, models.Model):
 
     @classmethod
     def make_html(cls, text, event=None):
-        body_md = bleach.linkify(bleach.clean(markdown.markdown(text), tags=bleach.ALLOWED_TAGS + [
-            'p', 'pre'
-        ]))
-        html_context = {
-            'body': body_md,
-            'event': event,
-            'color': (event.primary_color if event else '') or '#1c4a3b',
-        }
-        return get_template('mail/mailwrapper.html').render(html_context)
+        body_md = bleach.linkify(
+            bleach.clean(markdown.markdown(text), tags=MAIL_BODY_TAGS)
+        )
+        wrapper = get_mail_wrapper(event)
+        body = lxml.html.fragment_fromstring(body_md, create_parent='div')
+        for element in body.iterdescendants():
+            style = wrapper['styles'].get(element.tag)
+            if style:
+                element.set('style', style)
+        # lxml unescapes the text before the first element, so it has to be
+        # escaped again, like the elements' tails are by tostring()
+        body_html = escape(body.text or '', quote=False) + ''.join(
+            lxml.html.tostring(element, encoding='unicode') for element in body
+        )
+        return wrapper['start'] + body_html + wrapper['end']
 
     @classmethod
     def make_text(cls, text, event=None):
@@ -153,27 +216,31 @@ class QueuedMail(LogMixin, models.Model):
         if self.sent:
             raise Exception(_('This mail has been sent already. It cannot be sent again.'))
 
-        has_event = getattr(self, 'event', None)
-        text = self.make_text(self.text, event=has_event)
-        body_html = self.make_html(text)
         from pretalx.common.mail import mail_send_task
-        mail_send_task.apply_async(
-            kwargs={
-                'to': self.to.split(','),
-                'subject': self.make_subject(self.subject, event=has_event),
-                'body': text,
-                'html': body_html,
-                'reply_to': self.reply_to or (self.event.email if has_event else None),
-                'event': self.event.pk if has_event else None,
-                'cc': (self.cc or '').split(','),
-                'bcc': (self.bcc or '').split(','),
-            }
-        )
+
+        kwargs = self.get_mail_kwargs()
+        kwargs['event'] = kwargs['event'].pk if kwargs['event'] else None
+        mail_send_task.apply_async(kwargs=kwargs)
 
         self.sent = now()
         if self.pk:
             self.save()
 
+    def get_mail_kwargs(self):
+        """The arguments of ``make_email`` for this mail."""
+        has_event = getattr(self, 'event', None)
+        text = self.make_text(self.text, event=has_event)
+        return {
+            'to': self.to.split(','),
+            'subject': self.make_subject(self.subject, event=has_event),
+            'body': text,
+            'html': self.make_html(text),
+            'reply_to': self.reply_to or (self.event.email if has_event else None),
+            'event': has_event,
+            'cc': (self.cc or '').split(','),
+            'bcc': (self.bcc or '').split(','),
+        }
+
     def copy_to_draft(self):
         new_mail = deepcopy(self)
         new_mail.pk = None
@@ -202,6 +202,14 @@ class MailSettingsForm(ReadOnlyFlag, I18nFormMixin, HierarkeyForm):
         required=False,
         widget=forms.Textarea,
     )
+    mail_rate_limit = forms.IntegerField(
+        label=_('Mails per minute'),
+        help_text=_(
+            'Mails from the outbox will be sent at most at this rate. Leave empty to send them all at once.'
+        ),
+        required=False,
+        min_value=1,
+    )
     smtp_use_custom = forms.BooleanField(
         label=_('Use custom SMTP server'),
         help_text=_(
@@ -14,7 +14,7 @@ def can_change_event_settings(user, obj):
     event = getattr(obj, 'event', None)
     if not user or user.is_anonymous or not obj or not event:
         return False
-    return user.is_administrator or event in user.get_events_for_permission(can_change_event_settings=True)
+    return 'can_change_event_settings' in user.get_permissions_for_event(event)
 
 
 @rules.predicate
@@ -22,28 +22,38 @@ def can_change_organiser_settings(user, obj):
     event = getattr(obj, 'event', None)
     if event:
         obj = event.organiser
-    return user.is_administrator or user.teams.filter(organiser=obj, can_change_organiser_settings=True).exists()
+    return 'can_change_organiser_settings' in user.get_permissions_for_organiser(obj)
 
 
 @rules.predicate
 def can_change_any_organiser_settings(user, obj):
-    return user.is_administrator or user.teams.filter(can_change_organiser_settings=True).exists()
+    return user.is_administrator or any(
+        'can_change_organiser_settings' in permissions
+        for permissions in user.get_permission_map()['organisers'].values()
+    )
 
 
 @rules.predicate
 def can_create_events(user, obj):
-    return user.is_administrator or user.teams.filter(can_create_events=True).exists()
+    return user.is_administrator or any(
+        'can_create_events' in permissions
+        for permissions in user.get_permission_map()['organisers'].values()
+    )
 
 
 @rules.predicate
 def can_change_teams(user, obj):
     from pretalx.event.models import Organiser
     if isinstance(obj, Organiser):
-        return user.teams.filter(organiser=obj, can_change_teams=True).exists()
+        # Only team members can change an organiser's teams, administrators
+        # do not get this permission implicitly
+        return 'can_change_teams' in user.get_permission_map()['organisers'].get(
+            obj.pk, set()
+        )
     event = getattr(obj, 'event', None)
     if not user or user.is_anonymous or not obj or not event:
         return False
-    return user.is_administrator or event in user.get_events_for_permission(can_change_teams=True)
+    return 'can_change_teams' in user.get_permissions_for_event(event)
 
 
 @rules.predicate
@@ -1,9 +1,14 @@
+import operator
+from functools import reduce
+
 from django.contrib import messages
+from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import FormView, ListView, TemplateView, View
 
+from pretalx.common.mail import queue_mails
 from pretalx.common.mixins.views import (
     ActionFromUrl, EventPermissionRequired, Filterable, PermissionRequired, Sortable,
 )
@@ -92,14 +97,21 @@ class OutboxSend(EventPermissionRequired, TemplateView):
         return qs
 
     def post(self, request, *args, **kwargs):
-        qs = self.queryset
-        count = qs.count()
-        for mail in qs:
-            mail.log_action('pretalx.mail.sent', person=self.request.user, orga=True)
-            mail.send()
-        messages.success(
-            request, _('{count} mails have been sent.').format(count=count)
-        )
+        count = self.queryset.count()
+        queue_mails(self.queryset, user=self.request.user)
+        rate_limit = self.request.event.settings.mail_rate_limit
+        if rate_limit:
+            messages.success(
+                request,
+                _(
+                    '{count} mails have been queued for sending, {rate} mails per minute.'
+                ).format(count=count, rate=rate_limit),
+            )
+        else:
+            messages.success(
+                request,
+                _('{count} mails have been queued for sending.').format(count=count),
+            )
         return redirect(self.request.event.orga_urls.outbox)
 
 
@@ -251,34 +263,34 @@ class ComposeMail(EventPermissionRequired, FormView):
     def get_success_url(self):
         return self.request.event.orga_urls.compose_mails
 
-    def form_valid(self, form):
-        email_set = set()
-
+    def get_recipients(self, form):
+        """Returns the distinct email addresses of all selected recipients,
+        loaded with a single query."""
+        event = self.request.event
+        recipient_filters = []
         for recipient in form.cleaned_data.get('recipients'):
             if recipient == 'reviewers':
-                mails = (
-                    User.objects.filter(
-                        teams__in=self.request.event.teams.filter(is_reviewer=True)
-                    )
-                    .distinct()
-                    .values_list('email', flat=True)
+                recipient_filters.append(
+                    Q(teams__in=event.teams.filter(is_reviewer=True))
                 )
+                continue
+            if recipient == 'selected_submissions':
+                submission_filter = {'code__in': form.cleaned_data.get('submissions')}
             else:
-                if recipient == 'selected_submissions':
-                    submission_filter = {
-                        'code__in': form.cleaned_data.get('submissions')
-                    }
-                else:
-                    submission_filter = {'state': recipient}  # e.g. "submitted"
-
-                mails = self.request.event.submissions.filter(
-                    **submission_filter
-                ).values_list('speakers__email', flat=True)
-
-            email_set.update(mails)
+                submission_filter = {'state': recipient}  # e.g. "submitted"
+            recipient_filters.append(
+                Q(submissions__in=event.submissions.filter(**submission_filter))
+            )
+        return (
+            User.objects.filter(reduce(operator.or_, recipient_filters))
+            .order_by('email')
+            .values_list('email', flat=True)
+            .distinct()
+        )
 
-        for email in email_set:
-            QueuedMail.objects.create(
+    def form_valid(self, form):
+        QueuedMail.objects.bulk_create(
+            QueuedMail(
                 event=self.request.event,
                 to=email,
                 reply_to=form.cleaned_data.get('reply_to', self.request.event.email),
@@ -287,6 +299,8 @@ class ComposeMail(EventPermissionRequired, FormView):
                 subject=form.cleaned_data.get('subject'),
                 text=form.cleaned_data.get('text'),
             )
+            for email in self.get_recipients(form)
+        )
         messages.success(
             self.request,
             _(
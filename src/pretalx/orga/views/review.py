@@ -1,5 +1,5 @@
 from django.contrib import messages
-from django.db import models
+from django.db import models, transaction
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
@@ -13,7 +13,7 @@ from pretalx.common.views import CreateOrUpdateView
 from pretalx.orga.forms import ReviewForm
 from pretalx.person.models import User
 from pretalx.submission.forms import QuestionsForm, SubmissionFilterForm
-from pretalx.submission.models import Review, SubmissionStates
+from pretalx.submission.models import Review, Submission, SubmissionStates
 
 
 class ReviewDashboard(EventPermissionRequired, Filterable, ListView):
@@ -93,8 +93,44 @@ class ReviewDashboard(EventPermissionRequired, Filterable, ListView):
             context['avg_reviews'] = round(
                 context['review_count'] / context['active_reviewers'], 1
             )
+        context['can_change_submissions'] = self.request.user.has_perm(
+            'orga.change_submission_state', self.request.event
+        )
         return context
 
+    @transaction.atomic
+    def post(self, request, *args, **kwargs):
+        """Accepts and rejects all submissions that were marked in the
+        ``s-<code>`` fields at once."""
+        if not request.user.has_perm('orga.change_submission_state', request.event):
+            messages.error(request, phrases.base.error_permissions_action)
+            return redirect(request.event.orga_urls.reviews)
+        decisions = {SubmissionStates.ACCEPTED: [], SubmissionStates.REJECTED: []}
+        for key, value in request.POST.items():
+            if key.startswith('s-') and value in decisions:
+                decisions[value].append(key[2:])
+        changed = {
+            state: Submission.bulk_set_state(
+                request.event,
+                request.event.submissions.filter(code__in=codes),
+                state,
+                person=request.user,
+            )
+            if codes
+            else []
+            for state, codes in decisions.items()
+        }
+        accepted = len(changed[SubmissionStates.ACCEPTED])
+        rejected = len(changed[SubmissionStates.REJECTED])
+        if accepted or rejected:
+            messages.success(
+                request,
+                _(
+                    '{accepted} submissions have been accepted and {rejected} submissions have been rejected.'
+                ).format(accepted=accepted, rejected=rejected),
+            )
+        return redirect(request.get_full_path())
+
 
 class ReviewSubmission(PermissionRequired, CreateOrUpdateView):
 
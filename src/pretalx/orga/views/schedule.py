@@ -20,7 +20,7 @@ from i18nfield.utils import I18nJSONEncoder
 from pretalx.agenda.management.commands.export_schedule_html import (
     Command as ExportScheduleHtml,
 )
-from pretalx.agenda.tasks import export_schedule_html
+from pretalx.agenda.tasks import export_schedule_html, get_notification_progress
 from pretalx.api.serializers.room import AvailabilitySerializer
 from pretalx.common.mixins.views import (
     ActionFromUrl, EventPermissionRequired, PermissionRequired,
@@ -28,6 +28,7 @@ from pretalx.common.mixins.views import (
 from pretalx.common.signals import register_data_exporters
 from pretalx.common.views import CreateOrUpdateView
 from pretalx.orga.forms.schedule import ScheduleImportForm, ScheduleReleaseForm
+from pretalx.schedule import intervals
 from pretalx.schedule.forms import QuickScheduleForm, RoomForm
 from pretalx.schedule.models import Availability, Room
 from pretalx.schedule.utils import guess_schedule_version
@@ -109,7 +110,12 @@ class ScheduleReleaseView(EventPermissionRequired, FormView):
         context = super().get_context_data(**kwargs)
         context['warnings'] = self.request.event.wip_schedule.warnings
         context['changes'] = self.request.event.wip_schedule.changes
-        context['notifications'] = len(self.request.event.wip_schedule.notifications)
+        context['notifications'] = len(
+            self.request.event.wip_schedule.speakers_concerned
+        )
+        context['notification_progress'] = get_notification_progress(
+            self.request.event
+        )
         context['suggested_version'] = guess_schedule_version(self.request.event)
         return context
 
@@ -160,7 +166,7 @@ class ScheduleToggleView(EventPermissionRequired, View):
         return redirect(self.request.event.orga_urls.schedule)
 
 
-def serialize_slot(slot):
+def serialize_slot(slot, warnings=None):
     return {
         'id': slot.pk,
         'title': str(slot.submission.title),
@@ -180,7 +186,8 @@ def serialize_slot(slot):
         'start': slot.start.isoformat() if slot.start else None,
         'end': slot.end.isoformat() if slot.end else None,
         'url': slot.submission.orga_urls.base,
-        'warnings': slot.warnings,
+        'warnings': slot.warnings if warnings is None else warnings,
+        'revision': slot.revision,
     }
 
 
@@ -202,7 +209,26 @@ class TalkList(EventPermissionRequired, View):
 
         if not schedule:
             return JsonResponse(result)
-        result['results'] = [serialize_slot(slot) for slot in schedule.talks.all()]
+        result['revision'] = schedule.revision
+        talks = schedule.talks.all()
+        since = self.request.GET.get('since')
+        if since and since.isdigit():
+            # Only send the talks that changed since the given revision, and
+            # the IDs of all talks, so that removed talks can be dropped
+            since = int(since)
+            if since <= schedule.revision:
+                talks = talks.filter(revision__gt=since)
+            if since != schedule.revision:
+                result['ids'] = list(schedule.talks.values_list('pk', flat=True))
+        talks = list(
+            talks.select_related(
+                'submission', 'submission__submission_type', 'submission__event', 'room'
+            ).prefetch_related('submission__speakers')
+        )
+        warnings = schedule.get_talk_warnings(talks)
+        result['results'] = [
+            serialize_slot(slot, warnings=warnings[slot.pk]) for slot in talks
+        ]
         return JsonResponse(result, encoder=I18nJSONEncoder)
 
 
@@ -269,12 +295,14 @@ class RoomTalkAvailabilities(EventPermissionRequired, View):
         room = request.event.rooms.filter(pk=roomid).first()
         if not (talk and room):
             return JsonResponse({'results': []})
-        if talk.submission.availabilities:
-            availabilitysets = [
-                room.availabilities.all(),
-                talk.submission.availabilities,
-            ]
-            availabilities = Availability.intersection(*availabilitysets)
+        submission_intervals = talk.submission.availability_intervals
+        if submission_intervals:
+            availabilities = Availability.from_intervals(
+                intervals.intersection(
+                    room.availabilities.values_list('start', 'end'),
+                    submission_intervals,
+                )
+            )
         else:
             availabilities = room.availabilities.all()
         return JsonResponse(
@@ -0,0 +1,18 @@
+# Generated by Django 2.1.15 on 2026-10-16 23:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('person', '0020_auto_20180922_0511'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='speakerprofile',
+            name='updated',
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+    ]
@@ -27,6 +27,7 @@ class SpeakerProfile(LogMixin, models.Model):
     has_arrived = models.BooleanField(
         default=False, verbose_name=_('The speaker has arrived')
     )
+    updated = models.DateTimeField(auto_now=True, null=True)
 
     class urls(EventUrls):
         public = '{self.event.urls.base}speaker/{self.user.code}/'
@@ -8,6 +8,7 @@ from django.contrib.auth.models import (
     AbstractBaseUser, BaseUserManager, PermissionsMixin,
 )
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db import models, transaction
 from django.db.models import Q
 from django.utils.crypto import get_random_string
@@ -18,6 +19,8 @@ from rest_framework.authtoken.models import Token
 
 from pretalx.common.urls import build_absolute_uri
 
+PERMISSION_CACHE_TIMEOUT = 24 * 60 * 60
+
 
 class UserManager(BaseUserManager):
     """The user manager class."""
@@ -174,49 +177,98 @@ class User(PermissionsMixin, AbstractBaseUser):
     def gravatar_parameter(self):
         return md5(self.email.strip().encode()).hexdigest()
 
+    def _build_permission_map(self) -> dict:
+        from pretalx.event.models import Event, Team
+
+        teams = list(
+            self.teams.values_list('id', 'organiser_id', 'all_events', *Team.PERMISSIONS)
+        )
+        organisers = {}
+        all_events = {}
+        limited = {}
+        for team_id, organiser_id, is_all_events, *flags in teams:
+            permissions = {
+                name for name, flag in zip(Team.PERMISSIONS, flags) if flag is True
+            }
+            organisers.setdefault(organiser_id, set()).update(permissions)
+            if is_all_events:
+                all_events.setdefault(organiser_id, set()).update(permissions)
+            else:
+                limited[team_id] = permissions
+        events = {}
+        if teams:
+            rows = Event.objects.filter(
+                Q(organiser_id__in=all_events) | Q(team__in=limited)
+            ).values_list('id', 'organiser_id', 'team')
+            for event_id, organiser_id, team_id in rows:
+                permissions = events.setdefault(event_id, set())
+                permissions.update(all_events.get(organiser_id, set()))
+                permissions.update(limited.get(team_id, set()))
+        return {'organisers': organisers, 'events': events}
+
+    def get_permission_map(self) -> dict:
+        """Returns the team permissions of this user as a dict with the keys
+        ``organisers`` and ``events``, each mapping an ID to the set of
+        permission names (see ``Team.PERMISSIONS``) the user has there.
+
+        The map is built with two queries, and is then kept on this object
+        (usually for the rest of the request) and in the cache until any team
+        changes."""
+        from pretalx.common.cache import (
+            get_local_permission_generation, get_permission_cache_version,
+        )
+
+        generation = get_local_permission_generation()
+        cached = getattr(self, '_permission_map', None)
+        if cached and cached[0] == generation:
+            return cached[1]
+        key = f'pretalx_permission_map_{self.pk}_{get_permission_cache_version()}'
+        permission_map = cache.get(key)
+        if permission_map is None:
+            permission_map = self._build_permission_map()
+            cache.set(key, permission_map, PERMISSION_CACHE_TIMEOUT)
+        self._permission_map = (generation, permission_map)
+        return permission_map
+
     def get_events_with_any_permission(self):
         from pretalx.event.models import Event
 
         if self.is_administrator:
             return Event.objects.all()
-
-        return Event.objects.filter(
-            Q(
-                organiser_id__in=self.teams.filter(all_events=True).values_list(
-                    'organiser', flat=True
-                )
-            )
-            | Q(id__in=self.teams.values_list('limit_events__id', flat=True))
-        )
+        return Event.objects.filter(pk__in=self.get_permission_map()['events'])
 
     def get_events_for_permission(self, **kwargs):
         from pretalx.event.models import Event
+
         if self.is_administrator:
             return Event.objects.all()
+        return Event.objects.filter(
+            pk__in=[
+                event_id
+                for event_id, permissions in self.get_permission_map()['events'].items()
+                if all((name in permissions) == value for name, value in kwargs.items())
+            ]
+        )
+
+    def get_permissions_for_event(self, event) -> set:
+        from pretalx.event.models import Team
 
-        orga_teams = self.teams.filter(**kwargs)
-        absolute = orga_teams.filter(all_events=True).values_list(
-            'organiser', flat=True
+        if self.is_administrator:
+            return set(Team.PERMISSIONS)
+        return set(
+            self.get_permission_map()['events'].get(getattr(event, 'pk', None), set())
         )
-        relative = orga_teams.filter(all_events=False)
-        return Event.objects.filter(
-            models.Q(organiser__in=absolute) | models.Q(organiser__teams__in=relative)
-        ).distinct()
 
-    def get_permissions_for_event(self, event):
+    def get_permissions_for_organiser(self, organiser) -> set:
+        from pretalx.event.models import Team
+
         if self.is_administrator:
-            return {
-                'can_create_events',
-                'can_change_teams',
-                'can_change_organiser_settings',
-                'can_change_event_settings',
-                'can_change_submissions',
-                'is_reviewer',
-            }
-        teams = event.teams.filter(members__in=[self])
-        if not teams:
-            return set()
-        return set().union(*[team.permission_set for team in teams])
+            return set(Team.PERMISSIONS)
+        return set(
+            self.get_permission_map()['organisers'].get(
+                getattr(organiser, 'pk', None), set()
+            )
+        )
 
     def remaining_override_votes(self, event):
         allowed = (
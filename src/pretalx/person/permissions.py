@@ -7,8 +7,9 @@ from pretalx.submission.models.submission import SubmissionStates
 def can_change_submissions(user, obj):
     if not user or user.is_anonymous or not obj or not hasattr(obj, 'event'):
         return False
-    return user.is_administrator or obj.event in user.get_events_for_permission(
-        can_change_submissions=True
+    return (
+        user.is_administrator
+        or 'can_change_submissions' in user.get_permissions_for_event(obj.event)
     )
 
 
@@ -17,7 +18,7 @@ def is_reviewer(user, obj):
     event = getattr(obj, 'event', None)
     if not user or user.is_anonymous or not obj or not event:
         return False
-    return event in user.get_events_for_permission(is_reviewer=True)
+    return 'is_reviewer' in user.get_permissions_for_event(event)
 
 
 @rules.predicate
@@ -1,4 +1,6 @@
 import json
+import uuid
+from collections import defaultdict
 from datetime import datetime, time, timedelta
 from urllib.parse import urlparse
 
@@ -10,10 +12,16 @@ from i18nfield.utils import I18nJSONEncoder
 
 from pretalx import __version__
 from pretalx.common.exporter import BaseExporter
+from pretalx.common.models.settings import GlobalSettings
 from pretalx.common.urls import get_base_url
 
 
 class ScheduleData(BaseExporter):
+    cacheable = True
+    stream_threshold = 500
+    """Exporters providing a ``stream`` method send schedules with more
+    talks than this as a streaming response."""
+
     def __init__(self, event, schedule=None):
         super().__init__(event)
         self.schedule = schedule
@@ -26,6 +34,88 @@ class ScheduleData(BaseExporter):
             'base_url': self.event.urls.schedule.full()
         }
 
+    def set_submission_uuids(self):
+        """Submission.uuid loads the instance identifier once per submission,
+        so we set the UUIDs of all talks with a single lookup instead."""
+        instance_identifier = GlobalSettings().get_instance_identifier()
+        for day in self.data:
+            for room in day['rooms']:
+                for talk in room['talks']:
+                    talk.submission.uuid = uuid.uuid5(
+                        instance_identifier, talk.submission.code
+                    )
+
+    @cached_property
+    def speaker_profiles(self):
+        """Maps user IDs to the SpeakerProfiles of all speakers in this
+        schedule, loaded in one query."""
+        from pretalx.person.models import SpeakerProfile
+
+        if not self.schedule:
+            return {}
+        return {
+            profile.user_id: profile
+            for profile in SpeakerProfile.objects.filter(
+                event=self.event, user__in=self._visible_speakers
+            )
+        }
+
+    @cached_property
+    def speaker_answers(self):
+        """Maps user IDs to the lists of their answers to this event's
+        questions, with options."""
+        from pretalx.submission.models import Answer
+
+        if not self.schedule:
+            return {}
+        return self._group_answers(
+            Answer.objects.filter(
+                question__event=self.event, person__in=self._visible_speakers
+            ),
+            'person_id',
+        )
+
+    @cached_property
+    def submission_answers(self):
+        """Maps submission IDs to the lists of their answers, with options."""
+        from pretalx.submission.models import Answer
+
+        if not self.schedule:
+            return {}
+        return self._group_answers(
+            Answer.objects.filter(
+                submission__in=self.schedule.talks.filter(is_visible=True).values(
+                    'submission'
+                )
+            ),
+            'submission_id',
+        )
+
+    @property
+    def _visible_speakers(self):
+        from pretalx.person.models import User
+
+        return User.objects.filter(
+            submissions__slots__schedule=self.schedule,
+            submissions__slots__is_visible=True,
+        )
+
+    @staticmethod
+    def _group_answers(queryset, attribute):
+        result = defaultdict(list)
+        for answer in queryset.select_related('question').prefetch_related(
+            'options'
+        ).order_by('pk'):
+            result[getattr(answer, attribute)].append(answer)
+        return result
+
+    @property
+    def should_stream(self) -> bool:
+        if not hasattr(self, 'stream'):
+            return False
+        talk_count = sum(len(room['talks']) for day in self.data for room in day['rooms'])
+        return talk_count > self.stream_threshold
+
     @cached_property
     def data(self):
         if not self.schedule:
@@ -37,7 +127,12 @@ class ScheduleData(BaseExporter):
 
         talks = (
             schedule.talks.filter(is_visible=True)
-            .select_related('submission', 'submission__event', 'room')
+            .select_related(
+                'submission',
+                'submission__submission_type',
+                'submission__track',
+                'room',
+            )
             .prefetch_related('submission__speakers')
             .order_by('start')
         )
@@ -63,6 +158,9 @@ class ScheduleData(BaseExporter):
         for talk in talks:
             if not talk.start or not talk.room:
                 continue
+            # Share the event and its settings between all talks instead of
+            # loading them once per talk
+            talk.submission.event = event
             talk_date = talk.start.astimezone(tz).date()
             if talk.start.astimezone(tz).hour < 3 and talk_date != event.date_from:
                 talk_date -= timedelta(days=1)
@@ -96,15 +194,26 @@ class FrabXmlExporter(ScheduleData):
     icon = 'fa-code'
 
     def render(self, **kwargs):
-        context = {
-            'data': self.data,
-            'metadata': self.metadata,
-            'schedule': self.schedule,
-            'event': self.event,
-            'version': __version__,
-        }
-        content = get_template('agenda/schedule.xml').render(context=context)
-        return f'{self.event.slug}-schedule.xml', 'text/xml', content
+        file_name, file_type, chunks = self.stream(**kwargs)
+        return file_name, file_type, ''.join(chunks)
+
+    def stream(self, **kwargs):
+        return f'{self.event.slug}-schedule.xml', 'text/xml', self.render_chunks()
+
+    def render_chunks(self):
+        self.set_submission_uuids()
+        yield get_template('agenda/schedule_header.xml').render(
+            context={
+                'metadata': self.metadata,
+                'schedule': self.schedule,
+                'event': self.event,
+                'version': __version__,
+            }
+        )
+        day_template = get_template('agenda/schedule_day.xml')
+        for day in self.data:
+            yield day_template.render(context={'day': day})
+        yield '</schedule>\n'
 
 
 class FrabXCalExporter(ScheduleData):
@@ -127,106 +236,113 @@ class FrabJsonExporter(ScheduleData):
     icon = '{ }'
 
     def render(self, **kwargs):
+        file_name, file_type, chunks = self.stream(**kwargs)
+        return file_name, file_type, ''.join(chunks)
+
+    def stream(self, **kwargs):
+        return f'{self.event.slug}.json', 'application/json', self.render_chunks()
+
+    def render_chunks(self):
+        """Yields the JSON document room by room. The chunks join up to
+        exactly the output of ``json.dumps`` on the complete document."""
+        self.set_submission_uuids()
         tz = pytz.timezone(self.event.timezone)
-        schedule = self.schedule
         content = {
-            'version': schedule.version,
+            'version': self.schedule.version,
             'base_url': self.metadata['base_url'],
-            'conference': {
-                'acronym': self.event.slug,
-                'title': str(self.event.name),
-                'start': self.event.date_from.strftime('%Y-%m-%d'),
-                'end': self.event.date_to.strftime('%Y-%m-%d'),
-                'daysCount': self.event.duration,
-                'timeslot_duration': '00:05',
-                'days': [
-                    {
-                        'index': day['index'],
-                        'date': day['start'].strftime('%Y-%m-%d'),
-                        'day_start': day['start'].astimezone(tz).isoformat(),
-                        'day_end': day['end'].astimezone(tz).isoformat(),
-                        'rooms': {
-                            str(room['name']): [
-                                {
-                                    'id': talk.submission.id,
-                                    'guid': talk.submission.uuid,
-                                    'logo': talk.submission.urls.image,
-                                    'date': talk.start.astimezone(tz).isoformat(),
-                                    'start': talk.start.astimezone(tz).strftime(
-                                        '%H:%M'
-                                    ),
-                                    'duration': talk.export_duration,
-                                    'room': str(room['name']),
-                                    'slug': talk.submission.code,
-                                    'url': talk.submission.urls.public.full(),
-                                    'title': talk.submission.title,
-                                    'subtitle': '',
-                                    'track': str(talk.submission.track.name)
-                                    if talk.submission.track
-                                    else None,
-                                    'type': str(talk.submission.submission_type.name),
-                                    'language': talk.submission.content_locale,
-                                    'abstract': talk.submission.abstract,
-                                    'description': talk.submission.description,
-                                    'recording_license': '',
-                                    'do_not_record': talk.submission.do_not_record,
-                                    'persons': [
-                                        {
-                                            'id': person.id,
-                                            'public_name': person.get_display_name(),
-                                            'biography': getattr(
-                                                person.profiles.filter(
-                                                    event=self.event
-                                                ).first(),
-                                                'biography',
-                                                '',
-                                            ),
-                                            'answers': [
-                                                {
-                                                    'question': answer.question.id,
-                                                    'answer': answer.answer,
-                                                    'options': [
-                                                        option.answer
-                                                        for option in answer.options.all()
-                                                    ],
-                                                }
-                                                for answer in person.answers.all()
-                                            ]
-                                            if getattr(self, 'is_orga', False)
-                                            else [],
-                                        }
-                                        for person in talk.submission.speakers.all()
-                                    ],
-                                    'links': [],
-                                    'attachments': [],
-                                    'answers': [
-                                        {
-                                            'question': answer.question.id,
-                                            'answer': answer.answer,
-                                            'options': [
-                                                option.answer
-                                                for option in answer.options.all()
-                                            ],
-                                        }
-                                        for answer in talk.submission.answers.all()
-                                    ]
-                                    if getattr(self, 'is_orga', False)
-                                    else [],
-                                }
-                                for talk in room['talks']
-                            ]
-                            for room in day['rooms']
-                        },
-                    }
-                    for day in self.data
-                ],
-            },
         }
-        return (
-            f'{self.event.slug}.json'.format(self.event.slug),
-            'application/json',
-            json.dumps({'schedule': content}, cls=I18nJSONEncoder),
-        )
+        conference = {
+            'acronym': self.event.slug,
+            'title': str(self.event.name),
+            'start': self.event.date_from.strftime('%Y-%m-%d'),
+            'end': self.event.date_to.strftime('%Y-%m-%d'),
+            'daysCount': self.event.duration,
+            'timeslot_duration': '00:05',
+        }
+        yield '{"schedule": ' + _open_json_object(content) + ', "conference": '
+        yield _open_json_object(conference) + ', "days": ['
+        for day_index, day in enumerate(self.data):
+            day_data = {
+                'index': day['index'],
+                'date': day['start'].strftime('%Y-%m-%d'),
+                'day_start': day['start'].astimezone(tz).isoformat(),
+                'day_end': day['end'].astimezone(tz).isoformat(),
+            }
+            yield (', ' if day_index else '') + _open_json_object(day_data) + ', "rooms": {'
+            for room_index, room in enumerate(day['rooms']):
+                talks = ', '.join(
+                    _dump_json(self.get_talk_data(talk, room, tz))
+                    for talk in room['talks']
+                )
+                yield '{}{}: [{}]'.format(
+                    ', ' if room_index else '', _dump_json(str(room['name'])), talks
+                )
+            yield '}}'
+        yield ']}}}'
+
+    def get_talk_data(self, talk, room, tz):
+        is_orga = getattr(self, 'is_orga', False)
+        return {
+            'id': talk.submission.id,
+            'guid': talk.submission.uuid,
+            'logo': talk.submission.urls.image,
+            'date': talk.start.astimezone(tz).isoformat(),
+            'start': talk.start.astimezone(tz).strftime('%H:%M'),
+            'duration': talk.export_duration,
+            'room': str(room['name']),
+            'slug': talk.submission.code,
+            'url': talk.submission.urls.public.full(),
+            'title': talk.submission.title,
+            'subtitle': '',
+            'track': str(talk.submission.track.name) if talk.submission.track else None,
+            'type': str(talk.submission.submission_type.name),
+            'language': talk.submission.content_locale,
+            'abstract': talk.submission.abstract,
+            'description': talk.submission.description,
+            'recording_license': '',
+            'do_not_record': talk.submission.do_not_record,
+            'persons': [
+                {
+                    'id': person.id,
+                    'public_name': person.get_display_name(),
+                    'biography': getattr(
+                        self.speaker_profiles.get(person.id), 'biography', ''
+                    ),
+                    'answers': [
+                        self.get_answer_data(answer)
+                        for answer in self.speaker_answers.get(person.id, [])
+                    ]
+                    if is_orga
+                    else [],
+                }
+                for person in talk.submission.speakers.all()
+            ],
+            'links': [],
+            'attachments': [],
+            'answers': [
+                self.get_answer_data(answer)
+                for answer in self.submission_answers.get(talk.submission.id, [])
+            ]
+            if is_orga
+            else [],
+        }
+
+    @staticmethod
+    def get_answer_data(answer):
+        return {
+            'question': answer.question.id,
+            'answer': answer.answer,
+            'options': [option.answer for option in answer.options.all()],
+        }
+
+
+def _dump_json(obj):
+    return json.dumps(obj, cls=I18nJSONEncoder)
+
+
+def _open_json_object(obj: dict) -> str:
+    """Serializes a non-empty dict, leaving the object open for more keys."""
+    return _dump_json(obj)[:-1]
 
 
 class ICalExporter(BaseExporter):
@@ -234,6 +350,7 @@ class ICalExporter(BaseExporter):
     verbose_name = 'iCal'
     public = True
     icon = 'fa-calendar'
+    cacheable = True
 
     def __init__(self, event, schedule=None):
         super().__init__(event)
@@ -0,0 +1,68 @@
+"""Set operations on lists of ``(start, end)`` intervals.
+
+The functions work on any comparable values, usually datetimes, and return
+their results as sorted lists of disjoint intervals. Overlapping and
+directly adjacent intervals are merged, like ``Availability.merge_with``
+does it.
+"""
+from typing import Any, Iterable, List, Tuple
+
+Interval = Tuple[Any, Any]
+
+
+def union(intervals: Iterable[Interval]) -> List[Interval]:
+    """Return the minimal sorted list of intervals covering all given
+    intervals."""
+    result = []
+    for start, end in sorted(intervals):
+        if result and start <= result[-1][1]:
+            if end > result[-1][1]:
+                result[-1] = (result[-1][0], end)
+        else:
+            result.append((start, end))
+    return result
+
+
+def _pair_intersection(
+    intervals_a: List[Interval], intervals_b: List[Interval]
+) -> List[Interval]:
+    """Sweep over two results of ``union`` at once, in O(a+b) time."""
+    result = []
+    index_a = index_b = 0
+    while index_a < len(intervals_a) and index_b < len(intervals_b):
+        start_a, end_a = intervals_a[index_a]
+        start_b, end_b = intervals_b[index_b]
+        start, end = max(start_a, start_b), min(end_a, end_b)
+        if start < end:
+            result.append((start, end))
+        if end_a < end_b:
+            index_a += 1
+        else:
+            index_b += 1
+    return result
+
+
+def intersection(*interval_sets: Iterable[Interval]) -> List[Interval]:
+    """Return the sorted list of intervals covered by each of the given sets.
+    Intervals that only touch do not intersect."""
+    if not interval_sets:
+        return []
+    result = union(interval_sets[0])
+    for interval_set in interval_sets[1:]:
+        if not result:
+            break
+        result = _pair_intersection(result, union(interval_set))
+    return result
+
+
+def contains(intervals: List[Interval], start: Any, end: Any) -> bool:
+    """Test if the result of ``union`` covers the range from start to end
+    completely, in O(log n) time."""
+    low, high = 0, len(intervals)
+    while low < high:  # Find the last interval starting no later than start
+        middle = (low + high) // 2
+        if intervals[middle][0] <= start:
+            low = middle + 1
+        else:
+            high = middle
+    return low > 0 and intervals[low - 1][1] >= end
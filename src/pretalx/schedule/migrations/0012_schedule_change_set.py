@@ -0,0 +1,18 @@
+# Generated by Django 2.1.15 on 2026-10-16 22:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0011_auto_20180205_1127'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='change_set',
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.1.15 on 2026-10-16 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0012_schedule_change_set'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='revision',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='talkslot',
+            name='revision',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
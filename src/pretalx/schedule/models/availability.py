@@ -5,6 +5,7 @@ from django.db import models
 from django.utils.functional import cached_property
 
 from pretalx.common.mixins import LogMixin
+from pretalx.schedule import intervals
 
 zerotime = datetime.time(0, 0)
 
@@ -107,57 +108,27 @@ class Availability(LogMixin, models.Model):
         return self.intersect_with(other)
 
     @classmethod
-    def union(cls, availabilities: List['Availability']) -> List['Availability']:
-        """ Return the minimal list of Availability objects which are covered by at least one given Availability """
-        if not availabilities:
-            return []
-
-        availabilities = sorted(availabilities, key=lambda a: a.start)
-        result = [availabilities[0]]
-        availabilities = availabilities[1:]
-
-        for avail in availabilities:
-            if avail.overlaps(result[-1], False):
-                result[-1] = result[-1].merge_with(avail)
-            else:
-                result.append(avail)
-
-        return result
+    def from_intervals(cls, ranges: List[tuple]) -> List['Availability']:
+        """ Return unsaved Availabilities for a list of (start, end) tuples """
+        return [cls(start=start, end=end) for start, end in ranges]
 
     @classmethod
-    def _pair_intersection(
-        cls,
-        availabilities_a: List['Availability'],
-        availabilities_b: List['Availability'],
-    ) -> List['Availability']:
-        """ return the list of Availabilities, which are covered by each of the given sets """
-        result = []
-
-        # yay for O(b*a) time! I am sure there is some fancy trick to make this faster,
-        # but we're dealing with less than 100 items in total, sooo.. ¯\_(ツ)_/¯
-        for a in availabilities_a:
-            for b in availabilities_b:
-                if a.overlaps(b, True):
-                    result.append(a.intersect_with(b))
-
-        return result
+    def union(cls, availabilities: List['Availability']) -> List['Availability']:
+        """ Return the minimal list of Availability objects which are covered by at least one given Availability """
+        return cls.from_intervals(
+            intervals.union((avail.start, avail.end) for avail in availabilities)
+        )
 
     @classmethod
     def intersection(
         cls, *availabilitysets: List['Availability']
     ) -> List['Availability']:
         """ Return the list of Availabilities which are covered by all of the given sets """
-
-        # get rid of any overlaps and unmerged ranges in each set
-        availabilitysets = [cls.union(avialset) for avialset in availabilitysets]
-        # bail out for obvious cases (there are no sets given, one of the sets is empty)
-        if not availabilitysets:
-            return []
-        if not all(availabilitysets):
-            return []
-        # start with the very first set ...
-        result = availabilitysets[0]
-        for availset in availabilitysets[1:]:
-            # ... subtract each of the other sets
-            result = cls._pair_intersection(result, availset)
-        return result
+        return cls.from_intervals(
+            intervals.intersection(
+                *[
+                    [(avail.start, avail.end) for avail in availset]
+                    for availset in availabilitysets
+                ]
+            )
+        )
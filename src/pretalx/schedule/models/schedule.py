@@ -1,19 +1,27 @@
+import json
 from collections import defaultdict
 from contextlib import suppress
+from datetime import timedelta
+from itertools import islice
 from urllib.parse import quote
 
 import pytz
+from django.conf import settings
 from django.db import models, transaction
 from django.template.loader import get_template
+from django.utils.dateparse import parse_datetime
 from django.utils.functional import cached_property
 from django.utils.timezone import now, override as tzoverride
 from django.utils.translation import override, ugettext_lazy as _
 
-from pretalx.agenda.tasks import export_schedule_html
+from pretalx.agenda.tasks import (
+    export_schedule_html, notify_schedule_speakers, prerender_schedule_exports,
+)
 from pretalx.common.mixins import LogMixin
 from pretalx.common.urls import EventUrls
 from pretalx.mail.models import QueuedMail
 from pretalx.person.models import User
+from pretalx.schedule import intervals
 from pretalx.submission.models import SubmissionStates
 
 
@@ -25,6 +33,8 @@ class Schedule(LogMixin, models.Model):
         max_length=190, null=True, blank=True, verbose_name=_('version')
     )
     published = models.DateTimeField(null=True, blank=True)
+    change_set = models.TextField(null=True, blank=True)
+    revision = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ('-published',)
@@ -35,8 +45,6 @@ class Schedule(LogMixin, models.Model):
 
     @transaction.atomic
     def freeze(self, name, user=None, notify_speakers=True):
-        from pretalx.schedule.models import TalkSlot
-
         if name in ['wip', 'latest']:
             raise Exception(f'Cannot use reserved name "{name}" for schedule version.')
         if self.version:
@@ -51,7 +59,9 @@ class Schedule(LogMixin, models.Model):
         self.save(update_fields=['published', 'version'])
         self.log_action('pretalx.schedule.release', person=user, orga=True)
 
-        wip_schedule = Schedule.objects.create(event=self.event)
+        wip_schedule = Schedule.objects.create(
+            event=self.event, revision=self.bump_revision()
+        )
 
         # Set visibility
         self.talks.filter(
@@ -63,13 +73,17 @@ class Schedule(LogMixin, models.Model):
             start__isnull=False, submission__state=SubmissionStates.CONFIRMED
         ).update(is_visible=False)
 
-        talks = []
-        for talk in self.talks.select_related('submission', 'room').all():
-            talks.append(talk.copy_to_schedule(wip_schedule, save=False))
-        TalkSlot.objects.bulk_create(talks)
+        self.changes = self._compute_changes()
+        self._store_changes(self.changes)
+
+        self.talks.all().copy_to_schedule(wip_schedule)
 
         if notify_speakers:
-            self.notify_speakers()
+            transaction.on_commit(
+                lambda: notify_schedule_speakers.apply_async(
+                    kwargs={'schedule_id': self.pk}
+                )
+            )
 
         with suppress(AttributeError):
             del wip_schedule.event.wip_schedule
@@ -78,36 +92,61 @@ class Schedule(LogMixin, models.Model):
 
         if self.event.settings.export_html_on_schedule_release:
             export_schedule_html.apply_async(kwargs={'event_id': self.event.id})
+        if settings.REAL_CACHE_USED:
+            transaction.on_commit(
+                lambda: prerender_schedule_exports.apply_async(
+                    kwargs={'schedule_id': self.pk}
+                )
+            )
 
         return self, wip_schedule
 
     @transaction.atomic
     def unfreeze(self, user=None):
-        from pretalx.schedule.models import TalkSlot
-
         if not self.version:
             raise Exception('Cannot unfreeze schedule version: not released yet.')
 
-        # collect all talks, which have been added since this schedule (#72)
-        submission_ids = self.talks.all().values_list('submission_id', flat=True)
-        talks = self.event.wip_schedule.talks.exclude(
-            submission_id__in=submission_ids
-        ).union(self.talks.all())
-
-        wip_schedule = Schedule.objects.create(event=self.event)
-        new_talks = []
-        for talk in talks:
-            new_talks.append(talk.copy_to_schedule(wip_schedule, save=False))
-        TalkSlot.objects.bulk_create(new_talks)
+        old_wip_schedule = self.event.wip_schedule
+        wip_schedule = Schedule.objects.create(
+            event=self.event, revision=old_wip_schedule.bump_revision()
+        )
+        self.talks.all().copy_to_schedule(wip_schedule)
+        # copy all talks, which have been added since this schedule (#72)
+        old_wip_schedule.talks.exclude(
+            submission_id__in=self.talks.all().values('submission_id')
+        ).copy_to_schedule(wip_schedule)
 
-        self.event.wip_schedule.talks.all().delete()
-        self.event.wip_schedule.delete()
+        old_wip_schedule.talks.all().delete()
+        old_wip_schedule.delete()
 
         with suppress(AttributeError):
             del wip_schedule.event.wip_schedule
 
         return self, wip_schedule
 
+    def bump_revision(self) -> int:
+        """Increments the revision counter of this schedule, which allows
+        the schedule editor to load only the talks that changed since the
+        revision it knows."""
+        Schedule.objects.filter(pk=self.pk).update(revision=models.F('revision') + 1)
+        self.refresh_from_db(fields=['revision'])
+        return self.revision
+
+    @staticmethod
+    def bump_wip_revision(schedule_id: int):
+        """Increments the revision counter of the schedule with this ID if it
+        is a WIP schedule, and returns the new revision, or None for released
+        schedules, which never change."""
+        if Schedule.objects.filter(pk=schedule_id, version__isnull=True).update(
+            revision=models.F('revision') + 1
+        ):
+            return (
+                Schedule.objects.filter(pk=schedule_id)
+                .values_list('revision', flat=True)
+                .get()
+            )
+        return None
+
     @cached_property
     def scheduled_talks(self):
         return self.talks.filter(
@@ -131,6 +170,17 @@ class Schedule(LogMixin, models.Model):
 
     @cached_property
     def changes(self):
+        """Released schedules store their changes when they are frozen.
+        Schedules released before that, and the WIP schedule, compute them
+        from their talks instead."""
+        if self.change_set is not None:
+            return self._load_changes(json.loads(self.change_set))
+        result = self._compute_changes()
+        if self.version:
+            self._store_changes(result)
+        return result
+
+    def _compute_changes(self):
         tz = pytz.timezone(self.event.timezone)
         result = {
             'count': 0,
@@ -187,6 +237,8 @@ class Schedule(LogMixin, models.Model):
                             'new_start': new_slot.start.astimezone(tz),
                             'old_room': old_slot.room.name,
                             'new_room': new_slot.room.name,
+                            'old_room_id': old_slot.room_id,
+                            'new_room_id': new_slot.room_id,
                             'new_info': new_slot.room.speaker_info,
                         }
                     )
@@ -198,10 +250,226 @@ class Schedule(LogMixin, models.Model):
         )
         return result
 
+    def _store_changes(self, changes):
+        self.change_set = json.dumps(
+            {
+                'action': changes['action'],
+                'new_talks': [talk.pk for talk in changes['new_talks']],
+                'canceled_talks': [talk.pk for talk in changes['canceled_talks']],
+                'moved_talks': [
+                    {
+                        'submission': talk['submission'].pk,
+                        'old_start': talk['old_start'].isoformat(),
+                        'new_start': talk['new_start'].isoformat(),
+                        'old_room': talk['old_room_id'],
+                        'new_room': talk['new_room_id'],
+                    }
+                    for talk in changes['moved_talks']
+                ],
+            }
+        )
+        self.save(update_fields=['change_set'])
+
+    def _load_changes(self, change_set):
+        from pretalx.schedule.models import Room, TalkSlot
+        from pretalx.submission.models import Submission
+
+        tz = pytz.timezone(self.event.timezone)
+        result = {
+            'count': 0,
+            'action': change_set['action'],
+            'new_talks': [],
+            'canceled_talks': [],
+            'moved_talks': [],
+        }
+        slots = {
+            talk.pk: talk
+            for talk in TalkSlot.objects.filter(
+                pk__in=change_set['new_talks'] + change_set['canceled_talks']
+            ).select_related('submission', 'submission__event', 'room')
+            if not talk.submission.is_deleted
+        }
+        for key in ('new_talks', 'canceled_talks'):
+            result[key] = [slots[pk] for pk in change_set[key] if pk in slots]
+
+        moved_talks = change_set['moved_talks']
+        submissions = Submission.objects.select_related('event').in_bulk(
+            [talk['submission'] for talk in moved_talks]
+        )
+        rooms = Room.objects.in_bulk(
+            [talk['old_room'] for talk in moved_talks]
+            + [talk['new_room'] for talk in moved_talks]
+        )
+        for talk in moved_talks:
+            submission = submissions.get(talk['submission'])
+            if not submission:
+                continue
+            old_room = rooms[talk['old_room']]
+            new_room = rooms[talk['new_room']]
+            result['moved_talks'].append(
+                {
+                    'submission': submission,
+                    'old_start': parse_datetime(talk['old_start']).astimezone(tz),
+                    'new_start': parse_datetime(talk['new_start']).astimezone(tz),
+                    'old_room': old_room.name,
+                    'new_room': new_room.name,
+                    'old_room_id': old_room.pk,
+                    'new_room_id': new_room.pk,
+                    'new_info': new_room.speaker_info,
+                }
+            )
+
+        result['count'] = (
+            len(result['new_talks'])
+            + len(result['canceled_talks'])
+            + len(result['moved_talks'])
+        )
+        return result
+
+    def _get_availabilities(self, talks, speaker_ids):
+        """Returns the merged availabilities of the rooms of the given talks
+        and of the given speakers, keyed by room and user ID."""
+        from pretalx.person.models import SpeakerProfile
+        from pretalx.schedule.models import Availability
+
+        profiles = dict(
+            SpeakerProfile.objects.filter(
+                event=self.event, user__in=speaker_ids
+            ).values_list('pk', 'user_id')
+        )
+        room_availabilities = defaultdict(list)
+        speaker_availabilities = defaultdict(list)
+        for room_id, person_id, start, end in Availability.objects.filter(
+            models.Q(room__in={talk.room_id for talk in talks if talk.room_id})
+            | models.Q(person__in=profiles)
+        ).values_list('room_id', 'person_id', 'start', 'end'):
+            if room_id:
+                room_availabilities[room_id].append((start, end))
+            else:
+                speaker_availabilities[profiles[person_id]].append((start, end))
+        return (
+            {key: intervals.union(value) for key, value in room_availabilities.items()},
+            {
+                key: intervals.union(value)
+                for key, value in speaker_availabilities.items()
+            },
+        )
+
+    def _get_speaker_talks(self, speaker_ids):
+        """Returns the scheduled accepted and confirmed talks of the given
+        speakers as (pk, start, end) tuples, keyed by user ID."""
+        speaker_talks = defaultdict(list)
+        for pk, start, end, duration, default_duration, speaker in self.talks.filter(
+            start__isnull=False,
+            room__isnull=False,
+            submission__state__in=[
+                SubmissionStates.ACCEPTED,
+                SubmissionStates.CONFIRMED,
+            ],
+            submission__speakers__in=speaker_ids,
+        ).values_list(
+            'pk',
+            'start',
+            'end',
+            'submission__duration',
+            'submission__submission_type__default_duration',
+            'submission__speakers',
+        ):
+            if not end:
+                end = start + timedelta(
+                    minutes=default_duration if duration is None else duration
+                )
+            speaker_talks[speaker].append((pk, start, end))
+        return speaker_talks
+
+    @staticmethod
+    def _get_room_warning(talk, room_availabilities):
+        if talk.room_id and not intervals.contains(
+            room_availabilities.get(talk.room_id, []), talk.start, talk.real_end
+        ):
+            return {
+                'type': 'room',
+                'message': _('The room is not available at the scheduled time.'),
+            }
+
+    @staticmethod
+    def _get_speaker_warning(talk, speaker, speaker_availabilities):
+        availabilities = speaker_availabilities.get(speaker.pk)
+        if availabilities and not intervals.contains(
+            availabilities, talk.start, talk.real_end
+        ):
+            return {
+                'type': 'speaker',
+                'speaker': {'name': speaker.get_display_name(), 'id': speaker.pk},
+                'message': _('A speaker is not available at the scheduled time.'),
+            }
+
+    @staticmethod
+    def _get_speaker_booked_warning(talk, speaker, speaker_talks):
+        start, end = talk.start, talk.real_end
+        if talk.room_id and any(
+            other_start < end and start < other_end
+            for pk, other_start, other_end in speaker_talks[speaker.pk]
+            if pk != talk.pk
+        ):
+            return {
+                'type': 'speaker_booked',
+                'speaker': {'name': speaker.get_display_name(), 'id': speaker.pk},
+                'message': _('A speaker is giving another talk at the scheduled time.'),
+            }
+
+    def get_talk_warnings(self, talks=None) -> dict:
+        """Returns a dict mapping the IDs of the given talks (all talks of this
+        schedule by default) to lists of their warnings.
+
+        All room and speaker availabilities and the schedule's other talks
+        are loaded once, so that the number of queries doesn't depend on the
+        number of talks."""
+        if talks is None:
+            talks = self.talks.select_related(
+                'submission', 'submission__submission_type'
+            ).prefetch_related('submission__speakers')
+        talks = list(talks)
+        result = {talk.pk: [] for talk in talks}
+        talks = [talk for talk in talks if talk.start]
+        if not talks:
+            return result
+
+        speakers = {
+            talk.pk: list(talk.submission.speakers.all()) for talk in talks
+        }
+        speaker_ids = {
+            speaker.pk for talk_speakers in speakers.values() for speaker in talk_speakers
+        }
+        room_availabilities, speaker_availabilities = self._get_availabilities(
+            talks, speaker_ids
+        )
+        speaker_talks = self._get_speaker_talks(speaker_ids)
+
+        for talk in talks:
+            warnings = [self._get_room_warning(talk, room_availabilities)]
+            for speaker in speakers[talk.pk]:
+                warnings.append(
+                    self._get_speaker_warning(talk, speaker, speaker_availabilities)
+                )
+                warnings.append(
+                    self._get_speaker_booked_warning(talk, speaker, speaker_talks)
+                )
+            result[talk.pk] = [warning for warning in warnings if warning]
+        return result
+
     @cached_property
     def warnings(self):
         warnings = {'talk_warnings': [], 'unscheduled': [], 'unconfirmed': [], 'no_track': []}
-        for talk in self.talks.all():
+        talks = list(
+            self.talks.select_related(
+                'submission', 'submission__submission_type', 'submission__track'
+            ).prefetch_related('submission__speakers')
+        )
+        talk_warnings = self.get_talk_warnings(talks)
+        for talk in talks:
+            talk.submission.event = self.event
+            talk.warnings = talk_warnings[talk.pk]
             if not talk.start:
                 warnings['unscheduled'].append(talk)
             elif talk.warnings:
@@ -235,29 +503,42 @@ class Schedule(LogMixin, models.Model):
                 speakers[speaker]['update'].append(moved_talk)
         return speakers
 
-    @cached_property
-    def notifications(self):
+    def get_notifications(self):
+        """Yields one unsaved QueuedMail per speaker concerned by this
+        schedule."""
         tz = pytz.timezone(self.event.timezone)
-        mails = []
+        template = get_template('schedule/speaker_notification.txt')
         for speaker in self.speakers_concerned:
             with override(speaker.locale), tzoverride(tz):
-                text = get_template('schedule/speaker_notification.txt').render(
+                text = template.render(
                     {'speaker': speaker, **self.speakers_concerned[speaker]}
                 )
-            mails.append(
-                QueuedMail(
-                    event=self.event,
-                    to=speaker.email,
-                    reply_to=self.event.email,
-                    subject=_('New schedule!').format(event=self.event.slug),
-                    text=text,
-                )
+            yield QueuedMail(
+                event=self.event,
+                to=speaker.email,
+                reply_to=self.event.email,
+                subject=_('New schedule!').format(event=self.event.slug),
+                text=text,
             )
-        return mails
 
-    def notify_speakers(self):
-        for notification in self.notifications:
-            notification.save()
+    @cached_property
+    def notifications(self):
+        return list(self.get_notifications())
+
+    def notify_speakers(self, batch_size=100, progress=None):
+        """Places the notifications in the outbox, ``batch_size`` mails at a
+        time. ``progress`` is called with the number of mails saved so far
+        after each batch."""
+        notifications = self.get_notifications()
+        done = 0
+        while True:
+            batch = list(islice(notifications, batch_size))
+            if not batch:
+                break
+            QueuedMail.objects.bulk_create(batch)
+            done += len(batch)
+            if progress:
+                progress(done)
 
     @cached_property
     def url_version(self):
@@ -2,14 +2,51 @@ from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
 import pytz
-from django.db import models
+from django.db import connection, models
 from django.utils.functional import cached_property
-from django.utils.translation import ugettext_lazy as _
 
 from pretalx.common.mixins import LogMixin
 from pretalx.common.urls import get_base_url
 
 
+class TalkSlotQuerySet(models.QuerySet):
+    def copy_to_schedule(self, new_schedule):
+        """Copies all slots in this queryset to another schedule with a
+        single INSERT … SELECT, without loading them into memory. The copies
+        get the current revision of the new schedule."""
+        fields = [
+            field
+            for field in self.model._meta.concrete_fields
+            if field.name not in ('id', 'schedule', 'revision')
+        ]
+        select, params = (
+            self.order_by()
+            .annotate(
+                new_schedule=models.Value(
+                    new_schedule.pk, output_field=models.IntegerField()
+                ),
+                new_revision=models.Value(
+                    new_schedule.revision, output_field=models.IntegerField()
+                ),
+            )
+            .values_list(
+                *[field.attname for field in fields], 'new_schedule', 'new_revision'
+            )
+            .query.sql_with_params()
+        )
+        columns = ', '.join(
+            connection.ops.quote_name(column)
+            for column in [field.column for field in fields]
+            + [
+                self.model._meta.get_field('schedule').column,
+                self.model._meta.get_field('revision').column,
+            ]
+        )
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f'INSERT INTO {table} ({columns}) {select}', params)
+
+
 class TalkSlot(LogMixin, models.Model):
     submission = models.ForeignKey(
         to='submission.Submission', on_delete=models.PROTECT, related_name='slots'
@@ -27,6 +64,9 @@ class TalkSlot(LogMixin, models.Model):
     is_visible = models.BooleanField()
     start = models.DateTimeField(null=True)
     end = models.DateTimeField(null=True)
+    revision = models.PositiveIntegerField(default=0)
+
+    objects = TalkSlotQuerySet.as_manager()
 
     class Meta:
         unique_together = (('submission', 'schedule'),)
@@ -35,6 +75,24 @@ class TalkSlot(LogMixin, models.Model):
         """Help when debugging."""
         return f'TalkSlot(event={self.submission.event.slug}, submission={self.submission.title}, schedule={self.schedule.version})'
 
+    def save(self, *args, **kwargs):
+        # Mark slots of the WIP schedule as changed in a new revision, so that
+        # the schedule editor loads them again. Slots of released schedules
+        # are skipped without a query if their schedule is already loaded.
+        schedule = self.schedule if TalkSlot.schedule.is_cached(self) else None
+        if not schedule or not schedule.version:
+            schedule_model = TalkSlot.schedule.field.related_model
+            revision = schedule_model.bump_wip_revision(self.schedule_id)
+            if revision is not None:
+                self.revision = revision
+                if schedule:
+                    schedule.revision = revision
+                if kwargs.get('update_fields'):
+                    kwargs['update_fields'] = list(kwargs['update_fields']) + [
+                        'revision'
+                    ]
+        super().save(*args, **kwargs)
+
     @cached_property
     def event(self):
         return self.submission.event
@@ -76,42 +134,7 @@ class TalkSlot(LogMixin, models.Model):
 
     @cached_property
     def warnings(self):
-        if not self.start:
-            return []
-        warnings = []
-        availability = self.as_availability
-        if self.room:
-            if not any(
-                room_availability.contains(availability)
-                for room_availability in self.room.availabilities.all()
-            ):
-                warnings.append(
-                    {
-                        'type': 'room',
-                        'message': _(
-                            'The room is not available at the scheduled time.'
-                        ),
-                    }
-                )
-        for speaker in self.submission.speakers.all():
-            profile = speaker.event_profile(event=self.submission.event)
-            if profile.availabilities.exists() and not any(
-                speaker_availability.contains(availability)
-                for speaker_availability in profile.availabilities.all()
-            ):
-                warnings.append(
-                    {
-                        'type': 'speaker',
-                        'speaker': {
-                            'name': speaker.get_display_name(),
-                            'id': speaker.pk,
-                        },
-                        'message': _(
-                            'A speaker is not available at the scheduled time.'
-                        ),
-                    }
-                )
-        return warnings
+        return self.schedule.get_talk_warnings([self])[self.pk]
 
     def copy_to_schedule(self, new_schedule, save=True):
         new_slot = TalkSlot(schedule=new_schedule)
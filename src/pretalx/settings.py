@@ -229,7 +229,16 @@ else:
 
 ## CACHE SETTINGS
 CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
-REAL_CACHE_USED = False
+REAL_CACHE_USED = False  # True if the cache is shared between all processes
+if config.getboolean('local_cache', 'enabled'):
+    CACHES['default'] = {
+        'BACKEND': 'pretalx.common.cache_backends.LocalCache',
+        'OPTIONS': {
+            'MAX_ENTRIES': config.getint('local_cache', 'max_entries'),
+            'MAX_SIZE': config.getint('local_cache', 'max_size') * 1024 * 1024,
+            'MAX_TIMEOUT': config.getint('local_cache', 'max_timeout'),
+        },
+    }
 SESSION_ENGINE = None
 
 HAS_MEMCACHED = bool(os.getenv('PRETALX_MEMCACHE', ''))
@@ -435,7 +444,7 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'django_filters.rest_framework.DjangoFilterBackend',
     ),
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
+    'DEFAULT_PAGINATION_CLASS': 'pretalx.api.pagination.ApiPagination',
     'PAGE_SIZE': 25,
     'SEARCH_PARAM': 'q',
     'ORDERING_PARAM': 'o',
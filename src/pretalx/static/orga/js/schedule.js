@@ -25,8 +25,11 @@ var api = {
       return Promise.reject(error)
     })
   },
-  fetchTalks () {
+  fetchTalks (since) {
     var url = [window.location.protocol, '//', window.location.host, window.location.pathname, 'api/talks/', window.location.search].join('')
+    if (since !== undefined) {
+      url += (window.location.search ? '&' : '?') + 'since=' + since
+    }
     return api.http('GET', url, null)
   },
   fetchRooms (eventSlug) {
@@ -293,15 +296,18 @@ var app = new Vue({
       end: null,
       timezone: null,
       search: '',
+      revision: null,
       dragController: dragController,
     }
   },
   created () {
     api.fetchTalks().then((result) => {
       this.talks = result.results
+      this.revision = result.revision
       this.timezone = result.timezone
       this.start = moment.tz(result.start, this.timezone)
       this.end = moment.tz(result.end, this.timezone)
+      window.setInterval(this.syncTalks, 10000)
     })
     api.fetchRooms(this.eventSlug).then((result) => {
       this.rooms = result.results
@@ -329,6 +335,27 @@ var app = new Vue({
     }
   },
   methods: {
+    syncTalks () {
+      if (dragController.draggedTalk)
+        return
+      api.fetchTalks(this.revision).then((result) => {
+        if (dragController.draggedTalk)
+          return
+        if (result.ids) {
+          const ids = new Set(result.ids)
+          this.talks = this.talks.filter(talk => ids.has(talk.id))
+        }
+        result.results.forEach((changedTalk) => {
+          const index = this.talks.findIndex(talk => talk.id == changedTalk.id)
+          if (index > -1) {
+            Object.assign(this.talks[index], changedTalk)
+          } else {
+            this.talks.push(changedTalk)
+          }
+        })
+        this.revision = result.revision
+      })
+    },
     onMouseMove (event) {
       if (dragController.draggedTalk) {
         dragController.event = event
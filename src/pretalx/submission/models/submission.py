@@ -2,9 +2,10 @@ import re
 import string
 import uuid
 import warnings
+from copy import copy
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils.crypto import get_random_string
 from django.utils.functional import cached_property
 from django.utils.timezone import now
@@ -16,7 +17,9 @@ from pretalx.common.models.settings import GlobalSettings
 from pretalx.common.phrases import phrases
 from pretalx.common.urls import EventUrls
 from pretalx.mail.context import template_context_from_submission
-from pretalx.submission.signals import submission_state_change
+from pretalx.submission.signals import (
+    submission_state_change, submission_state_change_bulk,
+)
 
 
 def generate_invite_code(length=32):
@@ -177,6 +180,7 @@ class Submission(LogMixin, models.Model):
     review_code = models.CharField(
         max_length=32, unique=True, null=True, blank=True, default=generate_invite_code
     )
+    updated = models.DateTimeField(auto_now=True, null=True)
     CODE_CHARSET = list('ABCDEFGHJKLMNPQRSTUVWXYZ3789')
 
     objects = SubmissionManager()
@@ -232,6 +236,8 @@ class Submission(LogMixin, models.Model):
     def save(self, *args, **kwargs):
         if not self.code:
             self.assign_code()
+        if kwargs.get('update_fields'):
+            kwargs['update_fields'] = list(kwargs['update_fields']) + ['updated']
         super().save(*args, **kwargs)
 
     @property
@@ -288,13 +294,19 @@ class Submission(LogMixin, models.Model):
                 )
             )
 
-    def make_submitted(self, person=None, force=False, orga=False):
-        self._set_state(SubmissionStates.SUBMITTED, force, person=person)
+    def _remove_wip_slot(self):
         from pretalx.schedule.models import TalkSlot
 
-        TalkSlot.objects.filter(
-            submission=self, schedule=self.event.wip_schedule
+        wip_schedule = self.event.wip_schedule
+        deleted, _ = TalkSlot.objects.filter(
+            submission=self, schedule=wip_schedule
         ).delete()
+        if deleted:
+            wip_schedule.bump_revision()
+
+    def make_submitted(self, person=None, force=False, orga=False):
+        self._set_state(SubmissionStates.SUBMITTED, force, person=person)
+        self._remove_wip_slot()
 
     def confirm(self, person=None, force=False, orga=False):
         self._set_state(SubmissionStates.CONFIRMED, force, person=person)
@@ -334,11 +346,7 @@ class Submission(LogMixin, models.Model):
         self._set_state(SubmissionStates.REJECTED, force, person=person)
         self.log_action('pretalx.submission.reject', person=person, orga=True)
 
-        from pretalx.schedule.models import TalkSlot
-
-        TalkSlot.objects.filter(
-            submission=self, schedule=self.event.wip_schedule
-        ).delete()
+        self._remove_wip_slot()
 
         for speaker in self.speakers.all():
             self.event.reject_template.to_mail(
@@ -348,34 +356,151 @@ class Submission(LogMixin, models.Model):
                 locale=self.content_locale,
             )
 
+    @staticmethod
+    def _get_bulk_action(event, new_state) -> tuple:
+        if new_state == SubmissionStates.ACCEPTED:
+            return 'pretalx.submission.accept', event.accept_template
+        if new_state == SubmissionStates.REJECTED:
+            return 'pretalx.submission.reject', event.reject_template
+        raise ValueError(f'Submissions cannot be set to {new_state} in bulk.')
+
+    @classmethod
+    def _bulk_update_state(cls, event, submissions, new_state) -> tuple:
+        """Moves all of the given submissions that can be moved to the new
+        state with one UPDATE, and returns them with their old states."""
+        if not isinstance(submissions, models.QuerySet):
+            submissions = [getattr(sub, 'pk', sub) for sub in submissions]
+        source_states = [
+            state
+            for state, next_states in SubmissionStates.valid_next_states.items()
+            if new_state in next_states
+        ]
+        changed = list(
+            event.submissions.filter(pk__in=submissions, state__in=source_states)
+            .prefetch_related('speakers')
+            .order_by('pk')
+        )
+        old_states = {submission.pk: submission.state for submission in changed}
+        if changed:
+            cls.objects.filter(pk__in=old_states).update(state=new_state, updated=now())
+        for submission in changed:
+            submission.event = event
+            submission.state = new_state
+        return changed, old_states
+
+    @staticmethod
+    def _bulk_update_slots(event, changed, new_state):
+        from pretalx.schedule.models import TalkSlot
+
+        wip_schedule = event.wip_schedule
+        slots = TalkSlot.objects.filter(submission__in=changed, schedule=wip_schedule)
+        if new_state != SubmissionStates.ACCEPTED:
+            if slots.delete()[0]:
+                wip_schedule.bump_revision()
+            return
+        revision = wip_schedule.bump_revision()
+        scheduled = set(slots.values_list('submission_id', flat=True))
+        slots.update(is_visible=True, revision=revision)
+        TalkSlot.objects.bulk_create(
+            TalkSlot(
+                submission=submission,
+                schedule=wip_schedule,
+                is_visible=True,
+                revision=revision,
+            )
+            for submission in changed
+            if submission.pk not in scheduled
+        )
+
+    @classmethod
+    def _bulk_log(cls, event, changed, action, person):
+        from django.contrib.contenttypes.models import ContentType
+
+        from pretalx.common.models import ActivityLog
+
+        content_type = ContentType.objects.get_for_model(cls)
+        ActivityLog.objects.bulk_create(
+            ActivityLog(
+                event=event,
+                person=person,
+                content_type=content_type,
+                object_id=submission.pk,
+                action_type=action,
+                is_orga_action=True,
+            )
+            for submission in changed
+        )
+
+    @staticmethod
+    def _bulk_build_mails(event, changed, old_states, template) -> list:
+        """Renders the template once per submission, and returns unsaved
+        copies of the mail for each of its speakers. Speakers of confirmed
+        submissions are not notified, like in ``reject``."""
+        mails = []
+        for submission in changed:
+            speakers = list(submission.speakers.all())
+            if not speakers or old_states[submission.pk] == SubmissionStates.CONFIRMED:
+                continue
+            mail = template.to_mail(
+                user=speakers[0],
+                event=event,
+                context=template_context_from_submission(submission),
+                locale=submission.content_locale,
+                commit=False,
+            )
+            for speaker in speakers:
+                speaker_mail = copy(mail)
+                speaker_mail.to = speaker.email
+                mails.append(speaker_mail)
+        return mails
+
+    @classmethod
+    @transaction.atomic
+    def bulk_set_state(cls, event, submissions, new_state, person=None) -> list:
+        """Accepts or rejects all of the given submissions of the event that
+        can be moved to the new state, and returns them.
+
+        Unlike calling ``accept`` or ``reject`` for each submission, this
+        takes a constant number of queries: The states are changed with one
+        UPDATE, and the log entries, talk slots and speaker mails are
+        created in bulk. Instead of one ``submission_state_change`` signal
+        per submission, a single ``submission_state_change_bulk`` signal is
+        sent."""
+        from pretalx.common.cache import invalidate_event_cache
+        from pretalx.mail.models import QueuedMail
+
+        action, template = cls._get_bulk_action(event, new_state)
+        changed, old_states = cls._bulk_update_state(event, submissions, new_state)
+        if not changed:
+            return []
+        cls._bulk_log(event, changed, action, person)
+        cls._bulk_update_slots(event, changed, new_state)
+        QueuedMail.objects.bulk_create(
+            cls._bulk_build_mails(event, changed, old_states, template)
+        )
+
+        invalidate_event_cache(event.pk)
+        submission_state_change_bulk.send_robust(
+            event, submissions=changed, old_states=old_states, user=person
+        )
+        return changed
+
     def cancel(self, person=None, force=False, orga=True):
         self._set_state(SubmissionStates.CANCELED, force, person=person)
         self.log_action('pretalx.submission.cancel', person=person, orga=True)
 
-        from pretalx.schedule.models import TalkSlot
-
-        TalkSlot.objects.filter(
-            submission=self, schedule=self.event.wip_schedule
-        ).delete()
+        self._remove_wip_slot()
 
     def withdraw(self, person=None, force=False, orga=False):
         self._set_state(SubmissionStates.WITHDRAWN, force, person=person)
-        from pretalx.schedule.models import TalkSlot
-
-        TalkSlot.objects.filter(
-            submission=self, schedule=self.event.wip_schedule
-        ).delete()
+        self._remove_wip_slot()
         self.log_action('pretalx.submission.withdraw', person=person, orga=orga)
 
     def remove(self, person=None, force=False, orga=True):
         self._set_state(SubmissionStates.DELETED, force, person=person)
         for answer in self.answers.all():
             answer.remove(person=person, force=force)
-        from pretalx.schedule.models import TalkSlot
-
-        TalkSlot.objects.filter(
-            submission=self, schedule=self.event.wip_schedule
-        ).delete()
+        self._remove_wip_slot()
         self.log_action('pretalx.submission.deleted', person=person, orga=True)
 
     @cached_property
@@ -480,14 +605,21 @@ class Submission(LogMixin, models.Model):
             event=self.event, user__in=self.speakers.all()
         )
 
+    @property
+    def availability_intervals(self):
+        from pretalx.schedule import intervals
+
+        return intervals.union(
+            self.event.availabilities.filter(
+                person__in=self.speaker_profiles
+            ).values_list('start', 'end')
+        )
+
     @property
     def availabilities(self):
         from pretalx.schedule.models.availability import Availability
 
-        all_availabilities = self.event.availabilities.filter(
-            person__in=self.speaker_profiles
-        )
-        return Availability.intersection(all_availabilities)
+        return Availability.from_intervals(self.availability_intervals)
 
     @cached_property
     def created(self):
@@ -11,3 +11,16 @@ Any exceptions raised will be ignored.
 
 As with all plugin signals, the ``sender`` keyword argument will contain the event.
 """
+
+submission_state_change_bulk = EventPluginSignal(
+    providing_args=['submissions', 'old_states', 'user'],
+)
+"""
+This signal is sent instead of ``submission_state_change`` when organisers
+accept or reject many submissions at once. You will receive the list of
+submissions after they have been saved, a dictionary mapping their IDs to
+their previous states, and the user triggering the change if available.
+Any exceptions raised will be ignored.
+
+As with all plugin signals, the ``sender`` keyword argument will contain the event.
+"""
@@ -132,6 +132,7 @@ setup(
             'lxml',
             'pylama',
             'pytest',
+            'pytest-benchmark',
             'pytest-cov',
             'pytest-django',
             'pytest-mock',
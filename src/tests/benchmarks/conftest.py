@@ -0,0 +1,179 @@
+import datetime as dt
+import os
+
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from pretalx.person.models import SpeakerProfile, User
+from pretalx.schedule.models import Room, TalkSlot
+from pretalx.submission.models import (
+    Answer, AnswerOption, Question, QuestionVariant, Submission, SubmissionStates,
+)
+
+ROOMS = int(os.environ.get('PRETALX_BENCHMARK_ROOMS', 10))
+TALKS = int(os.environ.get('PRETALX_BENCHMARK_TALKS', 300))
+SPEAKERS = int(os.environ.get('PRETALX_BENCHMARK_SPEAKERS', 300))
+SLOTS = int(os.environ.get('PRETALX_BENCHMARK_SLOTS', 5000))
+
+
+@pytest.fixture
+def large_event(event):
+    """Adds ROOMS rooms, TALKS scheduled talks and SPEAKERS speakers with
+    answers to a speaker and a submission question to the event, and
+    releases a schedule. The sizes can be set with the
+    PRETALX_BENCHMARK_{ROOMS,TALKS,SPEAKERS} environment variables."""
+    Room.objects.bulk_create(
+        Room(event=event, name=f'Room {index}', position=index + 1)
+        for index in range(ROOMS)
+    )
+    rooms = list(event.rooms.all())
+    password = make_password('speakerpwd1!')
+    User.objects.bulk_create(
+        User(
+            email=f'speaker{index}@example.org',
+            name=f'Speaker {index}',
+            code=f'BSPK{index:05d}',
+            password=password,
+        )
+        for index in range(SPEAKERS)
+    )
+    speakers = list(User.objects.filter(code__startswith='BSPK').order_by('code'))
+    SpeakerProfile.objects.bulk_create(
+        SpeakerProfile(user=speaker, event=event, biography='A biography.')
+        for speaker in speakers
+    )
+    Submission.objects.bulk_create(
+        Submission(
+            event=event,
+            code=f'BTLK{index:05d}',
+            title=f'Talk {index}',
+            abstract='An abstract.',
+            description='A description.',
+            submission_type=event.cfp.default_type,
+            state=SubmissionStates.CONFIRMED,
+            content_locale='en',
+        )
+        for index in range(TALKS)
+    )
+    submissions = list(
+        Submission.objects.filter(event=event, code__startswith='BTLK').order_by('code')
+    )
+    Submission.speakers.through.objects.bulk_create(
+        Submission.speakers.through(
+            submission=submission, user=speakers[index % len(speakers)]
+        )
+        for index, submission in enumerate(submissions)
+    )
+
+    submission_question = Question.objects.create(
+        event=event,
+        question='Why?',
+        variant=QuestionVariant.STRING,
+        target='submission',
+        required=False,
+    )
+    speaker_question = Question.objects.create(
+        event=event,
+        question='Colour?',
+        variant=QuestionVariant.CHOICES,
+        target='speaker',
+        required=False,
+    )
+    option = AnswerOption.objects.create(question=speaker_question, answer='green')
+    Answer.objects.bulk_create(
+        Answer(question=submission_question, submission=submission, answer='Because.')
+        for submission in submissions
+    )
+    Answer.objects.bulk_create(
+        Answer(question=speaker_question, person=speaker, answer='green')
+        for speaker in speakers
+    )
+    Answer.options.through.objects.bulk_create(
+        Answer.options.through(answer=answer, answeroption=option)
+        for answer in Answer.objects.filter(question=speaker_question)
+    )
+
+    start = event.datetime_from + dt.timedelta(hours=9)
+    TalkSlot.objects.bulk_create(
+        TalkSlot(
+            submission=submission,
+            schedule=event.wip_schedule,
+            room=rooms[index % len(rooms)],
+            start=start + dt.timedelta(minutes=30 * (index // len(rooms))),
+            end=start + dt.timedelta(minutes=30 * (index // len(rooms) + 1)),
+            is_visible=True,
+        )
+        for index, submission in enumerate(submissions)
+    )
+    event.wip_schedule.freeze('v1', notify_speakers=False)
+    event = type(event).objects.get(pk=event.pk)
+    event.test_version = 'v1'
+    return event
+
+
+@pytest.fixture
+def many_slots(event, room):
+    """Adds SLOTS scheduled talks without speakers to the event's WIP
+    schedule, for benchmarks of schedule releases. The number can be set
+    with the PRETALX_BENCHMARK_SLOTS environment variable."""
+    Submission.objects.bulk_create(
+        Submission(
+            event=event,
+            code=f'BSLT{index:05d}',
+            title=f'Talk {index}',
+            submission_type=event.cfp.default_type,
+            state=SubmissionStates.CONFIRMED,
+            content_locale='en',
+        )
+        for index in range(SLOTS)
+    )
+    start = event.datetime_from + dt.timedelta(hours=9)
+    TalkSlot.objects.bulk_create(
+        TalkSlot(
+            submission=submission,
+            schedule=event.wip_schedule,
+            room=room,
+            start=start + dt.timedelta(minutes=index),
+            end=start + dt.timedelta(minutes=index + 30),
+            is_visible=True,
+        )
+        for index, submission in enumerate(
+            Submission.objects.filter(event=event, code__startswith='BSLT')
+        )
+    )
+    return event
+
+
+@pytest.fixture
+def anonymous_client():
+    return Client()
+
+
+def _consume(response):
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+@pytest.fixture
+def measure(benchmark):
+    """Records the number of queries of one request to the URL in the
+    benchmark's extra_info (and thereby in the JSON report), and then
+    benchmarks the request."""
+
+    def _measure(client, url):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, follow=True)
+            _consume(response)
+        assert response.status_code == 200
+        benchmark.extra_info['url'] = url
+        benchmark.extra_info['queries'] = len(context.captured_queries)
+        benchmark.extra_info['rooms'] = ROOMS
+        benchmark.extra_info['talks'] = TALKS
+        benchmark.extra_info['speakers'] = SPEAKERS
+        return benchmark(lambda: _consume(client.get(url, follow=True)))
+
+    return _measure
@@ -0,0 +1,15 @@
+import pytest
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'url_name', ('schedule', 'talks', 'speakers', 'changelog', 'feed')
+)
+def test_benchmark_agenda_page(large_event, anonymous_client, measure, url_name):
+    measure(anonymous_client, getattr(large_event.urls, url_name))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', ('frab_xml', 'frab_json', 'frab_xcal', 'ical'))
+def test_benchmark_agenda_export(large_event, anonymous_client, measure, url_name):
+    measure(anonymous_client, getattr(large_event.urls, url_name))
@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('endpoint', ('submissions', 'speakers', 'talks'))
+def test_benchmark_api_list(large_event, orga_client, measure, endpoint):
+    measure(orga_client, getattr(large_event.api_urls, endpoint))
+
+
+@pytest.mark.django_db
+def test_benchmark_api_schedule(large_event, orga_client, measure):
+    measure(orga_client, large_event.api_urls.schedules + 'v1/')
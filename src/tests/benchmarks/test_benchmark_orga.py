@@ -0,0 +1,10 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+def test_benchmark_orga_talk_list(large_event, orga_client, measure):
+    measure(
+        orga_client,
+        reverse('orga:schedule.api.talks', kwargs={'event': large_event.slug}),
+    )
@@ -0,0 +1,57 @@
+import functools
+import itertools
+
+import pytest
+
+from pretalx.schedule.models import Schedule, TalkSlot
+
+from .conftest import SLOTS
+
+
+def _copy_per_slot(slots, schedule):
+    """The way slots were copied before the single INSERT … SELECT, kept
+    here for comparison."""
+    TalkSlot.objects.bulk_create(
+        slot.copy_to_schedule(schedule, save=False)
+        for slot in slots.select_related('submission', 'room')
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('path', ('statement', 'per_slot'))
+def test_benchmark_copy_slots(many_slots, benchmark, path):
+    slots = many_slots.wip_schedule.talks.all()
+    versions = itertools.count()
+
+    def setup():
+        schedule = Schedule.objects.create(
+            event=many_slots, version=f'copy-{next(versions)}'
+        )
+        return (schedule,), {}
+
+    if path == 'statement':
+        copy = slots.copy_to_schedule
+    else:
+        copy = functools.partial(_copy_per_slot, slots)
+    benchmark.extra_info['slots'] = SLOTS
+    benchmark.pedantic(copy, setup=setup, rounds=5)
+    assert TalkSlot.objects.filter(schedule__version='copy-0').count() == SLOTS
+
+
+@pytest.mark.django_db
+def test_benchmark_freeze(many_slots, benchmark):
+    versions = itertools.count()
+
+    def setup():
+        schedule = Schedule.objects.get(event=many_slots, version__isnull=True)
+        return (schedule, f'v{next(versions)}'), {}
+
+    def freeze(schedule, version):
+        schedule.freeze(version, notify_speakers=False)
+
+    benchmark.extra_info['slots'] = SLOTS
+    benchmark.pedantic(freeze, setup=setup, rounds=5)
+    assert (
+        Schedule.objects.get(event=many_slots, version__isnull=True).talks.count()
+        == SLOTS
+    )
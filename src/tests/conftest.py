@@ -15,6 +15,20 @@ from pretalx.submission.models import (
 )
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        '--benchmarks',
+        action='store_true',
+        default=False,
+        help='Run the benchmark suite in tests/benchmarks. Requires pytest-benchmark.',
+    )
+
+
+def pytest_ignore_collect(path, config):
+    if path.basename == 'benchmarks' and not config.getoption('--benchmarks'):
+        return True
+
+
 @pytest.fixture
 def template_patch(monkeypatch):
     # Patch out template rendering for performance improvements
@@ -24,6 +38,19 @@ def template_patch(monkeypatch):
     )
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    # The test settings use a dummy cache – use this fixture to test caching
+    from django.core.cache import cache
+
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    }
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
 @pytest.fixture
 def organiser():
     o = Organiser.objects.create(name='Super Organiser', slug='superorganiser')
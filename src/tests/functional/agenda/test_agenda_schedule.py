@@ -10,7 +10,7 @@ def test_can_see_schedule(
 ):
     del event.current_schedule
     assert user.has_perm('agenda.view_schedule', event)
-    with django_assert_num_queries(18):
+    with django_assert_num_queries(16):
         response = client.get(event.urls.schedule, follow=True)
     assert event.schedules.count() == 2
     assert response.status_code == 200
@@ -22,7 +22,7 @@ def test_speaker_list(
     client, django_assert_num_queries, event, speaker, slot, other_slot
 ):
     url = event.urls.speakers
-    with django_assert_num_queries(23):
+    with django_assert_num_queries(21):
         response = client.get(url, follow=True)
     assert response.status_code == 200
     assert speaker.name in response.content.decode()
@@ -33,7 +33,7 @@ def test_speaker_page(
     client, django_assert_num_queries, event, speaker, slot, other_slot
 ):
     url = reverse('agenda:speaker', kwargs={'code': speaker.code, 'event': event.slug})
-    with django_assert_num_queries(27):
+    with django_assert_num_queries(25):
         response = client.get(url, follow=True)
     assert response.status_code == 200
     assert speaker.profiles.get(event=event).biography in response.content.decode()
@@ -44,7 +44,7 @@ def test_schedule_page(
     client, django_assert_num_queries, event, speaker, slot, schedule, other_slot
 ):
     url = event.urls.schedule
-    with django_assert_num_queries(18):
+    with django_assert_num_queries(16):
         response = client.get(url, follow=True)
     assert response.status_code == 200
     assert slot.submission.title in response.content.decode()
@@ -58,17 +58,39 @@ def test_versioned_schedule_page(
     event.current_schedule.talks.update(is_visible=False)
 
     url = event.urls.schedule
-    with django_assert_num_queries(17):
+    with django_assert_num_queries(15):
         response = client.get(url, follow=True)
     assert slot.submission.title not in response.content.decode()
 
     url = schedule.urls.public
-    with django_assert_num_queries(13):
+    with django_assert_num_queries(10):
         response = client.get(url, follow=True)
     assert response.status_code == 200
     assert slot.submission.title in response.content.decode()
 
     url = f'/{event.slug}/schedule?version={quote(schedule.version)}'
-    with django_assert_num_queries(20):
+    with django_assert_num_queries(12):
         redirected_response = client.get(url, follow=True)
     assert redirected_response._request.path == response._request.path
+
+
+@pytest.mark.django_db
+def test_schedule_page_is_cached_for_anonymous_users(
+    client, orga_user, event, slot, locmem_cache
+):
+    url = event.urls.schedule
+    response = client.get(url, follow=True)
+    assert slot.submission.title in response.content.decode()
+    slot.submission.title = 'A new title'
+    slot.submission.save()
+    response = client.get(url, follow=True)
+    assert 'A new title' in response.content.decode()
+
+    type(slot.submission).objects.filter(pk=slot.submission.pk).update(
+        title='Changed without signals'
+    )
+    response = client.get(url, follow=True)
+    assert 'A new title' in response.content.decode()
+    client.force_login(orga_user)
+    response = client.get(url, follow=True)
+    assert 'Changed without signals' in response.content.decode()
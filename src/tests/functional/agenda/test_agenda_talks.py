@@ -7,7 +7,7 @@ from django.utils import formats
 
 @pytest.mark.django_db
 def test_can_see_talk_list(client, django_assert_num_queries, event, slot, other_slot):
-    with django_assert_num_queries(18):
+    with django_assert_num_queries(16):
         response = client.get(event.urls.talks, follow=True)
     assert response.status_code == 200
     assert slot.submission.title in response.content.decode()
@@ -15,7 +15,7 @@ def test_can_see_talk_list(client, django_assert_num_queries, event, slot, other
 
 @pytest.mark.django_db
 def test_can_see_talk(client, django_assert_num_queries, event, slot, other_slot):
-    with django_assert_num_queries(36):
+    with django_assert_num_queries(34):
         response = client.get(slot.submission.urls.public, follow=True)
     assert event.schedules.count() == 2
     assert response.status_code == 200
@@ -41,7 +41,7 @@ def test_can_see_talk(client, django_assert_num_queries, event, slot, other_slot
 @pytest.mark.django_db
 def test_cannot_see_new_talk(client, django_assert_num_queries, event, unreleased_slot):
     slot = unreleased_slot
-    with django_assert_num_queries(16):
+    with django_assert_num_queries(12):
         response = client.get(slot.submission.urls.public, follow=True)
     assert event.schedules.count() == 1
     assert response.status_code == 404
@@ -52,7 +52,7 @@ def test_orga_can_see_new_talk(
     orga_client, django_assert_num_queries, event, unreleased_slot
 ):
     slot = unreleased_slot
-    with django_assert_num_queries(35):
+    with django_assert_num_queries(30):
         response = orga_client.get(slot.submission.urls.public, follow=True)
     assert event.schedules.count() == 1
     assert response.status_code == 200
@@ -80,7 +80,7 @@ def test_can_see_talk_edit_btn(
     orga_client, django_assert_num_queries, orga_user, event, slot
 ):
     slot.submission.speakers.add(orga_user)
-    with django_assert_num_queries(39):
+    with django_assert_num_queries(36):
         response = orga_client.get(slot.submission.urls.public, follow=True)
     assert response.status_code == 200
     content = response.content.decode()
@@ -93,7 +93,7 @@ def test_can_see_talk_edit_btn(
 def test_can_see_talk_do_not_record(client, django_assert_num_queries, event, slot):
     slot.submission.do_not_record = True
     slot.submission.save()
-    with django_assert_num_queries(35):
+    with django_assert_num_queries(33):
         response = client.get(slot.submission.urls.public, follow=True)
     assert response.status_code == 200
     content = response.content.decode()
@@ -109,7 +109,7 @@ def test_can_see_talk_does_accept_feedback(
     slot.start = datetime.datetime.now() - datetime.timedelta(days=1)
     slot.end = slot.start + datetime.timedelta(hours=1)
     slot.save()
-    with django_assert_num_queries(36):
+    with django_assert_num_queries(34):
         response = client.get(slot.submission.urls.public, follow=True)
     assert response.status_code == 200
     content = response.content.decode()
@@ -122,7 +122,7 @@ def test_can_see_talk_does_accept_feedback(
 def test_cannot_see_nonpublic_talk(client, django_assert_num_queries, event, slot):
     event.is_public = False
     event.save()
-    with django_assert_num_queries(19):
+    with django_assert_num_queries(15):
         response = client.get(slot.submission.urls.public, follow=True)
     assert response.status_code == 404
 
@@ -131,7 +131,7 @@ def test_cannot_see_nonpublic_talk(client, django_assert_num_queries, event, slo
 def test_cannot_see_other_events_talk(
     client, django_assert_num_queries, event, slot, other_event
 ):
-    with django_assert_num_queries(16):
+    with django_assert_num_queries(12):
         response = client.get(
             slot.submission.urls.public.replace(event.slug, other_event.slug),
             follow=True,
@@ -143,7 +143,7 @@ def test_cannot_see_other_events_talk(
 def test_event_talk_visiblity_submitted(
     client, django_assert_num_queries, event, submission
 ):
-    with django_assert_num_queries(14):
+    with django_assert_num_queries(10):
         response = client.get(submission.urls.public, follow=True)
     assert response.status_code == 404
 
@@ -152,7 +152,7 @@ def test_event_talk_visiblity_submitted(
 def test_event_talk_visiblity_accepted(
     client, django_assert_num_queries, event, slot, accepted_submission
 ):
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(11):
         response = client.get(accepted_submission.urls.public, follow=True)
     assert response.status_code == 404
 
@@ -161,7 +161,7 @@ def test_event_talk_visiblity_accepted(
 def test_event_talk_visiblity_confirmed(
     client, django_assert_num_queries, event, slot, confirmed_submission
 ):
-    with django_assert_num_queries(34):
+    with django_assert_num_queries(32):
         response = client.get(confirmed_submission.urls.public, follow=True)
     assert response.status_code == 200
 
@@ -170,7 +170,7 @@ def test_event_talk_visiblity_confirmed(
 def test_event_talk_visiblity_canceled(
     client, django_assert_num_queries, event, slot, canceled_submission
 ):
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(11):
         response = client.get(canceled_submission.urls.public, follow=True)
     assert response.status_code == 404
 
@@ -179,7 +179,7 @@ def test_event_talk_visiblity_canceled(
 def test_event_talk_visiblity_withdrawn(
     client, django_assert_num_queries, event, slot, withdrawn_submission
 ):
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(11):
         response = client.get(withdrawn_submission.urls.public, follow=True)
     assert response.status_code == 404
 
@@ -195,7 +195,7 @@ def test_talk_speaker_other_talks(
     other_submission,
 ):
     other_submission.speakers.add(speaker)
-    with django_assert_num_queries(43):
+    with django_assert_num_queries(41):
         response = client.get(other_submission.urls.public, follow=True)
 
     assert response.context['speakers']
@@ -225,7 +225,7 @@ def test_talk_speaker_other_talks_only_if_visible(
     other_submission,
 ):
     other_submission.speakers.add(speaker)
-    with django_assert_num_queries(43):
+    with django_assert_num_queries(41):
         response = client.get(other_submission.urls.public, follow=True)
     slot.submission.accept(force=True)
     slot.is_visible = False
@@ -248,6 +248,6 @@ def test_talk_speaker_other_talks_only_if_visible(
 def test_talk_review_page(
     client, django_assert_num_queries, event, submission, other_submission
 ):
-    with django_assert_num_queries(19):
+    with django_assert_num_queries(17):
         response = client.get(submission.urls.review, follow=True)
     assert response.status_code == 200
@@ -7,16 +7,17 @@ from django.test import override_settings
 from django.urls import reverse
 from lxml import etree
 
-from pretalx.agenda.tasks import export_schedule_html
+from pretalx.agenda.tasks import export_schedule_html, prerender_schedule_exports
 from pretalx.common.tasks import regenerate_css
 from pretalx.event.models import Event
+from pretalx.schedule.exporters import ScheduleData
 
 
 @pytest.mark.django_db
 def test_schedule_frab_xml_export(
     slot, client, django_assert_num_queries, schedule_schema
 ):
-    with django_assert_num_queries(25):
+    with django_assert_num_queries(20):
         response = client.get(
             reverse(
                 f'agenda:export.schedule.xml',
@@ -35,7 +36,7 @@ def test_schedule_frab_xml_export(
     etree.fromstring(
         response.content, parser
     )  # Will raise if the schedule does not match the schema
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(9):
         response = client.get(
             reverse(
                 f'agenda:export.schedule.xml',
@@ -54,7 +55,7 @@ def test_schedule_frab_xml_export_control_char(
     slot.submission.description = "control char: \a"
     slot.submission.save()
 
-    with django_assert_num_queries(24):
+    with django_assert_num_queries(19):
         response = client.get(
             reverse(
                 f'agenda:export.schedule.xml',
@@ -77,7 +78,7 @@ def test_schedule_frab_json_export(
     orga_user,
     schedule_schema,
 ):
-    with django_assert_num_queries(26):
+    with django_assert_num_queries(21):
         regular_response = client.get(
             reverse(
                 f'agenda:export.schedule.json',
@@ -86,7 +87,7 @@ def test_schedule_frab_json_export(
             follow=True,
         )
     client.force_login(orga_user)
-    with django_assert_num_queries(23):
+    with django_assert_num_queries(16):
         orga_response = client.get(
             reverse(
                 f'agenda:export.schedule.json',
@@ -117,7 +118,7 @@ def test_schedule_frab_json_export(
 def test_schedule_frab_xcal_export(
     slot, client, django_assert_num_queries, schedule_schema
 ):
-    with django_assert_num_queries(20):
+    with django_assert_num_queries(17):
         response = client.get(
             reverse(
                 f'agenda:export.schedule.xcal',
@@ -133,7 +134,7 @@ def test_schedule_frab_xcal_export(
 
 @pytest.mark.django_db
 def test_schedule_ical_export(slot, client, django_assert_num_queries, schedule_schema):
-    with django_assert_num_queries(22):
+    with django_assert_num_queries(20):
         response = client.get(
             reverse(
                 f'agenda:export.schedule.ics',
@@ -147,11 +148,90 @@ def test_schedule_ical_export(slot, client, django_assert_num_queries, schedule_
     assert slot.submission.title in content
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'exporter', ('schedule.xml', 'schedule.json', 'schedule.xcal', 'schedule.ics')
+)
+def test_schedule_export_cached(
+    exporter, slot, client, django_assert_num_queries, locmem_cache
+):
+    url = reverse(
+        f'agenda:export.{exporter}', kwargs={'event': slot.submission.event.slug}
+    )
+    response = client.get(url, follow=True)
+    assert response.status_code == 200
+    etag = response['ETag']
+    client.get(url, follow=True)  # Warm up the settings cache
+
+    with django_assert_num_queries(3):
+        response = client.get(url, follow=True)
+    assert response.status_code == 200
+    assert response['ETag'] == etag
+    assert slot.submission.title in response.content.decode()
+
+    with django_assert_num_queries(3):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag, follow=True)
+    assert response.status_code == 304
+
+    slot.submission.title = 'A much better title'
+    slot.submission.save()
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag, follow=True)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+    assert 'A much better title' in response.content.decode()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('exporter', ('schedule.xml', 'schedule.json'))
+def test_schedule_export_streaming(exporter, slot, client, monkeypatch, locmem_cache):
+    url = reverse(
+        f'agenda:export.{exporter}', kwargs={'event': slot.submission.event.slug}
+    )
+    response = client.get(url, follow=True)
+    assert not response.streaming
+    content = response.content
+    etag = response['ETag']
+
+    locmem_cache.clear()
+    monkeypatch.setattr(ScheduleData, 'stream_threshold', 0)
+    response = client.get(url, follow=True)
+    assert response.status_code == 200
+    assert response.streaming
+    assert 'ETag' not in response
+    assert b''.join(response.streaming_content) == content
+
+    response = client.get(url, follow=True)
+    assert response.streaming
+    assert response['ETag'] == etag
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag, follow=True)
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_schedule_export_prerender_task(
+    slot, client, django_assert_num_queries, locmem_cache
+):
+    url = reverse(
+        'agenda:export.schedule.xml', kwargs={'event': slot.submission.event.slug}
+    )
+    prerender_schedule_exports(schedule_id=slot.schedule.pk)
+    with django_assert_num_queries(11):
+        response = client.get(url, follow=True)
+    assert response.status_code == 200
+    assert slot.submission.title in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_schedule_export_prerender_task_unreleased(event):
+    prerender_schedule_exports(schedule_id=event.wip_schedule.pk)
+    prerender_schedule_exports(schedule_id=0)
+
+
 @pytest.mark.django_db
 def test_schedule_single_ical_export(
     slot, client, django_assert_num_queries, schedule_schema
 ):
-    with django_assert_num_queries(23):
+    with django_assert_num_queries(19):
         response = client.get(slot.submission.urls.ical, follow=True)
     assert response.status_code == 200
 
@@ -171,7 +251,7 @@ def test_schedule_export_nonpublic(
     slot.submission.event.save()
     exporter = 'feed' if exporter == 'feed' else f'export.{exporter}'
 
-    with django_assert_num_queries(14):
+    with django_assert_num_queries(10):
         response = client.get(
             reverse(f'agenda:{exporter}', kwargs={'event': slot.submission.event.slug}),
             follow=True,
@@ -185,7 +265,7 @@ def test_schedule_speaker_ical_export(
 ):
     speaker = slot.submission.speakers.all()[0]
     profile = speaker.profiles.get(event=slot.event)
-    with django_assert_num_queries(32):
+    with django_assert_num_queries(28):
         response = client.get(profile.urls.talks_ical, follow=True)
     assert response.status_code == 200
 
@@ -196,7 +276,7 @@ def test_schedule_speaker_ical_export(
 
 @pytest.mark.django_db
 def test_feed_view(slot, client, django_assert_num_queries, schedule_schema, schedule):
-    with django_assert_num_queries(19):
+    with django_assert_num_queries(16):
         response = client.get(slot.submission.event.urls.feed)
     assert response.status_code == 200
     assert schedule.version in response.content.decode()
@@ -301,7 +381,7 @@ def test_schedule_orga_trigger_export(
 
     mocker.patch('pretalx.agenda.tasks.export_schedule_html.apply_async')
 
-    with django_assert_num_queries(33):
+    with django_assert_num_queries(23):
         response = orga_client.post(
             event.orga_urls.schedule_export_trigger, follow=True
         )
@@ -318,7 +398,7 @@ def test_schedule_orga_download_export(
     from pretalx.agenda.tasks import export_schedule_html
 
     export_schedule_html.apply_async(kwargs={'event_id': event.id, 'make_zip': True})
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(6):
         response = orga_client.get(
             event.orga_urls.schedule_export_download, follow=True
         )
@@ -439,7 +519,7 @@ def test_html_export_full(event, other_event, slot, canceled_talk):
 
 @pytest.mark.django_db
 def test_speaker_csv_export(slot, orga_client, django_assert_num_queries):
-    with django_assert_num_queries(17):
+    with django_assert_num_queries(15):
         response = orga_client.get(
             reverse(
                 f'agenda:export',
@@ -1,6 +1,14 @@
 import json
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import urlquote
+from django.utils.timezone import now
+
+from pretalx.person.models import SpeakerProfile, User
+from pretalx.schedule.models import TalkSlot
+from pretalx.submission.models import Answer, Submission, SubmissionStates
 
 
 @pytest.mark.django_db
@@ -384,3 +392,267 @@ def test_orga_can_see_room_speaker_info(orga_client, room):
     assert response.status_code == 200
     assert len(content['results']) == 1, content
     assert 'speaker_info' in content['results'][0]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('is_orga', (True, False))
+@pytest.mark.parametrize('endpoint', ('submissions', 'talks', 'speakers'))
+def test_api_list_query_count_is_constant(
+    client, orga_user, slot, question, speaker_question, endpoint, is_orga
+):
+    event = slot.submission.event
+    if is_orga:
+        client.force_login(orga_user)
+    url = getattr(event.api_urls, endpoint)
+
+    def add_talks(indices):
+        for index in indices:
+            user = User.objects.create_user(
+                password='speakerpwd1!',
+                name=f'Speaker {index}',
+                email=f'{index}@example.org',
+            )
+            SpeakerProfile.objects.create(user=user, event=event, biography='Bio')
+            Answer.objects.create(answer='Blue', person=user, question=speaker_question)
+            submission = Submission.objects.create(
+                title=f'Talk {index}',
+                event=event,
+                submission_type=event.cfp.default_type,
+                state=SubmissionStates.CONFIRMED,
+            )
+            submission.speakers.add(user)
+            Answer.objects.create(answer='42', submission=submission, question=question)
+            TalkSlot.objects.create(
+                submission=submission,
+                schedule=event.current_schedule,
+                room=slot.room,
+                start=slot.start,
+                end=slot.end,
+                is_visible=True,
+            )
+
+    def count_queries():
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, follow=True)
+        assert response.status_code == 200
+        return len(context.captured_queries), json.loads(response.content.decode())
+
+    add_talks(range(2))
+    count_queries()
+    query_count, content = count_queries()
+    add_talks(range(2, 7))
+    new_query_count, new_content = count_queries()
+    assert new_content['count'] == content['count'] + 5
+    assert new_query_count == query_count
+
+
+@pytest.mark.django_db
+def test_api_cursor_pagination(
+    orga_client, slot, accepted_submission, rejected_submission, submission
+):
+    url = submission.event.api_urls.submissions + '?cursor=&limit=3'
+    response = orga_client.get(url, follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert 'count' not in content
+    assert content['previous'] is None
+    assert len(content['results']) == 3
+    codes = [result['code'] for result in content['results']]
+
+    response = orga_client.get(content['next'], follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert content['next'] is None
+    assert len(content['results']) == 1
+    codes.append(content['results'][0]['code'])
+    assert sorted(codes) == sorted(
+        submission.event.submissions.values_list('code', flat=True)
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'endpoint,fields',
+    (
+        ('submissions', {'code', 'title', 'slot'}),
+        ('talks', {'code'}),
+        ('speakers', {'code', 'submissions'}),
+        ('speakers', {'name', 'answers'}),
+    ),
+)
+def test_api_field_selection(orga_client, slot, answer, endpoint, fields):
+    url = getattr(slot.submission.event.api_urls, endpoint)
+    response = orga_client.get(url + '?fields=' + ','.join(fields), follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert content['results']
+    assert all(set(result.keys()) == fields for result in content['results'])
+
+
+@pytest.mark.django_db
+def test_api_field_selection_does_not_apply_to_nested_objects(orga_client, slot):
+    response = orga_client.get(
+        slot.submission.event.api_urls.talks + '?fields=code,speakers', follow=True
+    )
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert set(content['results'][0]['speakers'][0].keys()) == {
+        'name',
+        'code',
+        'biography',
+        'avatar',
+    }
+
+
+@pytest.mark.django_db
+def test_reviewer_can_select_review_fields(review_client, event, review, other_review):
+    response = review_client.get(event.api_urls.reviews + '?fields=id,score', follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert all(set(result.keys()) == {'id', 'score'} for result in content['results'])
+
+
+@pytest.mark.django_db
+def test_orga_can_sync_changed_submissions(
+    orga_client, slot, accepted_submission, rejected_submission, submission
+):
+    changed_since = urlquote(now().isoformat())
+    url = submission.event.api_urls.submissions + f'?changed_since={changed_since}'
+    response = orga_client.get(url, follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert content['count'] == 0
+    assert content['deleted'] == []
+
+    submission.title = 'A new title'
+    submission.save()
+    rejected_submission.remove(force=True)
+    response = orga_client.get(url, follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert [result['code'] for result in content['results']] == [submission.code]
+    assert content['deleted'] == [rejected_submission.code]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('endpoint', ('talks', 'speakers'))
+def test_can_sync_unpublished_talks(client, slot, other_slot, endpoint):
+    event = slot.submission.event
+    changed_since = now().isoformat()
+    url = getattr(event.api_urls, endpoint) + f'?changed_since={changed_since}'
+    response = client.get(url, follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert content['count'] == 0
+    assert content['deleted'] == []
+
+    event.wip_schedule.talks.filter(submission=other_slot.submission).update(
+        start=other_slot.start, end=other_slot.end, room=other_slot.room, is_visible=True
+    )
+    event.wip_schedule.talks.filter(submission=slot.submission).update(
+        start=None, end=None, room=None
+    )
+    event.wip_schedule.freeze('v2', notify_speakers=False)
+    response = client.get(url, follow=True)
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert [result['code'] for result in content['results']] == [
+        other_slot.submission.code
+        if endpoint == 'talks'
+        else other_slot.submission.speakers.first().code
+    ]
+    assert content['deleted'] == [
+        slot.submission.code
+        if endpoint == 'talks'
+        else slot.submission.speakers.first().code
+    ]
+
+
+@pytest.mark.django_db
+def test_reviewer_can_sync_changed_reviews(review_client, event, review, other_review):
+    changed_since = urlquote(now().isoformat())
+    review.score = 2
+    review.save()
+    response = review_client.get(
+        event.api_urls.reviews + f'?changed_since={changed_since}', follow=True
+    )
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert [result['id'] for result in content['results']] == [review.pk]
+
+
+@pytest.mark.django_db
+def test_changed_since_must_be_a_timestamp(orga_client, event):
+    response = orga_client.get(
+        event.api_urls.submissions + '?changed_since=yesterday', follow=True
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_schedule_contains_slots_of_its_version(orga_client, slot, other_room):
+    event = slot.submission.event
+    event.wip_schedule.talks.filter(submission=slot.submission).update(room=other_room)
+    event.wip_schedule.freeze('v2', notify_speakers=False)
+
+    for version, room in ((slot.schedule.version, slot.room), ('v2', other_room)):
+        response = orga_client.get(
+            event.api_urls.schedules + urlquote(version) + '/', follow=True
+        )
+        content = json.loads(response.content.decode())
+
+        assert response.status_code == 200
+        assert [talk['code'] for talk in content['slots']] == [slot.submission.code]
+        assert content['slots'][0]['slot']['room'] == room.name
+        assert content['slots'][0]['answers'] == []
+
+
+@pytest.mark.django_db
+def test_schedule_query_count_is_constant(orga_client, slot, other_slot):
+    event = slot.submission.event
+    url = event.api_urls.schedules + 'wip/'
+
+    def count_queries():
+        with CaptureQueriesContext(connection) as context:
+            response = orga_client.get(url, follow=True)
+        assert response.status_code == 200
+        return len(context.captured_queries), json.loads(response.content.decode())
+
+    count_queries()
+    query_count, content = count_queries()
+    assert len(content['slots']) == 1
+    event.wip_schedule.talks.filter(submission=other_slot.submission).update(
+        start=other_slot.start, end=other_slot.end, room=other_slot.room, is_visible=True
+    )
+    new_query_count, content = count_queries()
+    assert len(content['slots']) == 2
+    assert new_query_count == query_count
+
+
+@pytest.mark.django_db
+def test_released_schedule_is_cached(client, slot, locmem_cache):
+    url = slot.submission.event.api_urls.schedules + 'latest/'
+    first_response = client.get(url, follow=True)
+    with CaptureQueriesContext(connection) as context:
+        second_response = client.get(url, follow=True)
+
+    assert second_response.status_code == 200
+    assert second_response.content == first_response.content
+    assert not any(
+        'submission_submission' in query['sql'] for query in context.captured_queries
+    )
+
+    slot.submission.title = 'A new title'
+    slot.submission.save()
+    response = client.get(url, follow=True)
+    assert 'A new title' in response.content.decode()
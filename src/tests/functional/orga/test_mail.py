@@ -109,6 +109,16 @@ def test_orga_can_send_all_mails(orga_client, event, mail, other_mail, sent_mail
     assert QueuedMail.objects.filter(sent__isnull=True).count() == 0
 
 
+@pytest.mark.django_db
+def test_orga_can_send_all_mails_with_rate_limit(orga_client, event, mail, other_mail):
+    event.settings.mail_rate_limit = 1
+    response = orga_client.post(event.orga_urls.send_outbox, follow=True)
+    assert response.status_code == 200
+    assert '1 mails per minute' in response.content.decode()
+    assert QueuedMail.objects.filter(sent__isnull=True).count() == 1
+    assert 'Queued' in orga_client.get(event.orga_urls.outbox).content.decode()
+
+
 @pytest.mark.django_db
 def test_orga_can_send_single_mail(orga_client, event, mail, other_mail):
     assert QueuedMail.objects.filter(sent__isnull=True).count() == 2
@@ -272,3 +282,24 @@ def test_orga_can_compose_single_mail_from_template(orga_client, event, submissi
     )
     assert response.status_code == 200
     assert str(event.ack_template.subject) in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_orga_compose_mail_deduplicates_recipients(
+    orga_client, event, submission, other_submission, review_user
+):
+    submission.speakers.add(review_user)
+    response = orga_client.post(
+        event.orga_urls.compose_mails, follow=True,
+        data={
+            'recipients': ['submitted', 'selected_submissions', 'reviewers'],
+            'submissions': [submission.code],
+            'bcc': '', 'cc': '', 'reply_to': '', 'subject': 'foo', 'text': 'bar',
+        },
+    )
+    assert response.status_code == 200
+    recipients = sorted(QueuedMail.objects.values_list('to', flat=True))
+    assert recipients == sorted(
+        {speaker.email for speaker in submission.speakers.all()}
+        | {speaker.email for speaker in other_submission.speakers.all()}
+    )
@@ -1,5 +1,7 @@
 import pytest
 
+from pretalx.submission.models import SubmissionStates
+
 
 @pytest.mark.django_db
 def test_reviewer_can_add_review(review_client, submission):
@@ -235,3 +237,39 @@ def test_orga_cannot_add_review(orga_client, submission):
     )
     assert response.status_code == 404
     assert submission.reviews.count() == 0
+
+
+@pytest.mark.django_db
+def test_orga_can_accept_and_reject_on_dashboard(
+    orga_client, event, submission, other_submission
+):
+    response = orga_client.get(event.orga_urls.reviews)
+    assert f'name="s-{submission.code}"' in response.content.decode()
+    response = orga_client.post(
+        event.orga_urls.reviews,
+        follow=True,
+        data={
+            f's-{submission.code}': SubmissionStates.ACCEPTED,
+            f's-{other_submission.code}': SubmissionStates.REJECTED,
+        },
+    )
+    assert response.status_code == 200
+    submission.refresh_from_db()
+    other_submission.refresh_from_db()
+    assert submission.state == SubmissionStates.ACCEPTED
+    assert other_submission.state == SubmissionStates.REJECTED
+    assert event.queued_mails.count() == 2
+
+
+@pytest.mark.django_db
+def test_reviewer_cannot_accept_on_dashboard(review_client, event, submission):
+    response = review_client.get(event.orga_urls.reviews)
+    assert f'name="s-{submission.code}"' not in response.content.decode()
+    response = review_client.post(
+        event.orga_urls.reviews,
+        follow=True,
+        data={f's-{submission.code}': SubmissionStates.ACCEPTED},
+    )
+    assert response.status_code == 200
+    submission.refresh_from_db()
+    assert submission.state == SubmissionStates.SUBMITTED
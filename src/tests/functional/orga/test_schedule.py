@@ -35,6 +35,32 @@ def test_talk_list_with_filter(orga_client, event, schedule):
     assert content['results'][0]['title']
 
 
+@pytest.mark.django_db
+def test_talk_list_since_revision(orga_client, event, slot, other_slot, room):
+    url = reverse('orga:schedule.api.talks', kwargs={'event': event.slug})
+    other_slot = event.wip_schedule.talks.get(submission=other_slot.submission)
+    content = json.loads(orga_client.get(url, follow=True).content.decode())
+    revision = content['revision']
+    assert len(content['results']) == 2
+
+    content = json.loads(
+        orga_client.get(url, data={'since': revision}, follow=True).content.decode()
+    )
+    assert content['revision'] == revision
+    assert content['results'] == []
+    assert 'ids' not in content
+
+    other_slot.room = room
+    other_slot.save()
+    slot.submission.cancel(force=True)
+    content = json.loads(
+        orga_client.get(url, data={'since': revision}, follow=True).content.decode()
+    )
+    assert content['revision'] > revision
+    assert [talk['id'] for talk in content['results']] == [other_slot.pk]
+    assert content['ids'] == [other_slot.pk]
+
+
 @pytest.mark.django_db
 def test_talk_schedule_api_update(orga_client, event, schedule, slot, room):
     slot = event.wip_schedule.talks.first()
@@ -148,6 +174,21 @@ def test_orga_can_see_schedule_release_view(orga_client, event):
     assert response.status_code == 200
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize('real_cache', (True, False))
+def test_orga_can_see_notification_progress(
+    orga_client, event, locmem_cache, settings, real_cache
+):
+    settings.REAL_CACHE_USED = real_cache
+    locmem_cache.set(
+        f'pretalx_schedule_notifications_{event.pk}',
+        {'version': 'v1', 'done': 100, 'total': 250},
+    )
+    response = orga_client.get(event.orga_urls.release_schedule, follow=True)
+    assert response.status_code == 200
+    assert ('100 of 250 emails' in response.content.decode()) is real_cache
+
+
 @pytest.mark.django_db
 def test_orga_cannot_reset_to_wrong_version(orga_client, event):
     assert Schedule.objects.count() == 1
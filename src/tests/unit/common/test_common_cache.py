@@ -0,0 +1,82 @@
+import pytest
+
+from pretalx.common.cache import get_event_by_slug, get_event_cache_version
+from pretalx.event.models import Event
+
+
+@pytest.mark.django_db
+def test_event_cache_version_is_stable(event, locmem_cache):
+    assert get_event_cache_version(event.pk) == get_event_cache_version(event.pk)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'change',
+    (
+        'event',
+        'settings',
+        'submission',
+        'room',
+        'profile',
+        'release',
+        'user',
+        'question',
+        'question_delete',
+    ),
+)
+def test_event_cache_version_changes(
+    change, event, submission, room, speaker, question, locmem_cache
+):
+    version = get_event_cache_version(event.pk)
+    if change == 'event':
+        event.save()
+    elif change == 'settings':
+        event.settings.custom_domain = 'https://example.org'
+    elif change == 'submission':
+        submission.title = 'New title'
+        submission.save()
+    elif change == 'room':
+        room.delete()
+    elif change == 'profile':
+        profile = speaker.event_profile(event)
+        profile.biography = 'New biography'
+        profile.save()
+    elif change == 'release':
+        event.release_schedule('v1')
+    elif change == 'user':
+        speaker.name = 'New name'
+        speaker.save()
+    elif change == 'question':
+        question.question = 'New question'
+        question.save()
+    elif change == 'question_delete':
+        question.delete()
+    assert get_event_cache_version(event.pk) != version
+
+
+@pytest.mark.django_db
+def test_event_by_slug_is_cached(event, locmem_cache, django_assert_num_queries):
+    assert get_event_by_slug(event.slug.upper()) == event
+    with django_assert_num_queries(0):
+        cached_event = get_event_by_slug(event.slug)
+    assert cached_event == event
+    assert cached_event is not get_event_by_slug(event.slug)
+    event.name = 'New name'
+    event.save()
+    assert str(get_event_by_slug(event.slug).name) == 'New name'
+    assert get_event_by_slug('nope') is None
+
+
+@pytest.mark.django_db
+def test_event_settings_are_cached(event, locmem_cache, django_assert_num_queries):
+    event.settings.custom_domain = 'https://example.org'
+    Event.objects.get(pk=event.pk).settings.show_schedule  # Fills the cache
+    other_event = Event.objects.get(pk=event.pk)
+    with django_assert_num_queries(0):
+        assert other_event.settings.custom_domain == 'https://example.org'
+        assert other_event.settings.show_schedule is True
+    event.settings.custom_domain = 'https://example.com'
+    assert other_event.settings.custom_domain == 'https://example.org'
+    assert Event.objects.get(pk=event.pk).settings.custom_domain == 'https://example.com'
+    event.settings.delete('custom_domain')
+    assert Event.objects.get(pk=event.pk).settings.custom_domain == ''
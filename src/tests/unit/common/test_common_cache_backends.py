@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from pretalx.common.cache_backends import LocalCache
+
+
+def get_cache(name, **options):
+    cache = LocalCache(name, {'OPTIONS': options})
+    cache.clear()
+    return cache
+
+
+def test_local_cache_drops_least_recently_used_entries():
+    cache = get_cache('test_entries', MAX_ENTRIES=2, CULL_FREQUENCY=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_local_cache_respects_max_size():
+    cache = get_cache('test_size', MAX_SIZE=3000)
+    cache.set('a', 'a' * 1000)
+    cache.set('b', 'b' * 1000)
+    cache.get('a')
+    cache.set('c', 'c' * 1000)
+    assert cache.get('b') is None
+    assert cache.get('a') and cache.get('c')
+    cache.set('d', 'd' * 5000)
+    assert cache.get('d') is None
+    assert cache.get('a') and cache.get('c')
+
+
+@pytest.mark.parametrize('timeout', (None, 300))
+def test_local_cache_respects_max_timeout(timeout, monkeypatch):
+    cache = get_cache('test_timeout', MAX_TIMEOUT=60)
+    cache.set('a', 1, timeout)
+    cache.set('b', 2, 10)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 30)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    monkeypatch.setattr(time, 'time', lambda: now + 61)
+    assert cache.get('a') is None
+
+
+def test_local_cache_reports_stats():
+    calls = []
+    cache = get_cache(
+        'test_stats', STATS_HOOK=lambda key, hit: calls.append((key, hit))
+    )
+    cache.set('a', None)
+    assert cache.get('a', 'default') is None
+    assert cache.get('b', 'default') == 'default'
+    assert calls == [('a', True), ('b', False)]
+    assert cache.stats == {'hits': 1, 'misses': 1}
@@ -1,6 +1,7 @@
 import pytest
 
-from pretalx.common.exporter import BaseExporter
+from pretalx.common.exporter import BaseExporter, get_export_cache_key
+from pretalx.schedule.exporters import FrabJsonExporter
 
 
 def test_common_base_exporter_raises_proper_exceptions():
@@ -17,3 +18,22 @@ def test_common_base_exporter_raises_proper_exceptions():
         exporter.render()
     with pytest.raises(NotImplementedError):
         str(exporter)
+
+
+def test_common_base_exporter_not_cacheable():
+    exporter = BaseExporter(None)
+    assert exporter.cacheable is False
+    assert get_export_cache_key(exporter) is None
+
+
+@pytest.mark.django_db
+def test_common_export_cache_key(event, locmem_cache):
+    exporter = FrabJsonExporter(event, schedule=event.wip_schedule)
+    assert get_export_cache_key(exporter) is None
+
+    exporter.schedule = event.wip_schedule.freeze('v1')[0]
+    key = get_export_cache_key(exporter)
+    assert 'schedule.json' in key
+    assert get_export_cache_key(exporter) == key
+    exporter.is_orga = True
+    assert get_export_cache_key(exporter) != key
@@ -2,7 +2,8 @@ from urllib.parse import urlparse
 
 import pytest
 from django.conf import settings
-from django.test.utils import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 
 
 @pytest.fixture(autouse=True)
@@ -108,3 +109,33 @@ def test_with_forwarded_host(event_on_foobar, client):
 
 
 settings.USE_X_FORWARDED_HOST = False
+
+
+@pytest.mark.django_db
+def test_event_is_resolved_once(event, client, locmem_cache):
+    client.get(f'/{event.slug}/', HTTP_HOST='example.com')
+    with CaptureQueriesContext(connection) as context:
+        r = client.get(f'/{event.slug}/', HTTP_HOST='example.com')
+    assert r.status_code == 200
+    assert not [
+        query for query in context.captured_queries
+        if 'FROM "event_event" WHERE' in query['sql'] and 'slug' in query['sql']
+    ]
+
+
+@pytest.mark.django_db
+def test_bare_custom_domain_redirects_to_event(event_on_foobar, client):
+    r = client.get('/', HTTP_HOST='foobar')
+    assert r.status_code == 302
+    assert r['Location'] == f'/{event_on_foobar.slug}/'
+
+
+@pytest.mark.django_db
+def test_custom_domain_change_updates_index(event_on_foobar, client):
+    assert client.get(f'/{event_on_foobar.slug}/', HTTP_HOST='foobar').status_code == 200
+    event_on_foobar.settings.custom_domain = 'https://barfoo'
+    r = client.get(f'/{event_on_foobar.slug}/', HTTP_HOST='example.com')
+    assert r['Location'] == f'https://barfoo/{event_on_foobar.slug}/'
+    event_on_foobar.settings.delete('custom_domain')
+    r = client.get(f'/{event_on_foobar.slug}/', HTTP_HOST='example.com')
+    assert r.status_code == 200
@@ -1,7 +1,23 @@
+import datetime as dt
+from smtplib import SMTPRecipientsRefused
+
+import bleach
+import markdown
 import pytest
+from django.core import mail as djmail
+from django.core.mail.backends import locmem
+from django.template.loader import get_template
+from django.utils.timezone import now
+from inlinestyler.utils import inline_css
 
-from pretalx.common.mail import TolerantDict
-from pretalx.mail.models import QueuedMail
+from pretalx.common.mail import (
+    MAIL_MAX_ATTEMPTS, TolerantDict, deliver_queued_mails,
+    get_retry_delay, mail_send_batch_task, queue_mails,
+)
+from pretalx.common.models import ActivityLog
+from pretalx.common.signals import periodic_task
+from pretalx.event.models import Event
+from pretalx.mail.models import MAIL_BODY_TAGS, QueuedMail
 
 
 @pytest.mark.parametrize('key,value', (
@@ -44,3 +60,209 @@ def test_mail_make_subject(event, text, prefix, expected):
     if prefix:
         event.settings.mail_subject_prefix = prefix
     assert QueuedMail.make_subject(text, event) == expected
+
+
+class FailingBackend(locmem.EmailBackend):
+    opened = 0
+
+    def open(self):
+        FailingBackend.opened += 1
+
+    def send_messages(self, messages):
+        if any('fail' in address for message in messages for address in message.to):
+            raise SMTPRecipientsRefused({})
+        return super().send_messages(messages)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('batch_size,connections', ((100, 1), (2, 2)))
+def test_mail_send_batch_task(
+    monkeypatch, event, mail, other_mail, orga_user, batch_size, connections
+):
+    FailingBackend.opened = 0
+    monkeypatch.setattr(Event, 'get_mail_backend', lambda self: FailingBackend())
+    failing_mail = QueuedMail.objects.create(
+        event=event, to='fail@example.org', subject='Hi', text='Hello'
+    )
+    result = mail_send_batch_task(
+        mail_ids=[mail.pk, other_mail.pk, failing_mail.pk],
+        user=orga_user.pk,
+        batch_size=batch_size,
+    )
+    assert result == {'sent': [mail.pk, other_mail.pk], 'failed': [failing_mail.pk]}
+    assert FailingBackend.opened == connections
+    assert len(djmail.outbox) == 2
+    assert djmail.outbox[0].subject == mail.subject
+    assert set(
+        QueuedMail.objects.filter(sent__isnull=False).values_list('pk', flat=True)
+    ) == {mail.pk, other_mail.pk}
+    assert ActivityLog.objects.filter(
+        action_type='pretalx.mail.sent', person=orga_user
+    ).count() == 2
+    assert failing_mail.logged_actions().get().action_type == 'pretalx.mail.failed'
+
+    assert mail_send_batch_task(mail_ids=[mail.pk]) == {'sent': [], 'failed': []}
+
+
+class InterruptingBackend(locmem.EmailBackend):
+    def send_messages(self, messages):
+        if len(djmail.outbox):
+            raise KeyboardInterrupt
+        return super().send_messages(messages)
+
+
+@pytest.mark.django_db
+def test_mail_send_batch_task_interrupted(monkeypatch, event, mail, other_mail):
+    monkeypatch.setattr(Event, 'get_mail_backend', lambda self: InterruptingBackend())
+    with pytest.raises(KeyboardInterrupt):
+        mail_send_batch_task(mail_ids=[mail.pk, other_mail.pk])
+    assert len(djmail.outbox) == 1
+    mail.refresh_from_db()
+    other_mail.refresh_from_db()
+    assert mail.sent
+    assert not other_mail.sent
+
+
+@pytest.mark.parametrize('attempts,delay', ((1, 60), (2, 120), (4, 480)))
+def test_mail_retry_delay(attempts, delay):
+    assert get_retry_delay(attempts) == delay
+
+
+@pytest.mark.django_db
+def test_deliver_queued_mails_respects_rate_limit(event, mail, other_mail):
+    event.settings.mail_rate_limit = 1
+    queue_mails(event.queued_mails.all())
+    assert len(djmail.outbox) == 1
+    waiting = QueuedMail.objects.get(sent__isnull=True)
+    assert waiting.next_attempt <= now()
+
+    deliver_queued_mails(event_id=event.pk)
+    assert len(djmail.outbox) == 1
+
+    QueuedMail.objects.filter(sent__isnull=False).update(
+        sent=now() - dt.timedelta(minutes=2)
+    )
+    deliver_queued_mails(event_id=event.pk)
+    assert len(djmail.outbox) == 2
+    waiting.refresh_from_db()
+    assert waiting.sent
+    assert not waiting.next_attempt
+
+
+@pytest.mark.django_db
+def test_deliver_queued_mails_counts_leased_mails(event, mail, other_mail):
+    event.settings.mail_rate_limit = 1
+    mail.next_attempt = now() + dt.timedelta(minutes=5)  # Leased by another delivery
+    mail.save()
+    other_mail.next_attempt = now()
+    other_mail.save()
+    deliver_queued_mails(event_id=event.pk)
+    assert len(djmail.outbox) == 0
+
+
+@pytest.mark.django_db
+def test_deliver_queued_mails_schedules_one_delivery(
+    mocker, settings, event, mail, other_mail, orga_user, locmem_cache
+):
+    settings.HAS_CELERY = True
+    event.settings.mail_rate_limit = 1
+    apply_async = mocker.patch('pretalx.common.mail.deliver_queued_mails.apply_async')
+    queue_mails(event.queued_mails.all(), user=orga_user)
+    periodic_task.send(None)
+    apply_async.assert_called_once_with(
+        kwargs={'event_id': event.pk, 'user': orga_user.pk}
+    )
+
+    deliver_queued_mails(event_id=event.pk, user=orga_user.pk)
+    assert len(djmail.outbox) == 1
+    assert apply_async.call_count == 2
+    assert apply_async.call_args[1] == {
+        'kwargs': {'event_id': event.pk, 'user': orga_user.pk},
+        'countdown': 60,
+    }
+    periodic_task.send(None)
+    assert apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+def test_deliver_queued_mails_retries_with_backoff(monkeypatch, event):
+    monkeypatch.setattr(Event, 'get_mail_backend', lambda self: FailingBackend())
+    failing_mail = QueuedMail.objects.create(
+        event=event, to='fail@example.org', subject='Hi', text='Hello'
+    )
+    queue_mails(event.queued_mails.all())
+    failing_mail.refresh_from_db()
+    assert failing_mail.attempts == 1
+    assert failing_mail.next_attempt > now() + dt.timedelta(seconds=50)
+
+    deliver_queued_mails(event_id=event.pk)
+    failing_mail.refresh_from_db()
+    assert failing_mail.attempts == 1
+
+    for attempt in range(2, MAIL_MAX_ATTEMPTS + 1):
+        QueuedMail.objects.update(next_attempt=now())
+        deliver_queued_mails(event_id=event.pk)
+        failing_mail.refresh_from_db()
+        assert failing_mail.attempts == attempt
+    assert not failing_mail.next_attempt
+    assert not failing_mail.sent
+    assert failing_mail.logged_actions().count() == MAIL_MAX_ATTEMPTS
+
+
+@pytest.mark.django_db
+def test_periodic_task_resumes_interrupted_delivery(event, mail, other_mail):
+    mail.next_attempt = now() - dt.timedelta(minutes=1)  # An expired lease
+    mail.save()
+    periodic_task.send(None)
+    mail.refresh_from_db()
+    other_mail.refresh_from_db()
+    assert mail.sent
+    assert not other_mail.sent
+
+
+MAIL_TEXT = '''Hello **you**,
+
+see [this](https://example.org) or https://pretalx.com
+
+- a list
+- with [links](https://example.com)
+
+> quote <script>alert()</script>
+'''
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'text', (MAIL_TEXT, '<div>\n<script>alert(1)</script>\n</div>', 'a & b <i>c</i>')
+)
+def test_mail_make_html_matches_inlined_template(event, text):
+    event.primary_color = '#123456'
+    body = bleach.linkify(bleach.clean(markdown.markdown(text), tags=MAIL_BODY_TAGS))
+    expected = inline_css(
+        get_template('mail/mailwrapper.html').render(
+            {'body': body, 'event': event, 'color': event.primary_color}
+        )
+    )
+    html = QueuedMail.make_html(text, event=event)
+    assert 'color: #123456' in html
+    assert '<script>' not in html
+    # inline_css pretty-prints the mail body, which only changes whitespace
+    assert ''.join(html.split()) == ''.join(expected.split())
+
+
+@pytest.mark.django_db
+def test_mail_wrapper_is_cached(monkeypatch, event, locmem_cache):
+    calls = []
+
+    def counting_inline_css(html):
+        calls.append(html)
+        return inline_css(html)
+
+    monkeypatch.setattr('pretalx.mail.models.inline_css', counting_inline_css)
+    QueuedMail.make_html(MAIL_TEXT, event=event)
+    assert len(calls) == 2
+    QueuedMail.make_html('Another text', event=event)
+    assert len(calls) == 2
+    event.name = 'Another event'
+    QueuedMail.make_html(MAIL_TEXT, event=event)
+    assert len(calls) == 4
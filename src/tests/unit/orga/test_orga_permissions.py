@@ -29,3 +29,9 @@ def test_create_organiser_administrator(administrator):
 def test_permissions_change_teams_doesnt_crash_on_unexpected_values():
     assert can_change_teams(None, None) is False
     assert can_change_teams(AnonymousUser, None) is False
+
+
+@pytest.mark.django_db
+def test_permissions_change_teams_of_organiser(orga_user, administrator, organiser):
+    assert can_change_teams(orga_user, organiser) is True
+    assert can_change_teams(administrator, organiser) is False
@@ -1,5 +1,6 @@
 import pytest
 
+from pretalx.event.models import Team
 from pretalx.person.models.user import User
 from pretalx.submission.models.question import Answer
 
@@ -73,3 +74,44 @@ def test_organizer_permissions(event, orga_user):
         'can_change_submissions',
     }
     assert orga_user.get_permissions_for_event(event) == permission_set
+
+
+@pytest.mark.django_db
+def test_limited_team_permissions(event, other_event):
+    user = User.objects.create_user(password='reviewpassw0rd', email='r@orga.org')
+    team = Team.objects.create(
+        name='Reviewers', organiser=event.organiser, is_reviewer=True
+    )
+    team.limit_events.add(event)
+    team.members.add(user)
+    other_event.organiser = event.organiser
+    other_event.save()
+
+    assert user.get_permissions_for_event(event) == {'is_reviewer'}
+    assert user.get_permissions_for_event(other_event) == set()
+    assert user.get_permissions_for_organiser(event.organiser) == {'is_reviewer'}
+    assert list(user.get_events_with_any_permission()) == [event]
+    assert list(user.get_events_for_permission(is_reviewer=True)) == [event]
+    assert list(user.get_events_for_permission(can_change_submissions=True)) == []
+    assert user.has_perm('orga.view_reviews', event)
+    assert not user.has_perm('orga.view_reviews', other_event)
+
+
+@pytest.mark.django_db
+def test_permission_map_is_cached(
+    event, orga_user, django_assert_num_queries, locmem_cache
+):
+    orga_user = User.objects.get(pk=orga_user.pk)
+    assert orga_user.has_perm('orga.change_settings', event)
+    with django_assert_num_queries(0):
+        assert orga_user.has_perm('orga.change_settings', event)
+        assert orga_user.has_perm('orga.view_submissions', event)
+        assert not orga_user.has_perm('orga.view_reviews', event)
+    with django_assert_num_queries(0):  # Other requests use the cache
+        assert User(pk=orga_user.pk).get_permissions_for_event(event)
+
+    team = event.organiser.teams.filter(is_reviewer=True).first()
+    team.members.add(orga_user)
+    assert orga_user.has_perm('orga.view_reviews', event)
+    team.members.remove(orga_user)
+    assert not orga_user.has_perm('orga.view_reviews', event)
@@ -261,10 +261,10 @@ def test_union(avails, expected):
                 Availability(start=datetime.datetime(2017, 1, 1, 0), end=datetime.datetime(2017, 1, 1, 3)),
                 Availability(start=datetime.datetime(2017, 1, 1, 6), end=datetime.datetime(2017, 1, 1, 8)),
             ],
-            [Availability(start=datetime.datetime(2017, 1, 1, 9), end=datetime.datetime(2017, 1, 1, 7))],
+            [Availability(start=datetime.datetime(2017, 1, 1, 5), end=datetime.datetime(2017, 1, 1, 9))],
         ],
         [
-            Availability(start=datetime.datetime(2017, 1, 1, 9), end=datetime.datetime(2017, 1, 1, 7)),
+            Availability(start=datetime.datetime(2017, 1, 1, 6), end=datetime.datetime(2017, 1, 1, 7)),
         ],
     ),
     (
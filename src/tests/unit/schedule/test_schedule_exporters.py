@@ -0,0 +1,70 @@
+import datetime as dt
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pretalx.person.models import SpeakerProfile, User
+from pretalx.schedule.exporters import FrabJsonExporter
+from pretalx.schedule.models import TalkSlot
+from pretalx.submission.models import Answer, Submission, SubmissionStates
+
+
+def add_talks(event, room, question, start, count):
+    for index in range(start, start + count):
+        speaker = User.objects.create_user(
+            email=f'speaker{index}@example.org',
+            password='speakerpwd1!',
+            name=f'Speaker {index}',
+        )
+        SpeakerProfile.objects.create(user=speaker, event=event, biography='Bio')
+        submission = Submission.objects.create(
+            title=f'Talk {index}',
+            event=event,
+            submission_type=event.cfp.default_type,
+            state=SubmissionStates.CONFIRMED,
+        )
+        submission.speakers.add(speaker)
+        answer = Answer.objects.create(person=speaker, question=question, answer='')
+        answer.options.set(question.options.all()[:1])
+        Answer.objects.create(submission=submission, question=question, answer='green')
+        slot_start = event.datetime_from + dt.timedelta(hours=10, minutes=index)
+        TalkSlot.objects.create(
+            submission=submission,
+            schedule=event.wip_schedule,
+            room=room,
+            start=slot_start,
+            end=slot_start + dt.timedelta(minutes=30),
+            is_visible=True,
+        )
+
+
+def render_export(event, version):
+    exporter = FrabJsonExporter(event, schedule=event.schedules.get(version=version))
+    exporter.is_orga = True
+    with CaptureQueriesContext(connection) as context:
+        content = json.loads(exporter.render()[2])
+    return len(context.captured_queries), content
+
+
+@pytest.mark.django_db
+def test_frab_json_export_query_count_is_constant(event, room, choice_question):
+    add_talks(event, room, choice_question, start=0, count=1)
+    event.release_schedule('v1')
+    render_export(event, 'v1')  # Warm up the event and global settings
+    few_queries, content = render_export(event, 'v1')
+    talks = content['schedule']['conference']['days'][0]['rooms'][str(room.name)]
+    assert len(talks) == 1
+
+    add_talks(event, room, choice_question, start=1, count=10)
+    event.release_schedule('v2')
+    many_queries, content = render_export(event, 'v2')
+    talks = content['schedule']['conference']['days'][0]['rooms'][str(room.name)]
+    assert len(talks) == 11
+    assert many_queries == few_queries
+
+    talk = talks[0]
+    assert talk['persons'][0]['biography'] == 'Bio'
+    assert talk['persons'][0]['answers'][0]['options'] == ['very']
+    assert talk['answers'][0]['answer'] == 'green'
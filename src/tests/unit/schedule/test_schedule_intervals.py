@@ -0,0 +1,40 @@
+import pytest
+
+from pretalx.schedule import intervals
+
+
+@pytest.mark.parametrize('ranges,expected', (
+    ([], []),
+    ([(1, 2)], [(1, 2)]),
+    ([(4, 5), (1, 2)], [(1, 2), (4, 5)]),
+    ([(1, 2), (2, 3)], [(1, 3)]),
+    ([(3, 6), (1, 4)], [(1, 6)]),
+    ([(1, 10), (2, 3), (4, 5)], [(1, 10)]),
+))
+def test_union(ranges, expected):
+    assert intervals.union(ranges) == expected
+
+
+@pytest.mark.parametrize('sets,expected', (
+    ([], []),
+    ([[(1, 3)], []], []),
+    ([[(1, 3)], [(3, 5)]], []),
+    ([[(1, 4)], [(2, 6)]], [(2, 4)]),
+    ([[(0, 10)], [(1, 2), (4, 5)], [(0, 4), (4, 8)]], [(1, 2), (4, 5)]),
+    ([[(1, 5), (7, 9)], [(0, 2), (4, 8)]], [(1, 2), (4, 5), (7, 8)]),
+))
+def test_intersection(sets, expected):
+    assert intervals.intersection(*sets) == expected
+    assert intervals.intersection(*reversed(sets)) == expected
+
+
+@pytest.mark.parametrize('start,end,expected', (
+    (1, 2, True),
+    (0, 2, False),
+    (1, 3, True),
+    (2, 4, False),
+    (5, 6, True),
+    (9, 10, False),
+))
+def test_contains(start, end, expected):
+    assert intervals.contains([(1, 3), (5, 8)], start, end) is expected
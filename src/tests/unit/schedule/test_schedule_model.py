@@ -1,3 +1,5 @@
+import datetime as dt
+
 import pytest
 from django.core import mail as djmail
 from django.utils.timezone import now
@@ -24,6 +26,20 @@ def test_copy_to_schedule(slot):
     assert new_slot.schedule == new_schedule
 
 
+@pytest.mark.django_db
+def test_copy_queryset_to_schedule(slot, django_assert_num_queries):
+    new_schedule = Schedule.objects.create(event=slot.submission.event, version='Version')
+    with django_assert_num_queries(1):
+        TalkSlot.objects.filter(pk=slot.pk).copy_to_schedule(new_schedule)
+    new_slot = new_schedule.talks.get()
+    assert new_slot.pk != slot.pk
+    assert new_slot.submission == slot.submission
+    assert new_slot.room == slot.room
+    assert new_slot.start == slot.start
+    assert new_slot.end == slot.end
+    assert new_slot.is_visible == slot.is_visible
+
+
 @pytest.mark.django_db
 def test_freeze(slot):
     slot_count = TalkSlot.objects.count()
@@ -143,7 +159,7 @@ def test_is_archived(event):
     assert not unreleased_schedule.is_archived
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True)
 def test_schedule_changes(event, slot, room):
     djmail.outbox = []
     QueuedMail.objects.filter(sent__isnull=True).update(sent=now())
@@ -169,3 +185,54 @@ def test_schedule_changes(event, slot, room):
     }
     assert len(djmail.outbox) == 0
     assert QueuedMail.objects.filter(sent__isnull=True).count() == slot.submission.speakers.count()
+
+
+@pytest.mark.django_db
+def test_schedule_changes_are_stored(event, slot, other_room, django_assert_num_queries):
+    current_slot = slot.submission.slots.get(schedule=event.wip_schedule)
+    current_slot.room = other_room
+    current_slot.start = slot.start + dt.timedelta(hours=1)
+    current_slot.end = slot.end + dt.timedelta(hours=1)
+    current_slot.save()
+    released, _ = event.wip_schedule.freeze('test', notify_speakers=False)
+    assert released.change_set
+
+    schedule = Schedule.objects.select_related('event').get(pk=released.pk)
+    with django_assert_num_queries(2):
+        changes = schedule.changes
+    assert changes['count'] == 1
+    assert changes['new_talks'] == changes['canceled_talks'] == []
+    moved = changes['moved_talks'][0]
+    assert moved['submission'] == slot.submission
+    assert moved['old_start'] == slot.start
+    assert moved['new_start'] == current_slot.start
+    assert moved['old_room'] == slot.room.name
+    assert moved['new_room'] == other_room.name
+    assert changes == released.changes
+
+
+@pytest.mark.django_db
+def test_schedule_changes_are_filled_in(event, slot):
+    schedule = event.wip_schedule.freeze('test', notify_speakers=False)[0]
+    Schedule.objects.filter(pk=schedule.pk).update(change_set=None)
+    schedule = Schedule.objects.get(pk=schedule.pk)
+    assert schedule.changes['count'] == 0
+    schedule.refresh_from_db()
+    assert schedule.change_set
+
+
+@pytest.mark.django_db
+def test_notify_speakers_in_batches(event, slot):
+    QueuedMail.objects.filter(sent__isnull=True).update(sent=now())
+    current_slot = slot.submission.slots.get(schedule=event.wip_schedule)
+    current_slot.start += dt.timedelta(hours=1)
+    current_slot.end += dt.timedelta(hours=1)
+    current_slot.save()
+    schedule = event.wip_schedule.freeze('test', notify_speakers=False)[0]
+    assert QueuedMail.objects.filter(sent__isnull=True).count() == 0
+
+    progress = []
+    schedule.notify_speakers(batch_size=1, progress=progress.append)
+    speaker_count = slot.submission.speakers.count()
+    assert progress == list(range(1, speaker_count + 1))
+    assert QueuedMail.objects.filter(sent__isnull=True).count() == speaker_count
@@ -1,9 +1,13 @@
 from datetime import timedelta
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import now
 
-from pretalx.schedule.models import TalkSlot
+from pretalx.person.models import User
+from pretalx.schedule.models import Availability, TalkSlot
+from pretalx.submission.models import Submission
 
 
 @pytest.mark.django_db
@@ -32,3 +36,70 @@ def test_slot_duration(submission, start, end, duration):
 def test_slot_string(slot, room):
     str(slot)
     str(room)
+
+
+@pytest.mark.django_db
+def test_slot_warnings(slot, room, speaker, other_confirmed_submission):
+    slot = slot.event.wip_schedule.talks.get(submission=slot.submission)
+    assert [warning['type'] for warning in slot.warnings] == ['room']
+
+    Availability.objects.create(
+        event=slot.event, room=room,
+        start=slot.start - timedelta(hours=1), end=slot.start + timedelta(minutes=30),
+    )
+    Availability.objects.create(
+        event=slot.event, room=room,
+        start=slot.start + timedelta(minutes=30), end=slot.end,
+    )
+    Availability.objects.create(
+        event=slot.event, person=speaker.event_profile(slot.event),
+        start=slot.end, end=slot.end + timedelta(hours=1),
+    )
+    other_confirmed_submission.speakers.add(speaker)
+    other_confirmed_submission.slots.filter(schedule=slot.schedule).update(
+        room=room, start=slot.start, end=slot.end,
+    )
+    warnings = slot.schedule.get_talk_warnings()
+    assert [warning['type'] for warning in warnings[slot.pk]] == ['speaker', 'speaker_booked']
+    assert warnings[slot.pk][0]['speaker']['id'] == speaker.pk
+
+
+def _count_warning_queries(schedule):
+    with CaptureQueriesContext(connection) as context:
+        warnings = schedule.get_talk_warnings()
+    assert len(warnings) == schedule.talks.count()
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_slot_warnings_query_count(slot, room, submission_data):
+    schedule = slot.event.wip_schedule
+    single_count = _count_warning_queries(schedule)
+    assert single_count == 5
+
+    for index in range(5):
+        submission = Submission.objects.create(**submission_data)
+        submission.speakers.add(
+            User.objects.create_user(
+                email=f'speaker{index}@example.org', password='speakerpwd1!'
+            )
+        )
+        submission.accept()
+    schedule.talks.update(start=slot.start, end=slot.end, room=room)
+    assert _count_warning_queries(schedule) == single_count
+
+
+@pytest.mark.django_db
+def test_slot_save_bumps_only_wip_revision(slot, django_assert_num_queries):
+    released_revision = slot.schedule.revision
+    with django_assert_num_queries(1):
+        slot.save()
+    slot.schedule.refresh_from_db()
+    assert slot.schedule.revision == released_revision
+
+    wip_slot = slot.event.wip_schedule.talks.get(submission=slot.submission)
+    wip_revision = wip_slot.schedule.revision
+    wip_slot.save()
+    wip_slot.schedule.refresh_from_db()
+    assert wip_slot.schedule.revision == wip_revision + 1
+    assert wip_slot.revision == wip_revision + 1
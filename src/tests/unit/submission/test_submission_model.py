@@ -1,7 +1,13 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from pretalx.submission.models import Answer, SubmissionError, SubmissionStates
+from pretalx.schedule.models import TalkSlot
+from pretalx.submission.models import (
+    Answer, Submission, SubmissionError, SubmissionStates,
+)
 from pretalx.submission.models.submission import submission_image_path
+from pretalx.submission.signals import submission_state_change_bulk
 
 
 @pytest.mark.parametrize(
@@ -99,6 +105,91 @@ def test_reject_fail(submission, state, force):
         assert submission.event.wip_schedule.talks.count() == 0
 
 
+@pytest.mark.django_db
+def test_bulk_accept(monkeypatch, event, submission, other_submission, orga_user):
+    other_submission.state = SubmissionStates.CONFIRMED
+    other_submission.save()
+    TalkSlot.objects.create(
+        submission=submission, schedule=event.wip_schedule, is_visible=False
+    )
+    received = []
+    monkeypatch.setattr(
+        submission_state_change_bulk,
+        'send_robust',
+        lambda sender, **kwargs: received.append(kwargs),
+    )
+
+    changed = Submission.bulk_set_state(
+        event, event.submissions.all(), SubmissionStates.ACCEPTED, person=orga_user
+    )
+
+    assert changed == [submission, other_submission]
+    for sub in changed:
+        sub.refresh_from_db()
+        assert sub.state == SubmissionStates.ACCEPTED
+        assert sub.logged_actions().get().action_type == 'pretalx.submission.accept'
+        assert sub.slots.get(schedule=event.wip_schedule).is_visible
+    assert len(received) == 1
+    assert received[0]['old_states'] == {
+        submission.pk: SubmissionStates.SUBMITTED,
+        other_submission.pk: SubmissionStates.CONFIRMED,
+    }
+    mail = event.queued_mails.get()  # Confirmed speakers don't get a mail
+    assert mail.to == submission.speakers.get().email
+    assert submission.title in mail.text
+
+
+@pytest.mark.django_db
+def test_bulk_reject(event, submission, other_submission, orga_user):
+    submission.accept()
+    event.queued_mails.all().delete()
+    other_submission.state = SubmissionStates.WITHDRAWN
+    other_submission.save()
+
+    changed = Submission.bulk_set_state(
+        event,
+        [submission, other_submission],
+        SubmissionStates.REJECTED,
+        person=orga_user,
+    )
+
+    assert changed == [submission]
+    submission.refresh_from_db()
+    other_submission.refresh_from_db()
+    assert submission.state == SubmissionStates.REJECTED
+    assert other_submission.state == SubmissionStates.WITHDRAWN
+    assert event.wip_schedule.talks.count() == 0
+    assert event.queued_mails.get().to == submission.speakers.get().email
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'new_state', (SubmissionStates.ACCEPTED, SubmissionStates.REJECTED)
+)
+def test_bulk_set_state_takes_constant_queries(
+    event, submission_data, speaker, new_state
+):
+    def count_queries(count):
+        submissions = []
+        for _ in range(count):
+            submission = Submission.objects.create(**submission_data)
+            submission.speakers.add(speaker)
+            submissions.append(submission)
+        with CaptureQueriesContext(connection) as context:
+            changed = Submission.bulk_set_state(event, submissions, new_state)
+        assert len(changed) == count
+        return len(context.captured_queries)
+
+    count_queries(1)  # Warm up the content type and settings caches
+    assert count_queries(3) == count_queries(6)
+
+
+@pytest.mark.django_db
+def test_bulk_set_state_rejects_other_states(event, submission):
+    with pytest.raises(ValueError):
+        Submission.bulk_set_state(event, [submission], SubmissionStates.CONFIRMED)
+
+
 @pytest.mark.parametrize(
     'state', (SubmissionStates.ACCEPTED, SubmissionStates.CONFIRMED)
 )